@@ -1,3 +1,4 @@
+import codecs
 import hashlib
 from dataclasses import dataclass
 from typing import List, Optional
@@ -60,6 +61,35 @@ class FileHash(dbtClassMixin):
         checksum = hashlib.new(name, data).hexdigest()
         return cls(name=name, checksum=checksum)
 
+    @classmethod
+    def from_file(cls, path: str, name="sha256", chunk_size: int = 64 * 1024) -> "FileHash":
+        """Create a file hash by streaming the file at the given path in
+        chunks of at most chunk_size bytes. The result is identical to calling
+        from_contents on the stripped utf-8 contents of the file, without
+        holding the whole file in memory.
+        """
+        hasher = hashlib.new(name)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        started = False
+        # trailing whitespace is held back until we know it is not at the end of the file
+        pending = ""
+        with open(path, "rb") as fp:
+            while True:
+                data = fp.read(chunk_size)
+                text = decoder.decode(data, final=not data)
+                if not started:
+                    text = text.lstrip()
+                    started = bool(text)
+                stripped = text.rstrip()
+                if stripped:
+                    hasher.update(pending.encode("utf-8"))
+                    hasher.update(stripped.encode("utf-8"))
+                    pending = ""
+                pending += text[len(stripped) :]
+                if not data:
+                    break
+        return cls(name=name, checksum=hasher.hexdigest())
+
 
 @dataclass
 class Docs(dbtClassMixin):
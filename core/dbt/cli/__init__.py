@@ -1 +1,7 @@
+import time
+
+# When the CLI started being imported, which the startup time in the
+# ResourceReport is measured from
+STARTED_AT = time.perf_counter()
+
 from .main import cli as dbt_cli  # noqa
@@ -1,11 +1,14 @@
-from typing import IO, List, Optional, Union
+from typing import IO, TYPE_CHECKING, List, Optional, Union
 
 from click.exceptions import ClickException
 
-from dbt.artifacts.schemas.catalog import CatalogArtifact
-from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.results import RunExecutionResult
-from dbt.utils import ExitCodes
+# These are only imported for type checking, to keep them (and everything they
+# import) out of the CLI's startup time
+if TYPE_CHECKING:
+    from dbt.artifacts.schemas.catalog import CatalogArtifact
+    from dbt.contracts.graph.manifest import Manifest
+    from dbt.contracts.results import RunExecutionResult
+    from dbt.utils import ExitCodes
 
 
 class DbtUsageException(Exception):
@@ -21,7 +24,7 @@ class CliException(ClickException):
     The exit_code attribute is used by click to determine which exit code to produce
     after an invocation."""
 
-    def __init__(self, exit_code: ExitCodes) -> None:
+    def __init__(self, exit_code: "ExitCodes") -> None:
         self.exit_code = exit_code.value
 
     # the typing of _file is to satisfy the signature of ClickException.show
@@ -38,13 +41,15 @@ class ResultExit(CliException):
         self,
         result: Union[
             bool,  # debug
-            CatalogArtifact,  # docs generate
+            "CatalogArtifact",  # docs generate
             List[str],  # list/ls
-            Manifest,  # parse
+            "Manifest",  # parse
             None,  # clean, deps, init, source
-            RunExecutionResult,  # build, compile, run, seed, snapshot, test, run-operation
+            "RunExecutionResult",  # build, compile, run, seed, snapshot, test, run-operation
         ] = None,
     ) -> None:
+        from dbt.utils import ExitCodes
+
         super().__init__(ExitCodes.ModelError)
         self.result = result
 
@@ -53,5 +58,7 @@ class ExceptionExit(CliException):
     """This class wraps any exception that does not contain results thrown while invoking dbt."""
 
     def __init__(self, exception: Exception) -> None:
+        from dbt.utils import ExitCodes
+
         super().__init__(ExitCodes.UnhandledError)
         self.exception = exception
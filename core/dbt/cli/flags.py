@@ -39,6 +39,8 @@ FLAGS_DEFAULTS = {
     "STORE_FAILURES": False,
     "INTROSPECT": True,
     "STATE_MODIFIED_COMPARE_VARS": False,
+    # Set by dbtSession, which keeps the adapter between invocations
+    "REUSE_ADAPTER": False,
 }
 
 DEPRECATED_PARAMS = {
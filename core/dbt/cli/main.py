@@ -1,23 +1,42 @@
 import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
 from copy import copy
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import click
 from click.exceptions import BadOptionUsage
 from click.exceptions import Exit as ClickExit
 from click.exceptions import NoSuchOption, UsageError
 
-from dbt.adapters.factory import register_adapter
-from dbt.artifacts.schemas.catalog import CatalogArtifact
-from dbt.artifacts.schemas.run import RunExecutionResult
 from dbt.cli import params as p
 from dbt.cli import requires
 from dbt.cli.exceptions import DbtInternalException, DbtUsageException
-from dbt.cli.requires import setup_manifest
-from dbt.contracts.graph.manifest import Manifest
-from dbt.mp_context import get_mp_context
-from dbt_common.events.base_types import EventMsg
+
+# Tasks, adapters and the modules they depend on are imported by the commands
+# that need them, so that starting the CLI only imports what the command runs
+if TYPE_CHECKING:
+    from dbt.artifacts.schemas.catalog import CatalogArtifact
+    from dbt.artifacts.schemas.run import RunExecutionResult
+    from dbt.cli.flags import Flags
+    from dbt.config.profile import Profile
+    from dbt.config.project import Project
+    from dbt.contracts.graph.manifest import Manifest
+    from dbt_common.events.base_types import EventMsg
 
 
 @dataclass
@@ -29,11 +48,11 @@ class dbtRunnerResult:
     exception: Optional[BaseException] = None
     result: Union[
         bool,  # debug
-        CatalogArtifact,  # docs generate
+        "CatalogArtifact",  # docs generate
         List[str],  # list/ls
-        Manifest,  # parse
+        "Manifest",  # parse
         None,  # clean, deps, init, source
-        RunExecutionResult,  # build, compile, run, seed, snapshot, test, run-operation
+        "RunExecutionResult",  # build, compile, run, seed, snapshot, test, run-operation
     ] = None
 
 
@@ -41,8 +60,8 @@ class dbtRunnerResult:
 class dbtRunner:
     def __init__(
         self,
-        manifest: Optional[Manifest] = None,
-        callbacks: Optional[List[Callable[[EventMsg], None]]] = None,
+        manifest: Optional["Manifest"] = None,
+        callbacks: Optional[List[Callable[["EventMsg"], None]]] = None,
     ) -> None:
         self.manifest = manifest
 
@@ -51,12 +70,10 @@ class dbtRunner:
         self.callbacks = callbacks
 
     def invoke(self, args: List[str], **kwargs) -> dbtRunnerResult:
+        started_at = time.perf_counter()
         try:
             dbt_ctx = cli.make_context(cli.name, args.copy())
-            dbt_ctx.obj = {
-                "manifest": self.manifest,
-                "callbacks": self.callbacks,
-            }
+            dbt_ctx.obj = {**self._context_obj(), "started_at": started_at}
 
             for key, value in kwargs.items():
                 dbt_ctx.params[key] = value
@@ -96,9 +113,160 @@ class dbtRunner:
                 success=False,
             )
 
+    def _context_obj(self) -> Dict[str, Any]:
+        return {
+            "manifest": self.manifest,
+            "callbacks": self.callbacks,
+        }
+
+
+class dbtSession(dbtRunner):
+    """A dbtRunner for running many commands against one project, which
+    keeps what it loads between invocations instead of loading it again for
+    each one: the profile and project, the manifest, and the adapter with
+    its relation cache and the connections it keeps open.
+
+    Everything is reloaded when a flag or file the profile or project is
+    loaded from changes, or the environment does. The manifest is kept until
+    then, or until `parse`, `deps` or `clean` is invoked, so call
+    `invalidate()` after changing the project's other files. Relations are
+    only listed the first time their schema is needed, so the session should
+    be the only thing changing the relations in those schemas. Call `close()`
+    when done to close the adapter's connections.
+    """
+
+    def __init__(
+        self,
+        manifest: Optional["Manifest"] = None,
+        callbacks: Optional[List[Callable[["EventMsg"], None]]] = None,
+    ) -> None:
+        super().__init__(manifest, callbacks)
+        # whether the adapter is registered and set up with self.manifest
+        self.adapter_ready = False
+        self._profile: Optional["Profile"] = None
+        self._profile_key: Optional[Tuple] = None
+        self._project: Optional["Project"] = None
+        self._project_key: Optional[Tuple] = None
+
+    def invoke(self, args: List[str], **kwargs) -> dbtRunnerResult:
+        return super().invoke(args, reuse_adapter=True, **kwargs)
+
+    def invalidate(self) -> None:
+        """Drop everything kept from earlier invocations."""
+        self._profile = self._profile_key = None
+        self._project = self._project_key = None
+        self._reset_adapter(drop_manifest=True)
+
+    def close(self) -> None:
+        self.invalidate()
+
+    def _context_obj(self) -> Dict[str, Any]:
+        return {**super()._context_obj(), "session": self}
+
+    def _reset_adapter(self, drop_manifest: bool) -> None:
+        from dbt.adapters.factory import reset_adapters
+
+        reset_adapters()
+        self.adapter_ready = False
+        if drop_manifest:
+            self.manifest = None
+
+    def _state_key(self, flags: "Flags", *file_names: str) -> Tuple:
+        files = []
+        for path in file_names:
+            try:
+                stat = os.stat(path)
+                files.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                files.append((path, None, None))
+        return (
+            str(flags.PROJECT_DIR),
+            json.dumps(getattr(flags, "VARS", {}), sort_keys=True, default=str),
+            tuple(files),
+            hash(frozenset(os.environ.items())),
+        )
+
+    def get_profile(self, flags: "Flags", load: Callable[[], "Profile"]) -> "Profile":
+        profiles_dir = str(getattr(flags, "PROFILES_DIR", ""))
+        key = self._state_key(flags, os.path.join(profiles_dir, "profiles.yml")) + (
+            profiles_dir,
+            flags.PROFILE,
+            flags.TARGET,
+            getattr(flags, "THREADS", None),
+        )
+        if key != self._profile_key:
+            if self._profile_key is not None:
+                self.invalidate()
+            self._profile = load()
+            self._profile_key = key
+        return self._profile
+
+    def get_project(
+        self, flags: "Flags", profile: "Profile", load: Callable[[], "Project"]
+    ) -> "Project":
+        from dbt.constants import (
+            CATALOGS_FILE_NAME,
+            DBT_PROJECT_FILE_NAME,
+            DEPENDENCIES_FILE_NAME,
+            PACKAGE_LOCK_FILE_NAME,
+            PACKAGES_FILE_NAME,
+        )
+
+        # projects loaded without the session's profile, e.g. by deps, are
+        # rendered differently and aren't kept
+        if profile is not self._profile:
+            return load()
+        key = self._state_key(
+            flags,
+            *(
+                os.path.join(flags.PROJECT_DIR, file_name)
+                for file_name in (
+                    DBT_PROJECT_FILE_NAME,
+                    PACKAGES_FILE_NAME,
+                    DEPENDENCIES_FILE_NAME,
+                    PACKAGE_LOCK_FILE_NAME,
+                    CATALOGS_FILE_NAME,
+                )
+            ),
+        ) + (flags.VERSION_CHECK,)
+        if key != self._project_key:
+            # the first invocation starts with the manifest the session was created with
+            self._reset_adapter(drop_manifest=self._project_key is not None)
+            self._project = load()
+            self._project_key = key
+        return self._project
+
+    @contextmanager
+    def invocation(self, flags: "Flags") -> Generator[None, None, None]:
+        """Replaces adapter_management for invocations in the session."""
+        # parse reparses the project, and deps and clean change its packages
+        if flags.WHICH in ("parse", "deps", "clean"):
+            self._reset_adapter(drop_manifest=True)
+        try:
+            yield
+        finally:
+            self._close_finished_thread_connections()
+
+    def _close_finished_thread_connections(self) -> None:
+        """Connections are kept per thread, and the worker threads of an
+        invocation don't outlive it, so close the connections they opened.
+        """
+        from dbt.adapters.factory import FACTORY
+
+        running = {thread.ident for thread in threading.enumerate()}
+        for adapter in FACTORY.adapters.values():
+            connections = adapter.connections
+            with connections.lock:
+                for key, connection in tuple(connections.thread_connections.items()):
+                    # keys are (pid, thread ident)
+                    if key[-1] not in running:
+                        connections.close(connection)
+                        del connections.thread_connections[key]
+
 
 # approach from https://github.com/pallets/click/issues/108#issuecomment-280489786
 def global_flags(func):
+    @p.adaptive_threads
     @p.cache_selected_only
     @p.debug
     @p.defer
@@ -110,6 +278,7 @@ def global_flags(func):
     @p.fail_fast
     @p.favor_state
     @p.indirect_selection
+    @p.log_async
     @p.log_cache_events
     @p.log_file_max_bytes
     @p.log_format
@@ -117,6 +286,8 @@ def global_flags(func):
     @p.log_level
     @p.log_level_file
     @p.log_path
+    @p.log_queue_full
+    @p.log_queue_size
     @p.macro_debugging
     @p.partial_parse
     @p.partial_parse_file_path
@@ -126,7 +297,11 @@ def global_flags(func):
     @p.printer_width
     @p.profile
     @p.quiet
+    @p.record_parse_timing
     @p.record_timing_info
+    @p.record_timing_mode
+    @p.schema_cache_ttl
+    @p.selection_cache
     @p.send_anonymous_usage_stats
     @p.single_threaded
     @p.show_all_deprecations
@@ -247,12 +422,15 @@ def docs(ctx, **kwargs):
 @click.pass_context
 @global_flags
 @p.compile_docs
+@p.compress_static
 @p.exclude
 @p.profiles_dir
 @p.project_dir
 @p.select
 @p.selector
 @p.empty_catalog
+@p.incremental_catalog
+@p.process_pool
 @p.static
 @p.target_path
 @p.threads
@@ -323,6 +501,7 @@ def docs_serve(ctx, **kwargs):
 @p.selector
 @p.inline
 @p.compile_inject_ephemeral_ctes
+@p.process_pool
 @p.target_path
 @p.threads
 @p.vars
@@ -374,6 +553,9 @@ def compile(ctx, **kwargs):
 def show(ctx, **kwargs):
     """Generates executable SQL for a named resource or inline query, runs that SQL, and returns a preview of the
     results. Does not materialize anything to the warehouse."""
+    from dbt.adapters.factory import register_adapter
+    from dbt.cli.requires import setup_manifest
+    from dbt.mp_context import get_mp_context
     from dbt.task.show import ShowTask, ShowTaskDirect
 
     if ctx.obj["flags"].inline_direct:
@@ -430,6 +612,7 @@ def debug(ctx, **kwargs):
 @p.vars
 @p.source
 @p.lock
+@p.package_store
 @p.upgrade
 @p.add_package
 @requires.postflight
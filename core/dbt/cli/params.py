@@ -11,7 +11,6 @@ from dbt.cli.option_types import (
 )
 from dbt.cli.options import MultiOption
 from dbt.cli.resolvers import default_profiles_dir, default_project_dir
-from dbt.version import get_version_information
 
 # --- shared option specs --- #
 model_decls = ("-m", "--models", "--model")
@@ -25,6 +24,13 @@ select_attrs = {
 }
 
 # --- The actual option definitions --- #
+adaptive_threads = click.option(
+    "--adaptive-threads/--no-adaptive-threads",
+    envvar="DBT_ADAPTIVE_THREADS",
+    help="Adjust how many nodes run concurrently, between 1 and the configured threads, based on how many nodes are ready to run and on observed node latency.",
+    default=False,
+)
+
 add_package = click.option(
     "--add-package",
     help="Add a package to current package spec, specify it as package-name@version. Change the source with --source flag.",
@@ -73,6 +79,14 @@ compile_inject_ephemeral_ctes = click.option(
     default=True,
 )
 
+compress_static = click.option(
+    "--compress-static",
+    envvar=None,
+    help="With --static, inline manifest.json and catalog.json in static_index.html gzip compressed. The browser decompresses them when the page is opened.",
+    default=False,
+    is_flag=True,
+)
+
 config_dir = click.option(
     "--config-dir",
     envvar=None,
@@ -263,6 +277,14 @@ host = click.option(
     default="127.0.0.1",
 )
 
+incremental_catalog = click.option(
+    "--incremental-catalog",
+    envvar="DBT_INCREMENTAL_CATALOG",
+    help="If specified, update the selected nodes and sources in the existing catalog.json during the `dbt docs generate` command, instead of writing it from scratch.",
+    default=False,
+    is_flag=True,
+)
+
 indirect_selection = click.option(
     "--indirect-selection",
     envvar="DBT_INDIRECT_SELECTION",
@@ -298,6 +320,13 @@ lock = click.option(
     is_flag=True,
 )
 
+log_async = click.option(
+    "--log-async/--no-log-async",
+    envvar="DBT_LOG_ASYNC",
+    help="Write logs and run event callbacks on a separate thread, so that nodes don't wait on log I/O. Events are flushed when the command completes.",
+    default=False,
+)
+
 log_cache_events = click.option(
     "--log-cache-events/--no-log-cache-events",
     help="Enable verbose logging for relational cache events to help when debugging.",
@@ -353,6 +382,22 @@ log_path = click.option(
     type=click.Path(resolve_path=True, path_type=Path),
 )
 
+log_queue_full = click.option(
+    "--log-queue-full",
+    envvar="DBT_LOG_QUEUE_FULL",
+    help="With --log-async, whether debug level events wait for space when the event queue is full, or are dropped.",
+    type=click.Choice(["block", "drop"], case_sensitive=False),
+    default="block",
+)
+
+log_queue_size = click.option(
+    "--log-queue-size",
+    envvar="DBT_LOG_QUEUE_SIZE",
+    help="With --log-async, the number of events that can wait to be logged.",
+    default=10000,
+    type=click.IntRange(min=1),
+)
+
 macro_debugging = click.option(
     "--macro-debugging/--no-macro-debugging",
     envvar="DBT_MACRO_DEBUGGING",
@@ -392,6 +437,14 @@ output_path = click.option(
     default=None,
 )
 
+package_store = click.option(
+    "--package-store",
+    envvar="DBT_PACKAGE_STORE",
+    help="Directory in which to keep the contents of installed packages, shared by every project that uses it, so that each package version is only downloaded or cloned once. Packages are hardlinked from it into the project where possible.",
+    type=click.Path(file_okay=False),
+    default=None,
+)
+
 partial_parse = click.option(
     "--partial-parse/--no-partial-parse",
     envvar="DBT_PARTIAL_PARSE",
@@ -430,6 +483,13 @@ populate_cache = click.option(
     default=True,
 )
 
+process_pool = click.option(
+    "--process-pool/--no-process-pool",
+    envvar="DBT_PROCESS_POOL",
+    help="Compile nodes in forked worker processes instead of threads, so that compilation is not limited by the Python GIL. Has no effect where the 'fork' start method is not available, or while other threads are running, e.g. with --log-async or a sampling --record-timing-info.",
+    default=False,
+)
+
 port = click.option(
     "--port",
     envvar=None,
@@ -488,6 +548,13 @@ quiet = click.option(
 
 raw_select = click.option(*select_decls, **select_attrs)  # type: ignore[arg-type]
 
+record_parse_timing = click.option(
+    "--record-parse-timing/--no-record-parse-timing",
+    envvar="DBT_RECORD_PARSE_TIMING",
+    help="If set, record how long each file and macro took to parse, and write the slowest of them to perf_info.json.",
+    default=False,
+)
+
 record_timing_info = click.option(
     "--record-timing-info",
     "-r",
@@ -496,6 +563,14 @@ record_timing_info = click.option(
     type=click.Path(exists=False),
 )
 
+record_timing_mode = click.option(
+    "--record-timing-mode",
+    envvar="DBT_RECORD_TIMING_MODE",
+    help="How --record-timing-info profiles dbt. `cprofile` writes cProfile stats for the main thread. `sample` samples every thread, writes collapsed stacks that flamegraph tools can read, and adds the slowest nodes and macros to perf_info.json.",
+    type=click.Choice(["cprofile", "sample"], case_sensitive=False),
+    default="cprofile",
+)
+
 resource_type = click.option(
     "--resource-types",
     "--resource-type",
@@ -533,12 +608,27 @@ sample = click.option(
     hidden=True,  # TODO: Unhide
 )
 
+schema_cache_ttl = click.option(
+    "--schema-cache-ttl",
+    envvar="DBT_SCHEMA_CACHE_TTL",
+    help="Number of seconds for which the schemas listed in each database are cached in the target directory, so that later invocations can skip listing them. 0 disables the cache.",
+    default=0,
+    type=click.IntRange(min=0),
+)
+
 # `--select` and `--models` are analogous for most commands except `dbt list` for legacy reasons.
 # Most CLI arguments should use the combined `select` option that aliases `--models` to `--select`.
 # However, if you need to split out these separators (like `dbt ls`), use the `models` and `raw_select` options instead.
 # See https://github.com/dbt-labs/dbt-core/pull/6774#issuecomment-1408476095 for more info.
 select = click.option(*select_decls, *model_decls, **select_attrs)  # type: ignore[arg-type]
 
+selection_cache = click.option(
+    "--selection-cache/--no-selection-cache",
+    envvar="DBT_SELECTION_CACHE",
+    help="Reuse the nodes selected by a previous invocation with the same selection, project files and state, by reading and writing a cache in the target directory.",
+    default=True,
+)
+
 selector = click.option(
     "--selector",
     envvar=None,
@@ -723,6 +813,8 @@ vars = click.option(
 def _version_callback(ctx, _param, value):
     if not value or ctx.resilient_parsing:
         return
+    from dbt.version import get_version_information
+
     click.echo(get_version_information())
     ctx.exit()
 
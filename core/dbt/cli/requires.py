@@ -7,56 +7,34 @@ from typing import Optional
 
 from click import Context
 
-import dbt.tracking
-from dbt.adapters.factory import adapter_management, get_adapter, register_adapter
 from dbt.cli.exceptions import ExceptionExit, ResultExit
-from dbt.cli.flags import Flags
-from dbt.config import RuntimeConfig
-from dbt.config.catalogs import get_active_write_integration, load_catalogs
-from dbt.config.runtime import UnsetProfile, load_profile, load_project
-from dbt.context.providers import generate_runtime_macro_context
-from dbt.context.query_header import generate_query_header_context
-from dbt.deprecations import show_all_deprecation_summaries
-from dbt.events.logging import setup_event_logger
-from dbt.events.types import (
-    ArtifactUploadError,
-    CommandCompleted,
-    MainEncounteredError,
-    MainReportArgs,
-    MainReportVersion,
-    MainStackTrace,
-    MainTrackingUserState,
-    ResourceReport,
-)
-from dbt.exceptions import DbtProjectError, FailFastError
-from dbt.flags import get_flag_dict, get_flags, set_flags
-from dbt.mp_context import get_mp_context
-from dbt.parser.manifest import parse_manifest
-from dbt.plugins import set_up_plugin_manager
-from dbt.profiler import profiler
-from dbt.tracking import active_user, initialize_from_flags, track_run
-from dbt.utils import try_get_max_rss_kb
-from dbt.utils.artifact_upload import upload_artifacts
-from dbt.version import installed as installed_version
-from dbt_common.clients.system import get_env
-from dbt_common.context import get_invocation_context, set_invocation_context
-from dbt_common.events.base_types import EventLevel
-from dbt_common.events.functions import LOG_VERSION, fire_event
-from dbt_common.events.helpers import get_json_string_utcnow
-from dbt_common.exceptions import DbtBaseException as DbtException
-from dbt_common.invocation import reset_invocation_id
-from dbt_common.record import (
-    Recorder,
-    RecorderMode,
-    get_record_mode_from_env,
-    get_record_types_from_dict,
-    get_record_types_from_env,
-)
-from dbt_common.utils import cast_dict_to_dict_of_strings
+
+# Like the tasks in main.py, the modules these decorators use are imported when
+# a command runs rather than here, since the CLI imports this module on startup.
 
 
 def preflight(func):
     def wrapper(*args, **kwargs):
+        import dbt.tracking
+        from dbt.adapters.factory import adapter_management
+        from dbt.cli import STARTED_AT
+        from dbt.cli.flags import Flags
+        from dbt.events.logging import setup_event_logger
+        from dbt.events.types import (
+            MainReportArgs,
+            MainReportVersion,
+            MainTrackingUserState,
+        )
+        from dbt.flags import get_flag_dict, set_flags
+        from dbt.profiler import profiler, sampling_profiler
+        from dbt.tracking import initialize_from_flags, track_run
+        from dbt.version import installed as installed_version
+        from dbt_common.clients.system import get_env
+        from dbt_common.context import get_invocation_context, set_invocation_context
+        from dbt_common.events.functions import LOG_VERSION, fire_event
+        from dbt_common.invocation import reset_invocation_id
+        from dbt_common.utils import cast_dict_to_dict_of_strings
+
         ctx = args[0]
         assert isinstance(ctx, Context)
         ctx.obj = ctx.obj or {}
@@ -94,15 +72,32 @@ def preflight(func):
         # Deprecation warnings
         flags.fire_deprecations()
 
-        if active_user is not None:  # mypy appeasement, always true
-            fire_event(MainTrackingUserState(user_state=active_user.state()))
+        if dbt.tracking.active_user is not None:  # mypy appeasement, always true
+            fire_event(MainTrackingUserState(user_state=dbt.tracking.active_user.state()))
 
         # Profiling
-        if flags.RECORD_TIMING_INFO:
+        if flags.RECORD_TIMING_INFO and flags.RECORD_TIMING_MODE == "sample":
+            ctx.with_resource(
+                sampling_profiler(
+                    outfile=flags.RECORD_TIMING_INFO,
+                    get_perf_info_dir=lambda: (
+                        ctx.obj["project"].project_target_path if "project" in ctx.obj else None
+                    ),
+                )
+            )
+        elif flags.RECORD_TIMING_INFO:
             ctx.with_resource(profiler(enable=True, outfile=flags.RECORD_TIMING_INFO))
 
         # Adapter management
-        ctx.with_resource(adapter_management())
+        session = ctx.obj.get("session")
+        if session is not None:
+            ctx.with_resource(session.invocation(flags))
+        else:
+            ctx.with_resource(adapter_management())
+
+        # The time from the start of the invocation, or from when the CLI
+        # started being imported, until the command can start running
+        ctx.obj["startup_time"] = time.perf_counter() - ctx.obj.get("started_at", STARTED_AT)
 
         return func(*args, **kwargs)
 
@@ -110,6 +105,15 @@ def preflight(func):
 
 
 def setup_record_replay():
+    from dbt_common.context import get_invocation_context
+    from dbt_common.record import (
+        Recorder,
+        RecorderMode,
+        get_record_mode_from_env,
+        get_record_types_from_dict,
+        get_record_types_from_env,
+    )
+
     rec_mode = get_record_mode_from_env()
     rec_types = get_record_types_from_env()
 
@@ -133,6 +137,9 @@ def setup_record_replay():
 
 
 def tear_down_record_replay():
+    from dbt_common.context import get_invocation_context
+    from dbt_common.record import RecorderMode
+
     recorder = get_invocation_context().recorder
     if recorder is not None:
         if recorder.mode == RecorderMode.RECORD:
@@ -149,6 +156,24 @@ def postflight(func):
     This decorator must be used before any other decorators that may throw an exception."""
 
     def wrapper(*args, **kwargs):
+        from dbt.deprecations import show_all_deprecation_summaries
+        from dbt.events.logging import flush_event_logger
+        from dbt.events.types import (
+            ArtifactUploadError,
+            CommandCompleted,
+            MainEncounteredError,
+            MainStackTrace,
+            ResourceReport,
+        )
+        from dbt.exceptions import FailFastError
+        from dbt.flags import get_flags
+        from dbt.utils import try_get_max_rss_kb
+        from dbt.utils.artifact_upload import upload_artifacts
+        from dbt_common.events.base_types import EventLevel
+        from dbt_common.events.functions import fire_event
+        from dbt_common.events.helpers import get_json_string_utcnow
+        from dbt_common.exceptions import DbtBaseException as DbtException
+
         ctx = args[0]
         start_func = time.perf_counter()
         success = False
@@ -193,6 +218,7 @@ def postflight(func):
                         process_mem_max_rss=try_get_max_rss_kb() or rusage.ru_maxrss,
                         process_in_blocks=rusage.ru_inblock,
                         process_out_blocks=rusage.ru_oublock,
+                        command_startup_time=ctx.obj.get("startup_time", 0.0),
                     ),
                     (
                         EventLevel.INFO
@@ -212,6 +238,9 @@ def postflight(func):
 
             tear_down_record_replay()
 
+            # With --log-async, events may still be waiting to be logged
+            flush_event_logger()
+
         if not success:
             raise ResultExit(result)
 
@@ -224,6 +253,8 @@ def postflight(func):
 # This decorator and its usage can be removed once https://github.com/dbt-labs/dbt-core/issues/6257 is closed.
 def unset_profile(func):
     def wrapper(*args, **kwargs):
+        from dbt.config.runtime import UnsetProfile
+
         ctx = args[0]
         assert isinstance(ctx, Context)
 
@@ -237,6 +268,8 @@ def unset_profile(func):
 
 def profile(func):
     def wrapper(*args, **kwargs):
+        from dbt.config.runtime import load_profile
+
         ctx = args[0]
         assert isinstance(ctx, Context)
 
@@ -244,7 +277,14 @@ def profile(func):
         # TODO: Generalize safe access to flags.THREADS:
         # https://github.com/dbt-labs/dbt-core/issues/6259
         threads = getattr(flags, "THREADS", None)
-        profile = load_profile(flags.PROJECT_DIR, flags.VARS, flags.PROFILE, flags.TARGET, threads)
+
+        def load():
+            return load_profile(
+                flags.PROJECT_DIR, flags.VARS, flags.PROFILE, flags.TARGET, threads
+            )
+
+        session = ctx.obj.get("session")
+        profile = session.get_profile(flags, load) if session is not None else load()
         ctx.obj["profile"] = profile
 
         return func(*args, **kwargs)
@@ -254,6 +294,11 @@ def profile(func):
 
 def project(func):
     def wrapper(*args, **kwargs):
+        import dbt.tracking
+        from dbt.config.runtime import load_project
+        from dbt.exceptions import DbtProjectError
+        from dbt.plugins import set_up_plugin_manager
+
         ctx = args[0]
         assert isinstance(ctx, Context)
 
@@ -263,9 +308,17 @@ def project(func):
             raise DbtProjectError("profile required for project")
 
         flags = ctx.obj["flags"]
-        project = load_project(
-            flags.PROJECT_DIR, flags.VERSION_CHECK, ctx.obj["profile"], flags.VARS
-        )
+
+        def load():
+            return load_project(
+                flags.PROJECT_DIR, flags.VERSION_CHECK, ctx.obj["profile"], flags.VARS
+            )
+
+        session = ctx.obj.get("session")
+        if session is not None:
+            project = session.get_project(flags, ctx.obj["profile"], load)
+        else:
+            project = load()
         ctx.obj["project"] = project
 
         # Plugins
@@ -287,6 +340,10 @@ def runtime_config(func):
     """
 
     def wrapper(*args, **kwargs):
+        import dbt.tracking
+        from dbt.config import RuntimeConfig
+        from dbt.exceptions import DbtProjectError
+
         ctx = args[0]
         assert isinstance(ctx, Context)
 
@@ -332,6 +389,9 @@ def catalogs(func):
     """A decorator used by click command functions for loading catalogs"""
 
     def wrapper(*args, **kwargs):
+        from dbt.config.catalogs import load_catalogs
+        from dbt.exceptions import DbtProjectError
+
         ctx = args[0]
         assert isinstance(ctx, Context)
 
@@ -376,6 +436,14 @@ def manifest(*args0, write=True, write_perf_info=False):
 
 def setup_manifest(ctx: Context, write: bool = True, write_perf_info: bool = False):
     """Load the manifest and add it to the context."""
+    from dbt.adapters.factory import get_adapter, register_adapter
+    from dbt.config.catalogs import get_active_write_integration
+    from dbt.context.providers import generate_runtime_macro_context
+    from dbt.context.query_header import generate_query_header_context
+    from dbt.exceptions import DbtProjectError
+    from dbt.mp_context import get_mp_context
+    from dbt.parser.manifest import parse_manifest
+
     req_strs = ["profile", "project", "runtime_config"]
     reqs = [ctx.obj.get(dep) for dep in req_strs]
 
@@ -384,6 +452,13 @@ def setup_manifest(ctx: Context, write: bool = True, write_perf_info: bool = Fal
 
     runtime_config = ctx.obj["runtime_config"]
 
+    session = ctx.obj.get("session")
+    if session is not None:
+        ctx.obj["manifest"] = session.manifest
+        if session.adapter_ready:
+            # set up with this manifest by an earlier invocation in the session
+            return
+
     catalogs = ctx.obj["catalogs"] if "catalogs" in ctx.obj else []
     active_integrations = [get_active_write_integration(catalog) for catalog in catalogs]
 
@@ -403,3 +478,7 @@ def setup_manifest(ctx: Context, write: bool = True, write_perf_info: bool = Fal
 
     for integration in active_integrations:
         adapter.add_catalog_integration(integration)
+
+    if session is not None:
+        session.manifest = ctx.obj["manifest"]
+        session.adapter_ready = True
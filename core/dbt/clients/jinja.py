@@ -17,6 +17,7 @@ from dbt.exceptions import (
     NoSupportedLanguagesFoundError,
 )
 from dbt.node_types import ModelLanguage
+from dbt.profiler import parse_macro_timing
 from dbt_common.clients.jinja import (
     CallableMacroGenerator,
     MacroProtocol,
@@ -78,7 +79,7 @@ class MacroGenerator(CallableMacroGenerator):
 
     # this makes MacroGenerator objects callable like functions
     def __call__(self, *args, **kwargs):
-        with self.track_call():
+        with self.track_call(), parse_macro_timing(self.macro.unique_id):
             return self.call_macro(*args, **kwargs)
 
 
@@ -1,7 +1,10 @@
 import dataclasses
+import hashlib
 import json
 import os
 import pickle
+import signal
+from array import array
 from collections import defaultdict, deque
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
@@ -37,8 +40,10 @@ from dbt.exceptions import (
 )
 from dbt.flags import get_flags
 from dbt.graph import Graph
+from dbt.graph.selection_cache import manifest_checksum
 from dbt.node_types import ModelLanguage, NodeType
 from dbt_common.clients.system import make_directory
+from dbt_common.context import _INVOCATION_CONTEXT_VAR
 from dbt_common.contracts.constraints import ConstraintType
 from dbt_common.events.contextvars import get_node_info
 from dbt_common.events.format import pluralize
@@ -47,6 +52,43 @@ from dbt_common.events.types import Note
 from dbt_common.invocation import get_invocation_id
 
 graph_file_name = "graph.gpickle"
+# The checksum of the graph last written to graph.gpickle
+graph_checksum_file_name = "graph.gpickle.sha256"
+
+# The attributes that Compiler.compile_node sets on a node. Worker processes
+# of a process pool send back only these, to be applied to the parent's node.
+COMPILED_NODE_ATTRS = (
+    "compiled",
+    "compiled_code",
+    "compiled_path",
+    "extra_ctes",
+    "extra_ctes_injected",
+    "_pre_injected_sql",
+    "relation_name",
+)
+
+
+def is_acyclic(num_nodes: int, edges: Iterable[Tuple[int, int]]) -> bool:
+    """Whether a graph of the nodes 0, 1, ..., num_nodes - 1 and the given
+    (source, target) edges has no cycles, by removing the nodes without
+    remaining parents until none are left (Kahn's algorithm).
+    """
+    in_degree = [0] * num_nodes
+    successors: List[List[int]] = [[] for _ in range(num_nodes)]
+    for source, target in edges:
+        successors[source].append(target)
+        in_degree[target] += 1
+
+    ready = [node for node in range(num_nodes) if in_degree[node] == 0]
+    removed = 0
+    while ready:
+        node = ready.pop()
+        removed += 1
+        for successor in successors[node]:
+            in_degree[successor] -= 1
+            if in_degree[successor] == 0:
+                ready.append(successor)
+    return removed == num_nodes
 
 
 def print_compile_stats(stats: Dict[NodeType, int]):
@@ -141,6 +183,9 @@ class Linker:
         return self.graph.nodes()
 
     def find_cycles(self):
+        names, edges = self.get_edge_list()
+        if is_acyclic(len(names), zip(edges[::2], edges[1::2])):
+            return None
         try:
             cycle = nx.find_cycle(self.graph)
         except nx.NetworkXNoCycle:
@@ -185,24 +230,36 @@ class Linker:
                 raise GraphDependencyNotFoundError(node, dependency)
 
     def link_graph(self, manifest: Manifest):
-        for source in manifest.sources.values():
-            self.add_node(source.unique_id)
-        for node in manifest.nodes.values():
-            self.link_node(node, manifest)
-        for semantic_model in manifest.semantic_models.values():
-            self.link_node(semantic_model, manifest)
-        for exposure in manifest.exposures.values():
-            self.link_node(exposure, manifest)
-        for metric in manifest.metrics.values():
-            self.link_node(metric, manifest)
-        for unit_test in manifest.unit_tests.values():
-            self.link_node(unit_test, manifest)
-        for saved_query in manifest.saved_queries.values():
-            self.link_node(saved_query, manifest)
-
-        cycle = self.find_cycles()
-
-        if cycle:
+        """Add every node of the manifest and its dependencies to the graph.
+        This has the same result as calling link_node for each node, but the
+        nodes and edges are collected as indexes first, checked for cycles,
+        and added to the graph in bulk.
+        """
+        linkable = (manifest.nodes, manifest.sources, manifest.metrics, manifest.semantic_models)
+        # indexes of the nodes, in the order link_node would add them
+        index_dict: Dict[str, int] = {unique_id: i for i, unique_id in enumerate(manifest.sources)}
+        edges: List[Tuple[int, int]] = []
+        for resources in (
+            manifest.nodes,
+            manifest.semantic_models,
+            manifest.exposures,
+            manifest.metrics,
+            manifest.unit_tests,
+            manifest.saved_queries,
+        ):
+            for node in resources.values():
+                node_index = index_dict.setdefault(node.unique_id, len(index_dict))
+                for dependency in node.depends_on_nodes:
+                    if not any(dependency in linked for linked in linkable):
+                        raise GraphDependencyNotFoundError(node, dependency)
+                    edges.append((index_dict.setdefault(dependency, len(index_dict)), node_index))
+
+        names = list(index_dict)
+        self.graph.add_nodes_from(names)
+        self.graph.add_edges_from((names[source], names[target]) for source, target in edges)
+
+        if not is_acyclic(len(names), edges):
+            cycle = self.find_cycles()
             raise RuntimeError("Found a cycle: {}".format(cycle))
 
     def add_test_edges(self, manifest: Manifest) -> None:
@@ -438,23 +495,43 @@ class Linker:
         self.link_graph(manifest)
         return Graph(self.graph)
 
+    def get_edge_list(self) -> Tuple[List[str], "array[int]"]:
+        """Return the nodes of the graph, in the graph's order, and its edges
+        as a flat array of (source, target) pairs of indexes into them.
+        """
+        names = list(self.graph)
+        index_dict = {name: index for index, name in enumerate(names)}
+        edges = array("L")
+        for source, target in self.graph.edges():
+            edges.append(index_dict[source])
+            edges.append(index_dict[target])
+        return names, edges
+
+    def get_graph_checksum(self, manifest: Manifest) -> Optional[str]:
+        """A checksum of the graph and of everything its nodes were built from,
+        or None if the manifest can't be checksummed.
+        """
+        checksum = manifest_checksum(manifest)
+        if checksum is None:
+            return None
+        names, edges = self.get_edge_list()
+        hasher = hashlib.sha256(checksum.encode())
+        hasher.update("\0".join(names).encode())
+        hasher.update(edges.tobytes())
+        return hasher.hexdigest()
+
     def get_graph_summary(self, manifest: Manifest) -> Dict[int, Dict[str, Any]]:
         """Create a smaller summary of the graph, suitable for basic diagnostics
         and performance tuning. The summary includes only the edge structure,
         node types, and node names. Each of the n nodes is assigned an integer
         index 0, 1, 2,..., n-1 for compactness"""
-        graph_nodes = dict()
-        index_dict = dict()
-        for node_index, node_name in enumerate(self.graph):
-            index_dict[node_name] = node_index
-            data = manifest.expect(node_name).to_dict(omit_none=True)
-            graph_nodes[node_index] = {"name": node_name, "type": data["resource_type"]}
-
-        for node_index, node in graph_nodes.items():
-            successors = [index_dict[n] for n in self.graph.successors(node["name"])]
-            if successors:
-                node["succ"] = [index_dict[n] for n in self.graph.successors(node["name"])]
-
+        names, edges = self.get_edge_list()
+        graph_nodes: Dict[int, Dict[str, Any]] = {
+            node_index: {"name": node_name, "type": str(manifest.expect(node_name).resource_type)}
+            for node_index, node_name in enumerate(names)
+        }
+        for source, target in zip(edges[::2], edges[1::2]):
+            graph_nodes[source].setdefault("succ", []).append(target)
         return graph_nodes
 
 
@@ -704,8 +781,27 @@ class Compiler:
         filename = graph_file_name
         graph_path = os.path.join(self.config.project_target_path, filename)
         flags = get_flags()
-        if flags.WRITE_JSON:
-            linker.write_graph(graph_path, manifest)
+        if not flags.WRITE_JSON:
+            return
+        # Serializing every node is slow for large projects, so graph.gpickle
+        # isn't written again while the graph and its nodes are unchanged. It
+        # is written before nodes are compiled or deferred, so the nodes are
+        # exactly what was parsed from the files the checksum covers.
+        checksum_path = os.path.join(self.config.project_target_path, graph_checksum_file_name)
+        checksum = linker.get_graph_checksum(manifest)
+        if checksum is not None and os.path.exists(graph_path):
+            try:
+                with open(checksum_path) as fp:
+                    if fp.read() == checksum:
+                        return
+            except OSError:
+                pass
+        if os.path.exists(checksum_path):
+            os.remove(checksum_path)
+        linker.write_graph(graph_path, manifest)
+        if checksum is not None:
+            with open(checksum_path, "w") as fp:
+                fp.write(checksum)
 
     # writes the "compiled_code" into the target/compiled directory
     def _write_node(
@@ -758,6 +854,48 @@ class Compiler:
         return node
 
 
+# Set in each process pool worker by init_compile_worker. Workers are forked,
+# so the manifest is a snapshot of the parent's at the time the pool started.
+_worker_config = None
+_worker_manifest: Optional[Manifest] = None
+
+
+def init_compile_worker(config, manifest: Manifest, invocation_context) -> None:
+    global _worker_config, _worker_manifest
+    # the parent process handles interrupts and terminates the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _INVOCATION_CONTEXT_VAR.set(invocation_context)
+    _worker_config = config
+    _worker_manifest = manifest
+
+
+def compile_node_in_worker(unique_id: str) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Compile a node against the manifest snapshot of a process pool worker
+    and return its compiled attributes, or the formatted error if compilation
+    failed. Errors are sent back as text because exceptions can reference
+    objects (such as nodes) that can't be pickled.
+    """
+    if _worker_config is None or _worker_manifest is None:
+        return {}, "The process pool worker was not initialized"
+
+    node = _worker_manifest.nodes[unique_id]
+    try:
+        adapter = get_adapter(_worker_config)
+        with adapter.connection_named(unique_id):
+            Compiler(_worker_config).compile_node(node, _worker_manifest, {})
+    except Exception as exc:
+        if isinstance(exc, DbtRuntimeError):
+            exc.add_node(node)
+        return {}, str(exc)
+
+    compiled_attrs = {attr: getattr(node, attr) for attr in COMPILED_NODE_ATTRS}
+    # 'to' expressions of foreign key constraints are compiled as well
+    if isinstance(node, ModelNode):
+        compiled_attrs["constraints"] = node.constraints
+        compiled_attrs["columns"] = node.columns
+    return compiled_attrs, None
+
+
 def inject_ctes_into_sql(sql: str, ctes: List[InjectedCTE]) -> str:
     """
     `ctes` is a list of InjectedCTEs like:
@@ -4,7 +4,6 @@ DEFAULT_ENV_PLACEHOLDER = "DBT_DEFAULT_PLACEHOLDER"
 
 SECRET_PLACEHOLDER = "$$$DBT_SECRET_START$$${}$$$DBT_SECRET_END$$$"
 
-MAXIMUM_SEED_SIZE = 1 * 1024 * 1024
 MAXIMUM_SEED_SIZE_NAME = "1MB"
 
 PIN_PACKAGE_URL = (
@@ -21,8 +20,11 @@ LEGACY_TIME_SPINE_MODEL_NAME = "metricflow_time_spine"
 LEGACY_TIME_SPINE_GRANULARITY = TimeGranularity.DAY
 MINIMUM_REQUIRED_TIME_SPINE_GRANULARITY = TimeGranularity.DAY
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
+SCHEMA_YAML_CACHE_FILE_NAME = "schema_yaml_cache.msgpack"
+SELECTION_CACHE_FILE_NAME = "selection_cache.msgpack"
 PACKAGE_LOCK_HASH_KEY = "sha1_hash"
 CATALOGS_FILE_NAME = "catalogs.yml"
 RUN_RESULTS_FILE_NAME = "run_results.json"
+SCHEMA_CACHE_FILE_NAME = "schema_cache.json"
 CATALOG_FILENAME = "catalog.json"
 SOURCE_RESULT_FILE_NAME = "sources.json"
@@ -5,7 +5,6 @@ from typing import Any, Dict, List, Optional, Union
 from mashumaro.types import SerializableType
 
 from dbt.artifacts.resources.base import FileHash
-from dbt.constants import MAXIMUM_SEED_SIZE
 from dbt_common.dataclass_schema import StrEnum, dbtClassMixin
 
 from .util import SourceKey
@@ -46,6 +45,8 @@ class FilePath(dbtClassMixin):
     relative_path: str
     modification_time: float
     project_root: str
+    # only recorded for seeds, to decide whether a saved checksum can be reused
+    file_size: Optional[int] = None
 
     @property
     def search_key(self) -> str:
@@ -65,10 +66,6 @@ class FilePath(dbtClassMixin):
     def original_file_path(self) -> str:
         return os.path.join(self.searched_path, self.relative_path)
 
-    def seed_too_large(self) -> bool:
-        """Return whether the file this represents is over the seed size limit"""
-        return os.stat(self.full_path).st_size > MAXIMUM_SEED_SIZE
-
 
 @dataclass
 class RemoteFile(dbtClassMixin):
@@ -160,13 +157,6 @@ class SourceFile(BaseSourceFile):
     macros: List[str] = field(default_factory=list)
     env_vars: List[str] = field(default_factory=list)
 
-    @classmethod
-    def big_seed(cls, path: FilePath) -> "SourceFile":
-        """Parse seeds over the size limit with just the path"""
-        self = cls(path=path, checksum=FileHash.path(path.original_file_path))
-        self.contents = ""
-        return self
-
     def add_node(self, value):
         if value not in self.nodes:
             self.nodes.append(value)
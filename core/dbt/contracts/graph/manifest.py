@@ -3,6 +3,7 @@ from collections import defaultdict
 from dataclasses import dataclass, field, replace
 from itertools import chain
 from multiprocessing.synchronize import Lock
+from pathlib import Path
 from typing import (
     Any,
     Callable,
@@ -10,6 +11,7 @@ from typing import (
     DefaultDict,
     Dict,
     Generic,
+    Iterable,
     List,
     Mapping,
     MutableMapping,
@@ -509,6 +511,82 @@ class SingularTestLookup(dbtClassMixin):
         return node
 
 
+class SelectorIndex:
+    """Indexes of the values the node selector methods match on, mapping each
+    value to the unique ids of the nodes that have it. Selector methods look
+    up the values a selector matches instead of checking it against every
+    node, so a selector with many criteria doesn't scan the manifest for
+    each of them.
+    """
+
+    def __init__(self, manifest: "Manifest") -> None:
+        self.manifest_size = self.size_of(manifest)
+        self.tags: DefaultDict[str, Set[UniqueID]] = defaultdict(set)
+        self.packages: DefaultDict[str, Set[UniqueID]] = defaultdict(set)
+        self.resource_types: DefaultDict[NodeType, Set[UniqueID]] = defaultdict(set)
+        # groups of the nodes and metrics
+        self.groups: DefaultDict[str, Set[UniqueID]] = defaultdict(set)
+        # every prefix of the dot-separated parts of each non-source node's fqn,
+        # with and without the package name
+        self.fqn_prefixes: DefaultDict[Tuple[str, ...], Set[UniqueID]] = defaultdict(set)
+        self.fqn_names: DefaultDict[str, Set[UniqueID]] = defaultdict(set)
+        self.versioned: Set[UniqueID] = set()
+        self.non_source: Set[UniqueID] = set()
+        # config values, built by the config selector method for each config
+        # path the first time it's used, and the paths of the files under a
+        # project root, built by the path selector method
+        self.config_values: Dict[Tuple[str, ...], Any] = {}
+        self.file_paths: Dict[Path, Any] = {}
+        self.populate(manifest)
+
+    @staticmethod
+    def size_of(manifest: "Manifest") -> Tuple[int, ...]:
+        return (
+            len(manifest.nodes),
+            len(manifest.sources),
+            len(manifest.exposures),
+            len(manifest.metrics),
+            len(manifest.unit_tests),
+            len(manifest.semantic_models),
+            len(manifest.saved_queries),
+        )
+
+    def populate(self, manifest: "Manifest") -> None:
+        for node in chain(
+            manifest.nodes.values(),
+            manifest.sources.values(),
+            manifest.exposures.values(),
+            manifest.metrics.values(),
+            manifest.unit_tests.values(),
+            manifest.semantic_models.values(),
+            manifest.saved_queries.values(),
+        ):
+            unique_id = node.unique_id
+            for tag in getattr(node, "tags", ()):
+                self.tags[tag].add(unique_id)
+            self.packages[node.package_name].add(unique_id)
+            self.resource_types[node.resource_type].add(unique_id)
+            if node.resource_type != NodeType.Source:
+                self.add_fqn(node)
+
+        for node in chain(manifest.nodes.values(), manifest.metrics.values()):
+            group = node.config.get("group")
+            if group:
+                self.groups[group].add(node.unique_id)
+
+    def add_fqn(self, node) -> None:
+        unique_id = node.unique_id
+        self.non_source.add(unique_id)
+        if node.is_versioned:
+            self.versioned.add(unique_id)
+        self.fqn_names[node.fqn[-1]].add(unique_id)
+        flat_fqn = tuple(item for segment in node.fqn for item in segment.split("."))
+        unscoped_flat_fqn = tuple(item for segment in node.fqn[1:] for item in segment.split("."))
+        for flat in (flat_fqn, unscoped_flat_fqn):
+            for end in range(1, len(flat) + 1):
+                self.fqn_prefixes[flat[:end]].add(unique_id)
+
+
 def _packages_to_search(
     current_project: str,
     node_package: str,
@@ -545,6 +623,74 @@ def build_node_edges(nodes: List[ManifestNode]):
     return _sort_values(forward_edges), _sort_values(backward_edges)
 
 
+class NodeEdges:
+    """The parent and child maps of a manifest's graph members, kept up to
+    date between builds. Each update compares every member's depends_on nodes
+    with those it had at the previous update, and only rebuilds the entries
+    of the members that were added, removed or changed, and of their parents.
+    The result is the same as build_node_edges over all the members.
+    """
+
+    def __init__(self) -> None:
+        self.parent_map: Dict[str, List[str]] = {}
+        self.child_map: Dict[str, List[str]] = {}
+        # each member's depends_on nodes as of the last update, in the
+        # members' order. Nodes' depends_on lists are changed in place, so
+        # they are copied.
+        self._depends_on: Dict[str, List[str]] = {}
+        # the members that depend on each unique id, which may not be a member
+        self._dependents: Dict[str, List[str]] = {}
+
+    def update(self, members: Iterable[Any]) -> None:
+        current: Dict[str, List[str]] = {node.unique_id: node.depends_on_nodes for node in members}
+        if current == self._depends_on and list(current) == list(self._depends_on):
+            return
+        # unique ids whose children changed
+        changed: Set[str] = set()
+
+        for unique_id in self._depends_on.keys() - current.keys():
+            changed.update(self._remove_edges(unique_id))
+            del self._depends_on[unique_id]
+            del self.parent_map[unique_id]
+            del self.child_map[unique_id]
+
+        for unique_id, depends_on in current.items():
+            previous = self._depends_on.get(unique_id)
+            if previous is None:
+                changed.add(unique_id)
+            elif previous == depends_on:
+                continue
+            else:
+                changed.update(self._remove_edges(unique_id))
+            for parent in depends_on:
+                self._dependents.setdefault(parent, []).append(unique_id)
+            changed.update(depends_on)
+            self._depends_on[unique_id] = depends_on[:]
+            self.parent_map[unique_id] = sorted(depends_on)
+
+        for unique_id in changed:
+            if unique_id in current:
+                self.child_map[unique_id] = sorted(self._dependents.get(unique_id, []))
+
+        # keep the maps in the members' order, as build_node_edges would
+        if changed or list(self._depends_on) != list(current):
+            self._depends_on = {unique_id: self._depends_on[unique_id] for unique_id in current}
+            self.parent_map = {unique_id: self.parent_map[unique_id] for unique_id in current}
+            self.child_map = {unique_id: self.child_map[unique_id] for unique_id in current}
+
+    def _remove_edges(self, unique_id: str) -> List[str]:
+        """Remove the edges from the previous parents of unique_id, and
+        return them.
+        """
+        parents = self._depends_on[unique_id]
+        for parent in parents:
+            dependents = self._dependents[parent]
+            dependents.remove(unique_id)
+            if not dependents:
+                del self._dependents[parent]
+        return parents
+
+
 # Build a map of children of macros and generic tests
 def build_macro_edges(nodes: List[Any]):
     forward_edges: Dict[str, List[str]] = {
@@ -935,6 +1081,14 @@ class Manifest(MacroMethods, dbtClassMixin):
         default=None,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    _selector_index: Optional[SelectorIndex] = field(
+        default=None,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
+    _node_edges: Optional[NodeEdges] = field(
+        default=None,
+        metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
+    )
 
     def __pre_serialize__(self, context: Optional[Dict] = None):
         # serialization won't work with anything except an empty source_patches because
@@ -1096,7 +1250,11 @@ class Manifest(MacroMethods, dbtClassMixin):
         return copy
 
     def build_parent_and_child_maps(self):
-        edge_members = list(
+        # only the entries of the nodes that changed since the last call are
+        # rebuilt
+        if self._node_edges is None:
+            self._node_edges = NodeEdges()
+        self._node_edges.update(
             chain(
                 self.nodes.values(),
                 self.sources.values(),
@@ -1107,9 +1265,8 @@ class Manifest(MacroMethods, dbtClassMixin):
                 self.unit_tests.values(),
             )
         )
-        forward_edges, backward_edges = build_node_edges(edge_members)
-        self.child_map = forward_edges
-        self.parent_map = backward_edges
+        self.child_map = self._node_edges.child_map
+        self.parent_map = self._node_edges.parent_map
 
     def build_macro_child_map(self):
         edge_members = list(
@@ -1322,6 +1479,23 @@ class Manifest(MacroMethods, dbtClassMixin):
             self._singular_test_lookup = SingularTestLookup(self)
         return self._singular_test_lookup
 
+    @property
+    def selector_index(self) -> SelectorIndex:
+        # also rebuilt if members were added to or removed from the dicts
+        # directly since it was built, as partial parsing does
+        if (
+            self._selector_index is None
+            or self._selector_index.manifest_size != SelectorIndex.size_of(self)
+        ):
+            self._selector_index = SelectorIndex(self)
+        return self._selector_index
+
+    def invalidate_selector_index(self) -> None:
+        """Drop the selector index, to be rebuilt the next time it's used.
+        Called whenever a member is added or replaced.
+        """
+        self._selector_index = None
+
     @property
     def external_node_unique_ids(self):
         return [node.unique_id for node in self.nodes.values() if node.is_external_node]
@@ -1558,6 +1732,7 @@ class Manifest(MacroMethods, dbtClassMixin):
                 )
                 self.nodes[unique_id] = replace(current, defer_relation=defer_relation)
 
+        self.invalidate_selector_index()
         # Rebuild the flat_graph, which powers the 'graph' context variable
         self.build_flat_graph()
 
@@ -1600,12 +1775,14 @@ class Manifest(MacroMethods, dbtClassMixin):
         # sources can't be overwritten!
         _check_duplicates(source, self.sources)
         self.sources[source.unique_id] = source  # type: ignore
+        self.invalidate_selector_index()
         source_file.sources.append(source.unique_id)
 
     def add_node_nofile(self, node: ManifestNode):
         # nodes can't be overwritten!
         _check_duplicates(node, self.nodes)
         self.nodes[node.unique_id] = node
+        self.invalidate_selector_index()
 
     def add_node(self, source_file: AnySourceFile, node: ManifestNode, test_from=None):
         self.add_node_nofile(node)
@@ -1629,6 +1806,7 @@ class Manifest(MacroMethods, dbtClassMixin):
     def add_exposure(self, source_file: SchemaSourceFile, exposure: Exposure):
         _check_duplicates(exposure, self.exposures)
         self.exposures[exposure.unique_id] = exposure
+        self.invalidate_selector_index()
         source_file.exposures.append(exposure.unique_id)
 
     def add_metric(
@@ -1636,6 +1814,7 @@ class Manifest(MacroMethods, dbtClassMixin):
     ):
         _check_duplicates(metric, self.metrics)
         self.metrics[metric.unique_id] = metric
+        self.invalidate_selector_index()
         if not generated_from:
             source_file.metrics.append(metric.unique_id)
         else:
@@ -1682,12 +1861,14 @@ class Manifest(MacroMethods, dbtClassMixin):
     def add_semantic_model(self, source_file: SchemaSourceFile, semantic_model: SemanticModel):
         _check_duplicates(semantic_model, self.semantic_models)
         self.semantic_models[semantic_model.unique_id] = semantic_model
+        self.invalidate_selector_index()
         source_file.semantic_models.append(semantic_model.unique_id)
 
     def add_unit_test(self, source_file: SchemaSourceFile, unit_test: UnitTestDefinition):
         if unit_test.unique_id in self.unit_tests:
             raise DuplicateResourceNameError(unit_test, self.unit_tests[unit_test.unique_id])
         self.unit_tests[unit_test.unique_id] = unit_test
+        self.invalidate_selector_index()
         source_file.unit_tests.append(unit_test.unique_id)
 
     def add_fixture(self, source_file: FixtureSourceFile, fixture: UnitTestFileFixture):
@@ -1699,6 +1880,7 @@ class Manifest(MacroMethods, dbtClassMixin):
     def add_saved_query(self, source_file: SchemaSourceFile, saved_query: SavedQuery) -> None:
         _check_duplicates(saved_query, self.saved_queries)
         self.saved_queries[saved_query.unique_id] = saved_query
+        self.invalidate_selector_index()
         source_file.saved_queries.append(saved_query.unique_id)
 
     # end of methods formerly in ParseResult
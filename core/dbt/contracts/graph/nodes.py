@@ -73,13 +73,7 @@ from dbt.contracts.graph.unparsed import (
     UnparsedSourceDefinition,
     UnparsedSourceTableDefinition,
 )
-from dbt.events.types import (
-    SeedExceedsLimitAndPathChanged,
-    SeedExceedsLimitChecksumChanged,
-    SeedExceedsLimitSamePath,
-    SeedIncreased,
-    UnversionedBreakingChange,
-)
+from dbt.events.types import UnversionedBreakingChange
 from dbt.exceptions import ContractBreakingChangeError, ParsingError, ValidationError
 from dbt.flags import get_flags
 from dbt.node_types import (
@@ -898,39 +892,10 @@ class SeedNode(SeedResource, ParsedNode):  # No SQLDefaults!
         return SeedResource
 
     def same_seeds(self, other: "SeedNode") -> bool:
-        # for seeds, we check the hashes. If the hashes are different types,
-        # no match. If the hashes are both the same 'path', log a warning and
-        # assume they are the same
-        # if the current checksum is a path, we want to log a warning.
-        result = self.checksum == other.checksum
-
-        if self.checksum.name == "path":
-            msg: str
-            if other.checksum.name != "path":
-                warn_or_error(
-                    SeedIncreased(package_name=self.package_name, name=self.name), node=self
-                )
-            elif result:
-                warn_or_error(
-                    SeedExceedsLimitSamePath(package_name=self.package_name, name=self.name),
-                    node=self,
-                )
-            elif not result:
-                warn_or_error(
-                    SeedExceedsLimitAndPathChanged(package_name=self.package_name, name=self.name),
-                    node=self,
-                )
-            else:
-                warn_or_error(
-                    SeedExceedsLimitChecksumChanged(
-                        package_name=self.package_name,
-                        name=self.name,
-                        checksum_name=other.checksum.name,
-                    ),
-                    node=self,
-                )
-
-        return result
+        # seeds are compared by the checksum of their contents. A seed in a
+        # manifest from an older version of dbt may only have a 'path'
+        # checksum, which never matches a content checksum, so it's modified.
+        return self.checksum == other.checksum
 
     @property
     def empty(self):
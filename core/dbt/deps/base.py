@@ -4,7 +4,7 @@ import os
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Generic, List, Optional, TypeVar
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar
 
 from dbt.contracts.project import ProjectPackageMetadata
 from dbt.events.types import DepsSetDownloadDirectory
@@ -76,10 +76,21 @@ class PinnedPackage(BasePackage):
     def _fetch_metadata(self, project, renderer):
         raise NotImplementedError
 
-    @abc.abstractmethod
     def install(self, project, renderer):
+        self.install_to(project, renderer, self.get_installation_path(project, renderer))
+
+    @abc.abstractmethod
+    def install_to(self, project, renderer, dest_path: str):
+        """Install the package's contents at dest_path, replacing anything there."""
         raise NotImplementedError
 
+    def get_store_spec(self) -> Optional[Tuple[str, ...]]:
+        """Return what identifies this package's contents, if they can never
+        change once pinned, so that they can be reused across installs. Packages
+        that may change (like local packages) return None.
+        """
+        return None
+
     @abc.abstractmethod
     def nice_version_name(self):
         raise NotImplementedError
@@ -104,7 +115,7 @@ class PinnedPackage(BasePackage):
     def get_subdirectory(self):
         return None
 
-    def _install(self, project, renderer):
+    def _install(self, project, renderer, dest_path: Optional[str] = None):
         metadata = self.fetch_metadata(project, renderer)
 
         tar_name = f"{self.package}.{self.version}.tar.gz"
@@ -112,8 +123,9 @@ class PinnedPackage(BasePackage):
         system.make_directory(str(tar_path.parent))
 
         download_url = metadata.downloads.tarball
-        deps_path = project.packages_install_path
-        package_name = self.get_project_name(project, renderer)
+        if dest_path is None:
+            dest_path = self.get_installation_path(project, renderer)
+        deps_path, package_name = os.path.split(dest_path)
 
         download_untar_fn = functools.partial(
             self.download_and_untar, download_url, str(tar_path), deps_path, package_name
@@ -1,4 +1,5 @@
 import os
+import re
 from typing import Dict, List, Optional
 
 from dbt.clients import git
@@ -116,8 +117,7 @@ class GitPinnedPackage(GitPackageMixin, PinnedPackage):
         partial = PartialProject.from_project_root(path)
         return partial.render_package_metadata(renderer)
 
-    def install(self, project, renderer):
-        dest_path = self.get_installation_path(project, renderer)
+    def install_to(self, project, renderer, dest_path):
         if os.path.exists(dest_path):
             if system.path_is_symlink(dest_path):
                 system.remove_file(dest_path)
@@ -126,6 +126,12 @@ class GitPinnedPackage(GitPackageMixin, PinnedPackage):
 
         system.move(self._checkout(), dest_path)
 
+    def get_store_spec(self):
+        # branches and tags can move, only a commit SHA pins the contents
+        if not re.fullmatch(r"[0-9a-f]{40}", self.revision):
+            return None
+        return ("git", self.git, self.revision, self.subdirectory or "")
+
 
 class GitUnpinnedPackage(GitPackageMixin, UnpinnedPackage[GitPinnedPackage]):
     def __init__(
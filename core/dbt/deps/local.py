@@ -50,9 +50,8 @@ class LocalPinnedPackage(LocalPackageMixin, PinnedPackage):
         partial = PartialProject.from_project_root(self.resolve_path(project))
         return partial.render_package_metadata(renderer)
 
-    def install(self, project, renderer):
+    def install_to(self, project, renderer, dest_path):
         src_path = self.resolve_path(project)
-        dest_path = self.get_installation_path(project, renderer)
 
         if system.path_exists(dest_path):
             if not system.path_is_symlink(dest_path):
@@ -59,8 +59,11 @@ class RegistryPinnedPackage(RegistryPackageMixin, PinnedPackage):
         dct = registry.package_version(self.package, self.version)
         return RegistryPackageMetadata.from_dict(dct)
 
-    def install(self, project, renderer):
-        self._install(project, renderer)
+    def install_to(self, project, renderer, dest_path):
+        self._install(project, renderer, dest_path)
+
+    def get_store_spec(self):
+        return ("hub", self.package, self.version)
 
 
 class RegistryUnpinnedPackage(RegistryPackageMixin, UnpinnedPackage[RegistryPinnedPackage]):
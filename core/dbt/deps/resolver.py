@@ -1,3 +1,5 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterator, List, NoReturn, Set, Type
 
@@ -8,6 +10,7 @@ from dbt.contracts.project import (
     LocalPackage,
     PackageSpec,
     PrivatePackage,
+    ProjectPackageMetadata,
     RegistryPackage,
     TarballPackage,
 )
@@ -23,6 +26,8 @@ from dbt.exceptions import (
     MismatchedDependencyTypeError,
 )
 
+MAX_CONCURRENT_FETCHES = 8
+
 
 @dataclass
 class PackageListing:
@@ -123,13 +128,22 @@ def resolve_packages(
 
     renderer = PackageRenderer(cli_vars)
 
+    def fetch_metadata(package: UnpinnedPackage) -> ProjectPackageMetadata:
+        return final[package].resolved().fetch_metadata(project, renderer)
+
     while pending:
         next_pending = PackageListing()
-        # resolve the dependency in question
         for package in pending:
             final.incorporate(package)
-            target = final[package].resolved().fetch_metadata(project, renderer)
-            next_pending.update_from(target.packages)
+        # the packages at each level are independent of each other, so fetch
+        # their metadata (a registry request or git clone each) concurrently
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, fetch_metadata, package)
+                for package in pending
+            ]
+        for future in futures:
+            next_pending.update_from(future.result().packages)
         pending = next_pending
 
     resolved = final.resolved()
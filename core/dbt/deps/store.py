@@ -0,0 +1,110 @@
+import json
+import os
+import shutil
+import tempfile
+from hashlib import sha256
+from typing import Callable, Dict, Optional, Tuple
+
+from dbt.deps.base import PinnedPackage
+from dbt_common.clients import system
+
+# Written to packages_install_path to record which package each directory holds
+INSTALLED_PACKAGES_FILE_NAME = ".installed_packages.json"
+STORE_ENTRY_FILE_NAME = "package.json"
+STORE_CONTENTS_DIR_NAME = "contents"
+
+
+def package_key(package: PinnedPackage) -> Optional[str]:
+    """Return a stable key for the contents of a pinned package, or None if
+    its contents can change without its spec changing.
+    """
+    spec = package.get_store_spec()
+    if spec is None:
+        return None
+    return sha256(json.dumps(spec).encode("utf-8")).hexdigest()
+
+
+def read_installed_packages(install_path: str) -> Dict[str, str]:
+    """Return the directory name of each package installed by the previous
+    `dbt deps`, keyed by `package_key`.
+    """
+    path = os.path.join(install_path, INSTALLED_PACKAGES_FILE_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as fp:
+            installed = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    return installed if isinstance(installed, dict) else {}
+
+
+def write_installed_packages(install_path: str, installed: Dict[str, str]) -> None:
+    system.write_file(
+        os.path.join(install_path, INSTALLED_PACKAGES_FILE_NAME),
+        json.dumps(installed, sort_keys=True),
+    )
+
+
+def link_tree(src: str, dest: str) -> None:
+    """Recreate the directory src at dest, hardlinking files rather than
+    copying them wherever the filesystem allows it.
+    """
+
+    def link_or_copy(src_file: str, dest_file: str) -> None:
+        try:
+            os.link(src_file, dest_file)
+        except OSError:
+            shutil.copy2(src_file, dest_file)
+
+    shutil.copytree(src, dest, symlinks=True, copy_function=link_or_copy)
+
+
+class PackageStore:
+    """A directory of package contents that can be shared by every project on
+    a machine, so that a package is only downloaded or cloned once per version.
+
+    Each entry is named after the `package_key` of the package it holds and
+    contains the package's files and the name of its project. Entries are
+    written to a staging directory and renamed into place, so concurrent
+    installs never see a partially written entry.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.abspath(path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key)
+
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        """Return the project name and contents directory of a stored package."""
+        entry_path = self._entry_path(key)
+        try:
+            with open(os.path.join(entry_path, STORE_ENTRY_FILE_NAME)) as fp:
+                entry = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        return entry["name"], os.path.join(entry_path, STORE_CONTENTS_DIR_NAME)
+
+    def add(self, key: str, name: str, install: Callable[[str], None]) -> Tuple[str, str]:
+        """Store a package by calling `install` with the directory its contents
+        should be installed to.
+        """
+        entry_path = self._entry_path(key)
+        system.make_directory(os.path.dirname(entry_path))
+        staging_path = tempfile.mkdtemp(prefix=".staging-", dir=os.path.dirname(entry_path))
+        try:
+            install(os.path.join(staging_path, STORE_CONTENTS_DIR_NAME))
+            system.write_file(
+                os.path.join(staging_path, STORE_ENTRY_FILE_NAME), json.dumps({"name": name})
+            )
+            try:
+                os.rename(staging_path, entry_path)
+            except OSError:
+                # another install stored the same package first
+                if self.get(key) is None:
+                    raise
+        finally:
+            if os.path.exists(staging_path):
+                system.rmtree(staging_path)
+        return name, os.path.join(entry_path, STORE_CONTENTS_DIR_NAME)
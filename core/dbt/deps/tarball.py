@@ -75,12 +75,11 @@ class TarballPinnedPackage(TarballPackageMixin, PinnedPackage):
         metadata.name = self.package if self.package else metadata.name
         return metadata
 
-    def install(self, project, renderer):
+    def install_to(self, project, renderer, dest_path):
         download_untar_fn = functools.partial(
             self.download_and_untar, self.tarball, self.tar_path, self.untarred_path, self.name
         )
         connection_exception_retry(download_untar_fn, 5)
-        dest_path = self.get_installation_path(project, renderer)
         if os.path.exists(dest_path):
             if system.path_is_symlink(dest_path):
                 system.remove_file(dest_path)
@@ -1,13 +1,25 @@
 import os
-from functools import partial
-from typing import Callable, List
+import queue
+import sys
+import threading
+import traceback
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
+from dbt.events.types import LogEventsDropped
 from dbt.tracking import track_behavior_change_warn
-from dbt_common.events.base_types import EventLevel, EventMsg
+from dbt_common.events.base_types import (
+    BaseEvent,
+    EventLevel,
+    EventMsg,
+    msg_from_base_event,
+)
+from dbt_common.events.event_manager import EventManager
 from dbt_common.events.event_manager_client import (
     add_callback_to_manager,
     add_logger_to_manager,
     cleanup_event_logger,
+    ctx_set_event_manager,
     get_event_manager,
 )
 from dbt_common.events.functions import (
@@ -17,6 +29,7 @@ from dbt_common.events.functions import (
     make_log_dir_if_missing,
 )
 from dbt_common.events.logger import LineFormat, LoggerConfig
+from dbt_common.exceptions.events import EventCompilationError
 from dbt_common.invocation import get_invocation_id
 
 # These are the logging events issued by the "clean" command,
@@ -27,6 +40,47 @@ from dbt_common.invocation import get_invocation_id
 _NOFILE_CODES = ["Z012", "Z013", "Z014", "Z015"]
 
 
+# Callbacks dbt registers itself that only handle some events, by the names of
+# the events they handle
+_CALLBACK_EVENT_NAMES: Dict[Callable[[EventMsg], None], Tuple[str, ...]] = {
+    track_behavior_change_warn: ("BehaviorChangeEvent",),
+}
+
+_LEVEL_ORDER = {
+    EventLevel.DEBUG: 10,
+    EventLevel.TEST: 10,
+    EventLevel.INFO: 20,
+    EventLevel.WARN: 30,
+    EventLevel.ERROR: 40,
+}
+
+
+@lru_cache(maxsize=None)
+def _event_level(event_type: Type[BaseEvent]) -> EventLevel:
+    return event_type().level_tag()
+
+
+def event_is_consumed(event_type: Type[BaseEvent], level: Optional[EventLevel] = None) -> bool:
+    """Whether an event of this type, fired at its own level or at `level`,
+    would be written by any logger or passed to any callback. Events whose
+    contents are expensive to build, such as a node's run result, are only
+    built when it would be.
+    """
+    manager = get_event_manager()
+    if not isinstance(manager, EventManager) or os.environ.get("DBT_TEST_BINARY_SERIALIZATION"):
+        return True
+    level_order = _LEVEL_ORDER[level or _event_level(event_type)]
+    # warnings can be turned into errors, so they're always fired
+    if level_order >= _LEVEL_ORDER[EventLevel.WARN]:
+        return True
+    if any(level_order >= _LEVEL_ORDER[logger.level] for logger in manager.loggers):
+        return True
+    return any(
+        event_type.__name__ in _CALLBACK_EVENT_NAMES.get(callback, (event_type.__name__,))
+        for callback in manager.callbacks
+    )
+
+
 def _line_format_from_str(format_str: str, default: LineFormat) -> LineFormat:
     if format_str == "text":
         return LineFormat.PlainText
@@ -65,7 +119,123 @@ def _logfile_filter(log_cache_events: bool, line_format: LineFormat, msg: EventM
     )
 
 
+class AsyncEventManager(EventManager):
+    """An event manager that writes events to the loggers and passes them to the
+    callbacks on a dedicated thread, so the threads firing events don't wait on
+    formatting them or on log I/O.
+
+    Events are created, and warnings turned into errors, on the thread that
+    fires them. They are then put on a bounded queue. When the queue is full,
+    debug level events are dropped if `overflow` is "drop", and every other
+    event waits for space. flush() waits until every queued event has been
+    handled, and reports how many were dropped.
+    """
+
+    def __init__(self, queue_size: int = 10000, overflow: str = "block") -> None:
+        super().__init__()
+        self.overflow = overflow
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[EventMsg]]" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(
+            target=self._dispatch_events, name="dbt-events", daemon=True
+        )
+        self._thread.start()
+
+    def fire_event(
+        self,
+        e: BaseEvent,
+        level: Optional[EventLevel] = None,
+        node: Any = None,
+        force_warn_or_error_handling: bool = False,
+    ) -> None:
+        # Events fired while handling another one, and after closing, are
+        # handled right away, since nothing would take them off the queue.
+        if not self._thread.is_alive() or threading.current_thread() is self._thread:
+            super().fire_event(e, level, node, force_warn_or_error_handling)
+            return
+
+        msg = msg_from_base_event(e, level=level)
+        if force_warn_or_error_handling or (
+            self.require_warn_or_error_handling and msg.info.level == "warn"
+        ):
+            if self.warn_error or self.warn_error_options.errors(e):
+                raise EventCompilationError(e.message(), node)
+            elif self.warn_error_options.silenced(e):
+                return
+
+        if self.overflow == "drop" and msg.info.level == "debug":
+            try:
+                self._queue.put_nowait(msg)
+            except queue.Full:
+                self.dropped += 1
+        else:
+            self._queue.put(msg)
+
+    def _dispatch_events(self) -> None:
+        while True:
+            msg = self._queue.get()
+            try:
+                if msg is None:
+                    return
+                self._dispatch(msg)
+            except Exception:
+                # there's no caller to raise to, and a logger or callback
+                # failing shouldn't stop the rest of the events from being logged
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                self._queue.task_done()
+
+    def _dispatch(self, msg: EventMsg) -> None:
+        for logger in self.loggers:
+            if logger.filter(msg):  # type: ignore
+                logger.write_line(msg)
+
+        for callback in self.callbacks:
+            callback(msg)
+
+    def flush(self) -> None:
+        if self._thread.is_alive():
+            self._queue.join()
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            super().fire_event(LogEventsDropped(count=dropped))
+        super().flush()
+
+    def close(self) -> None:
+        """Handle the events still queued, and stop the dispatching thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self.flush()
+
+
+def flush_event_logger() -> None:
+    """Wait for every event fired so far to be logged."""
+    flush = getattr(get_event_manager(), "flush", None)
+    if flush is not None:
+        flush()
+
+
+def _setup_event_manager(flags) -> None:
+    current = get_event_manager()
+    if isinstance(current, AsyncEventManager):
+        current.close()
+    manager: EventManager
+    if getattr(flags, "LOG_ASYNC", False):
+        manager = AsyncEventManager(
+            queue_size=getattr(flags, "LOG_QUEUE_SIZE", 10000),
+            overflow=getattr(flags, "LOG_QUEUE_FULL", "block"),
+        )
+    elif isinstance(current, AsyncEventManager):
+        manager = EventManager()
+    else:
+        return
+    manager.require_warn_or_error_handling = current.require_warn_or_error_handling
+    ctx_set_event_manager(manager)
+
+
 def setup_event_logger(flags, callbacks: List[Callable[[EventMsg], None]] = []) -> None:
+    _setup_event_manager(flags)
     cleanup_event_logger()
     make_log_dir_if_missing(flags.LOG_PATH)
     event_manager = get_event_manager()
@@ -686,6 +686,9 @@ class UnusedResourceConfigPath(WarnLevel):
         return warning_tag(msg)
 
 
+# Note: seeds over the size limit are now hashed like any other seed, so the
+# following four events are no longer fired. We are leaving the event classes
+# here, because users may have specified them in warn_error_options.
 class SeedIncreased(WarnLevel):
     def code(self) -> str:
         return "I052"
@@ -1264,6 +1267,22 @@ class DepsScrubbedPackageName(WarnLevel):
         return f"Detected secret env var in {self.package_name}. dbt will write a scrubbed representation to the lock file. This will cause issues with subsequent 'dbt deps' using the lock file, requiring 'dbt deps --upgrade'"
 
 
+class DepsPackageUnchanged(InfoLevel):
+    def code(self) -> str:
+        return "M036"
+
+    def message(self) -> str:
+        return f"Already installed from {self.version_name}"
+
+
+class DepsLinkFromPackageStore(DebugLevel):
+    def code(self) -> str:
+        return "M037"
+
+    def message(self) -> str:
+        return f"Linking package from the package store at {self.path}"
+
+
 # =======================================================
 # P - Artifacts
 # =======================================================
@@ -1797,6 +1816,62 @@ class LogBatchResult(DynamicLevel):
         return f"Batch {formatted}"
 
 
+class ProcessPoolUnsupported(InfoLevel):
+    def code(self) -> str:
+        return "Q047"
+
+    def message(self) -> str:
+        return f"Not compiling in a process pool: {self.reason}. Falling back to threads."
+
+
+class ConcurrencyAdjusted(DebugLevel):
+    def code(self) -> str:
+        return "Q048"
+
+    def message(self) -> str:
+        return (
+            f"Adaptive threads: {self.previous_threads} -> {self.threads} ({self.reason}). "
+            f"active={self.active}, ready={self.ready}, latency={self.latency:.2f}s, "
+            f"short_latency={self.short_latency:.2f}s, long_latency={self.long_latency:.2f}s"
+        )
+
+
+class SchemaCacheUsed(DebugLevel):
+    def code(self) -> str:
+        return "Q049"
+
+    def message(self) -> str:
+        database = self.database or "<default>"
+        return (
+            f"Using {self.num_schemas} cached schemas for database {database}, "
+            f"listed {self.age:.0f}s ago"
+        )
+
+
+class SchemaCacheStale(InfoLevel):
+    def code(self) -> str:
+        return "Q050"
+
+    def message(self) -> str:
+        relation = f"{self.database}.{self.schema}" if self.database else self.schema
+        return (
+            f"Schema {relation} was cached as existing but could not be found, so it was "
+            "created and the schema cache for its database was cleared"
+        )
+
+
+class AdapterCachePopulated(DebugLevel):
+    def code(self) -> str:
+        return "Q051"
+
+    def message(self) -> str:
+        scope = "selected nodes" if self.selected_only else "all nodes"
+        return (
+            f"Populated the relation cache for {scope} with {self.num_relations} relations "
+            f"in {self.num_schemas} schemas in {self.elapsed:.2f}s"
+        )
+
+
 # =======================================================
 # W - Node testing
 # =======================================================
@@ -2228,3 +2303,14 @@ class ArtifactUploadSkipped(DebugLevel):
 
     def message(self) -> str:
         return f"Artifacts skipped for command : {self.msg}"
+
+
+class LogEventsDropped(WarnLevel):
+    def code(self) -> str:
+        return "Z064"
+
+    def message(self) -> str:
+        return (
+            f"{self.count} debug level events were not logged because the event queue was "
+            "full. Use a larger --log-queue-size, or --log-queue-full block, to log them."
+        )
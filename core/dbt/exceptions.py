@@ -98,6 +98,15 @@ class FailFastError(DbtRuntimeError):
         return "FailFast"
 
 
+class ProcessPoolCompilationError(DbtRuntimeError):
+    """An error raised while compiling a node in a process pool worker, which
+    the worker sends back already formatted.
+    """
+
+    def __str__(self, prefix: str = "! ") -> str:
+        return self.msg
+
+
 class DbtProjectError(DbtConfigError):
     pass
 
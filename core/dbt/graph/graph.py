@@ -68,12 +68,9 @@ class Graph:
             next_layer: Set[UniqueId] = set()
             for node in selected:
                 next_layer.update(
-                    iter(
-                        e[1]
-                        for e in self.graph.out_edges(node)
-                        if e[1] not in children
-                        and self.filter_edges_by_type(e[0], e[1], "parent_test")
-                    )
+                    child
+                    for child, edge in self.graph.succ[node].items()
+                    if child not in children and edge.get("edge_type") != "parent_test"
                 )
             children.update(next_layer)
             selected = next_layer
@@ -93,12 +90,9 @@ class Graph:
             next_layer: Set[UniqueId] = set()
             for node in selected:
                 next_layer.update(
-                    iter(
-                        e[0]
-                        for e in self.graph.in_edges(node)
-                        if e[0] not in parents
-                        and self.filter_edges_by_type(e[0], e[1], "parent_test")
-                    )
+                    parent
+                    for parent, edge in self.graph.pred[node].items()
+                    if parent not in parents and edge.get("edge_type") != "parent_test"
                 )
             parents.update(next_layer)
             selected = next_layer
@@ -165,8 +159,26 @@ class Graph:
 
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
         # Take the original networkx graph and return a subgraph containing only
-        # the selected unique_id nodes.
-        return Graph(self.graph.subgraph(nodes))
+        # the selected unique_id nodes. The subgraph is copied rather than being
+        # a view of the original graph, as every neighbor of every node visited
+        # in a view is filtered, which is slow when selecting from large graphs.
+        include_nodes = set(nodes)
+        if len(include_nodes) == len(self.graph) and all(
+            node in self.graph for node in include_nodes
+        ):
+            return Graph(self.graph)
+        new_graph = nx.DiGraph()
+        new_graph.add_nodes_from(
+            (node, data) for node, data in self.graph.nodes(data=True) if node in include_nodes
+        )
+        new_graph.add_edges_from(
+            (parent, child, data)
+            for parent, children in self.graph.adjacency()
+            if parent in include_nodes
+            for child, data in children.items()
+            if child in include_nodes
+        )
+        return Graph(new_graph)
 
     def get_dependent_nodes(self, node: UniqueId):
         return nx.descendants(self.graph, node)
@@ -145,6 +145,12 @@ class GraphQueue:
         with self.lock:
             return len(self.graph) - len(self.in_progress)
 
+    def ready_count(self) -> int:
+        """The number of nodes whose dependencies are all done, waiting in the
+        queue to be handed out.
+        """
+        return self.inner.qsize()
+
     def empty(self) -> bool:
         """The graph queue is 'empty' if it all remaining nodes in the graph
         are in progress.
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import msgpack
+
+from dbt.constants import RUN_RESULTS_FILE_NAME, SOURCE_RESULT_FILE_NAME
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.state import PreviousState
+from dbt.version import __version__
+from dbt_common.clients.system import make_directory
+from dbt_common.events.contextvars import get_project_root
+
+from .graph import UniqueId
+from .selector_methods import MethodName
+from .selector_spec import SelectionCriteria, SelectionSpec
+
+# Selections are small, but a target directory used by an orchestrator can see
+# many different ones. Only the most recently used are kept.
+MAX_ENTRIES = 100
+
+
+def manifest_checksum(manifest: Manifest) -> Optional[str]:
+    """A checksum of everything the nodes of a parsed manifest were built
+    from: the contents of each file, the vars, profile and project config,
+    and the env vars read while parsing. Returns None for a manifest that
+    wasn't parsed from files, such as one read from manifest.json.
+    """
+    if not manifest.files:
+        return None
+    hasher = hashlib.sha256(__version__.encode())
+    state_check = manifest.state_check
+    for file_hash in (
+        state_check.vars_hash,
+        state_check.project_env_vars_hash,
+        state_check.profile_env_vars_hash,
+        state_check.profile_hash,
+    ):
+        hasher.update(file_hash.checksum.encode())
+    for name, file_hash in sorted(state_check.project_hashes.items()):
+        hasher.update(f"\0{name}\0{file_hash.checksum}".encode())
+    for name, value in sorted(manifest.env_vars.items()):
+        hasher.update(f"\0{name}\0{value}".encode())
+    for file_id, source_file in sorted(manifest.files.items()):
+        hasher.update(f"\0{file_id}\0{source_file.checksum.checksum}".encode())
+    # nodes can be added to a manifest after parsing, e.g. inline sql
+    for resources in (
+        manifest.nodes,
+        manifest.sources,
+        manifest.exposures,
+        manifest.metrics,
+        manifest.semantic_models,
+        manifest.saved_queries,
+        manifest.unit_tests,
+    ):
+        for unique_id in sorted(resources):
+            hasher.update(f"\0{unique_id}".encode())
+    return hasher.hexdigest()
+
+
+def state_checksum(previous_state: Optional[PreviousState]) -> str:
+    """A checksum of the artifacts the state, result and source_status
+    selector methods compare against, from their size and modification time.
+    """
+    if previous_state is None:
+        return ""
+    state_path = previous_state.project_root / previous_state.state_path
+    target_path = previous_state.project_root / previous_state.target_path
+    paths = [
+        state_path / "manifest.json",
+        state_path / RUN_RESULTS_FILE_NAME,
+        state_path / SOURCE_RESULT_FILE_NAME,
+        target_path / SOURCE_RESULT_FILE_NAME,
+    ]
+    fingerprints = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            fingerprints.append([str(path), None])
+        else:
+            fingerprints.append([str(path), stat.st_size, stat.st_mtime_ns])
+    return hashlib.sha256(json.dumps(fingerprints).encode()).hexdigest()
+
+
+def spec_key(spec: SelectionSpec) -> List[Any]:
+    """A representation of a selection spec that is equal for two specs that
+    select the same nodes and fire the same warnings.
+    """
+    if isinstance(spec, SelectionCriteria):
+        return [
+            "criteria",
+            str(spec.method),
+            spec.method_arguments,
+            spec.value,
+            spec.childrens_parents,
+            spec.parents,
+            spec.parents_depth,
+            spec.children,
+            spec.children_depth,
+            str(spec.indirect_selection),
+        ]
+    return [
+        type(spec).__name__,
+        str(spec.indirect_selection),
+        spec.expect_exists,
+        str(spec.raw),
+        [spec_key(component) for component in spec],
+    ]
+
+
+def uses_state_method(spec: SelectionSpec) -> bool:
+    """Whether any part of a selection spec uses the state method."""
+    if isinstance(spec, SelectionCriteria):
+        return spec.method == MethodName.State
+    return any(uses_state_method(component) for component in spec)
+
+
+class SelectionCache:
+    """The nodes selected by previous invocations, persisted in the target
+    directory so that running the same selection against the same project
+    doesn't have to select them again.
+
+    Entries are keyed by the checksum of the manifest the graph was built
+    from, the checksum of the state artifacts, the task running the
+    selection, the selector's settings and the resolved selection spec,
+    which includes the indirect selection mode of each of its parts. Any
+    NoNodesForSelectionCriteria warnings fired by the selection are stored
+    with it, so that they can be fired again when it is reused. Selections
+    that use the state method aren't cached at all, since comparing nodes
+    with the previous state can fire other warnings, such as
+    UnversionedBreakingChange, that --warn-error has to see every time.
+    """
+
+    def __init__(self, path: str, context: str) -> None:
+        self.path = path
+        self.context = context
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+
+    @classmethod
+    def from_file(cls, path: str, context: str) -> "SelectionCache":
+        cache = cls(path, context)
+        if not os.path.exists(path):
+            return cache
+        try:
+            with open(path, "rb") as fp:
+                data = msgpack.unpackb(fp.read(), raw=False)
+            if data["dbt_version"] == __version__:
+                cache._entries = data["entries"]
+        except Exception:
+            cache._entries = {}
+        return cache
+
+    @classmethod
+    def for_task(
+        cls,
+        path: str,
+        task_name: str,
+        manifest: Manifest,
+        previous_state: Optional[PreviousState],
+    ) -> Optional["SelectionCache"]:
+        """Return the cache for a task selecting from `manifest`, or None if
+        the manifest can't be checksummed.
+        """
+        checksum = manifest_checksum(manifest)
+        if checksum is None:
+            return None
+        # the path method resolves paths against the project root
+        project_root = get_project_root() or str(Path.cwd())
+        context = json.dumps([checksum, state_checksum(previous_state), task_name, project_root])
+        return cls.from_file(path, context)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, selector: Any, spec: SelectionSpec) -> str:
+        selector_key = [
+            f"{type(selector).__module__}.{type(selector).__qualname__}",
+            selector.include_empty_nodes,
+            sorted(str(t) for t in getattr(selector, "resource_types", ())),
+        ]
+        key = json.dumps([self.context, selector_key, spec_key(spec)], default=str)
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Set[UniqueId], List[str]]]:
+        """Return the selected unique ids and the raw specs that matched no
+        nodes, or None if the selection isn't cached.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        # keep the most recently used entries last, without writing the
+        # cache just to reorder them
+        self._entries[key] = entry
+        return set(entry["selected"]), entry["no_nodes"]
+
+    def add(self, key: str, selected: Set[UniqueId], no_nodes: List[str]) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = {"selected": sorted(selected), "no_nodes": no_nodes}
+        while len(self._entries) > MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+        self._dirty = True
+
+    def write(self) -> None:
+        """Write the cache, if anything changed."""
+        if not self._dirty:
+            return
+        make_directory(os.path.dirname(self.path))
+        with open(self.path, "wb") as fp:
+            fp.write(
+                msgpack.packb(
+                    {"dbt_version": __version__, "entries": self._entries}, use_bin_type=True
+                )
+            )
+        self._dirty = False
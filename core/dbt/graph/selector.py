@@ -1,4 +1,5 @@
-from typing import List, Optional, Set, Tuple
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from dbt import selected_resources
 from dbt.contracts.graph.manifest import Manifest
@@ -11,8 +12,15 @@ from dbt_common.events.functions import fire_event, warn_or_error
 
 from .graph import Graph, UniqueId
 from .queue import GraphQueue
+from .selection_cache import SelectionCache, spec_key, uses_state_method
 from .selector_methods import MethodManager
-from .selector_spec import IndirectSelection, SelectionCriteria, SelectionSpec
+from .selector_spec import (
+    BaseSelectionGroup,
+    IndirectSelection,
+    SelectionCriteria,
+    SelectionSpec,
+    SelectionUnion,
+)
 
 
 def get_package_names(nodes):
@@ -46,6 +54,12 @@ class NodeSelector(MethodManager):
         super().__init__(manifest, previous_state)
         self.full_graph: Graph = graph
         self.include_empty_nodes: bool = include_empty_nodes
+        # set by tasks that persist their selections between invocations
+        self.selection_cache: Optional[SelectionCache] = None
+        # the raw specs that matched no nodes, and whether an invalid
+        # selector was reported, while selecting
+        self._no_nodes_specs: List[str] = []
+        self._reported_invalid_selector = False
 
         # build a subgraph containing only non-empty, enabled nodes and enabled
         # sources.
@@ -53,6 +67,13 @@ class NodeSelector(MethodManager):
             unique_id for unique_id in self.full_graph.nodes() if self._is_graph_member(unique_id)
         }
         self.graph = self.full_graph.subgraph(graph_members)
+        # every criteria selects from all of the graph's nodes, which the
+        # selector methods only read
+        self._graph_nodes: Set[UniqueId] = graph_members
+        # the nodes selected by each criteria, as the same criteria can
+        # appear more than once in a spec, e.g. in yaml selectors that
+        # include other selectors
+        self._criteria_selections: Dict[str, Tuple[Set[UniqueId], Set[UniqueId]]] = {}
 
     def select_included(
         self,
@@ -73,11 +94,29 @@ class NodeSelector(MethodManager):
         - collect the directly included nodes
         - find their specified relatives
         - perform any selector-specific expansion
+
+        Selections are kept for the lifetime of the selector, and copies are
+        returned for criteria that were already selected.
         """
+        key = json.dumps(spec_key(spec), default=str)
+        if key in self._criteria_selections:
+            direct_nodes, indirect_nodes = self._criteria_selections[key]
+            return set(direct_nodes), set(indirect_nodes)
+
+        collected = self.collect_included(spec)
+        if collected is None:
+            return set(), set()
+
+        direct_nodes, indirect_nodes = self.expand_collected(spec, collected)
+        self._criteria_selections[key] = (direct_nodes, indirect_nodes)
+        return set(direct_nodes), set(indirect_nodes)
 
-        nodes = self.graph.nodes()
+    def collect_included(self, spec: SelectionCriteria) -> Optional[Set[UniqueId]]:
+        """Select the nodes included by the criteria's method, or report the
+        criteria and return None if its method is invalid.
+        """
         try:
-            collected = self.select_included(nodes, spec)
+            return self.select_included(self._graph_nodes, spec)
         except InvalidSelectorError:
             valid_selectors = ", ".join(self.SELECTOR_METHODS)
             fire_event(
@@ -85,8 +124,15 @@ class NodeSelector(MethodManager):
                     valid_selectors=valid_selectors, spec_method=spec.method, raw_spec=spec.raw
                 )
             )
-            return set(), set()
+            self._reported_invalid_selector = True
+            return None
 
+    def expand_collected(
+        self, spec: SelectionCriteria, collected: Set[UniqueId]
+    ) -> Tuple[Set[UniqueId], Set[UniqueId]]:
+        """Apply the criteria's graph operators and indirect selection to the
+        nodes its method collected.
+        """
         neighbors = self.collect_specified_neighbors(spec, collected)
         selected = collected | neighbors
 
@@ -99,6 +145,55 @@ class NodeSelector(MethodManager):
             )
             return direct_nodes, indirect_nodes
 
+    def select_union_criteria(
+        self, components: List[SelectionSpec]
+    ) -> Tuple[List[SelectionSpec], List[Tuple[Set[UniqueId], Set[UniqueId]]]]:
+        """Select the eager and empty criteria of a union, including those
+        that are the only component of a group, such as each of the
+        space-separated specs passed to --select. Returns the components
+        left to select and the selections of the ones that were.
+
+        Selecting the parents or children of a set of nodes selects the same
+        nodes as selecting them for each node and combining the results, and
+        so does eager or empty indirect selection. The nodes collected by
+        criteria with the same graph operators and indirect selection are
+        expanded together, walking the graph once instead of once for each
+        criteria.
+        """
+        remaining: List[SelectionSpec] = []
+        batches: Dict[Tuple[Any, ...], Tuple[SelectionCriteria, Set[UniqueId]]] = {}
+        for component in components:
+            criteria = component
+            if isinstance(component, BaseSelectionGroup) and len(component.components) == 1:
+                criteria = component.components[0]
+            if not isinstance(criteria, SelectionCriteria) or criteria.indirect_selection not in (
+                IndirectSelection.Eager,
+                IndirectSelection.Empty,
+            ):
+                remaining.append(component)
+                continue
+            collected = self.collect_included(criteria)
+            # the criteria selects nothing if its method collects nothing
+            if not collected:
+                if isinstance(component, BaseSelectionGroup) and component.expect_exists:
+                    self.warn_no_nodes(component)
+                continue
+            operators = (
+                criteria.childrens_parents,
+                criteria.parents,
+                criteria.parents_depth,
+                criteria.children,
+                criteria.children_depth,
+                criteria.indirect_selection,
+            )
+            batches.setdefault(operators, (criteria, set()))[1].update(collected)
+
+        bundles = [
+            self.expand_collected(component, collected)
+            for component, collected in batches.values()
+        ]
+        return remaining, bundles
+
     def collect_specified_neighbors(
         self, spec: SelectionCriteria, selected: Set[UniqueId]
     ) -> Set[UniqueId]:
@@ -128,7 +223,11 @@ class NodeSelector(MethodManager):
         if isinstance(spec, SelectionCriteria):
             direct_nodes, indirect_nodes = self.get_nodes_from_criteria(spec)
         else:
-            bundles = [self.select_nodes_recursively(component) for component in spec]
+            components = spec.components
+            bundles = []
+            if isinstance(spec, SelectionUnion):
+                components, bundles = self.select_union_criteria(components)
+            bundles.extend(self.select_nodes_recursively(component) for component in components)
 
             direct_sets = []
             indirect_sets = []
@@ -145,10 +244,14 @@ class NodeSelector(MethodManager):
             )
 
             if spec.expect_exists and len(direct_nodes) == 0:
-                warn_or_error(NoNodesForSelectionCriteria(spec_raw=str(spec.raw)))
+                self.warn_no_nodes(spec)
 
         return direct_nodes, indirect_nodes
 
+    def warn_no_nodes(self, spec: BaseSelectionGroup) -> None:
+        self._no_nodes_specs.append(str(spec.raw))
+        warn_or_error(NoNodesForSelectionCriteria(spec_raw=str(spec.raw)))
+
     def select_nodes(self, spec: SelectionSpec) -> Tuple[Set[UniqueId], Set[UniqueId]]:
         """Select the nodes in the graph according to the spec.
 
@@ -273,13 +376,14 @@ class NodeSelector(MethodManager):
                 # (Does not include unit tests because they can only have one parent.)
                 if can_select_indirectly(node):
                     # should we add it in directly?
-                    if indirect_selection == IndirectSelection.Eager or set(
+                    if indirect_selection == IndirectSelection.Eager or selected.issuperset(
                         node.depends_on_nodes
-                    ) <= set(selected):
+                    ):
                         direct_nodes.add(unique_id)
-                    elif indirect_selection == IndirectSelection.Buildable and set(
-                        node.depends_on_nodes
-                    ) <= set(selected_and_parents):
+                    elif (
+                        indirect_selection == IndirectSelection.Buildable
+                        and selected_and_parents.issuperset(node.depends_on_nodes)
+                    ):
                         direct_nodes.add(unique_id)
                     elif indirect_selection == IndirectSelection.Empty:
                         pass
@@ -307,14 +411,14 @@ class NodeSelector(MethodManager):
             for unique_id in indirect_nodes:
                 if unique_id in self.manifest.nodes:
                     node = self.manifest.nodes[unique_id]
-                    if set(node.depends_on_nodes) <= set(selected):
+                    if selected.issuperset(node.depends_on_nodes):
                         selected.add(unique_id)
         elif indirect_selection == IndirectSelection.Buildable:
             selected_and_parents = selected.union(self.graph.select_parents(selected))
             for unique_id in indirect_nodes:
                 if unique_id in self.manifest.nodes:
                     node = self.manifest.nodes[unique_id]
-                    if set(node.depends_on_nodes) <= set(selected_and_parents):
+                    if selected_and_parents.issuperset(node.depends_on_nodes):
                         selected.add(unique_id)
 
         return selected
@@ -328,9 +432,30 @@ class NodeSelector(MethodManager):
         - filtering:
             - selectors can filter the nodes after all of them have been
               selected
+
+        If the selector has a selection cache, a selection cached by a
+        previous invocation is returned without selecting it again. Selections
+        that compare against the previous state are never cached.
         """
+        if self.selection_cache is None or uses_state_method(spec):
+            selected_nodes, indirect_only = self.select_nodes(spec)
+            return self.filter_selection(selected_nodes)
+
+        key = self.selection_cache.key(self, spec)
+        cached = self.selection_cache.get(key)
+        if cached is not None:
+            filtered_nodes, no_nodes_specs = cached
+            for spec_raw in no_nodes_specs:
+                warn_or_error(NoNodesForSelectionCriteria(spec_raw=spec_raw))
+            return filtered_nodes
+
+        self._no_nodes_specs = []
+        self._reported_invalid_selector = False
         selected_nodes, indirect_only = self.select_nodes(spec)
         filtered_nodes = self.filter_selection(selected_nodes)
+        # invalid selectors are better fixed than cached
+        if not self._reported_invalid_selector:
+            self.selection_cache.add(key, filtered_nodes, self._no_nodes_specs)
 
         return filtered_nodes
 
@@ -1,13 +1,20 @@
 import abc
+import os
+import posixpath
+from collections import defaultdict
+from fnmatch import filter as fnmatch_filter
 from fnmatch import fnmatch
-from itertools import chain
+from itertools import chain, takewhile
 from pathlib import Path
 from typing import (
     Any,
     Callable,
+    DefaultDict,
     Dict,
+    Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
     Set,
     Tuple,
@@ -40,6 +47,7 @@ from .graph import UniqueId
 
 SELECTOR_GLOB = "*"
 SELECTOR_DELIMITER = ":"
+WILDCARD_CHARS = ("*", "?", "[", "]")
 
 
 class MethodName(StrEnum):
@@ -86,7 +94,7 @@ def is_selected_node(fqn: List[str], node_selector: str, is_versioned: bool) ->
 
     slurp_from_ix: Optional[int] = None
     for i, selector_part in enumerate(node_selector.split(".")):
-        if any(wildcard in selector_part for wildcard in ("*", "?", "[", "]")):
+        if any(wildcard in selector_part for wildcard in WILDCARD_CHARS):
             slurp_from_ix = i
             break
         elif flat_fqn[i] == selector_part:
@@ -108,6 +116,18 @@ def is_selected_node(fqn: List[str], node_selector: str, is_versioned: bool) ->
     return True
 
 
+def matching_ids(index: Mapping[str, Set[str]], pattern: str) -> Set[UniqueId]:
+    """The ids of every key in index that fnmatch matches to pattern. Patterns
+    without wildcards, which fnmatch compares exactly outside of Windows, are
+    looked up; other patterns are matched once per key.
+    """
+    if os.path is posixpath and not any(wildcard in pattern for wildcard in WILDCARD_CHARS):
+        keys: Iterable[str] = [pattern] if pattern in index else []
+    else:
+        keys = fnmatch_filter(index, pattern)
+    return {UniqueId(unique_id) for key in keys for unique_id in index[key]}
+
+
 SelectorTarget = Union[
     SourceDefinition, ManifestNode, Exposure, Metric, SemanticModel, UnitTestDefinition, SavedQuery
 ]
@@ -223,6 +243,19 @@ class SelectorMethod(metaclass=abc.ABCMeta):
             self.saved_query_nodes(included_nodes),
         )
 
+    def non_source_node(self, unique_id: str) -> Union[Exposure, ManifestNode, Metric]:
+        for nodes in (
+            self.manifest.nodes,
+            self.manifest.exposures,
+            self.manifest.metrics,
+            self.manifest.unit_tests,
+            self.manifest.semantic_models,
+            self.manifest.saved_queries,
+        ):
+            if unique_id in nodes:
+                return nodes[unique_id]  # type: ignore[return-value]
+        raise DbtInternalError(f"Node {unique_id} not found in manifest")
+
     def groupable_nodes(
         self,
         included_nodes: Set[UniqueId],
@@ -259,32 +292,49 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 
         return False
 
+    def candidates(self, selector: str) -> Set[str]:
+        """The non-source nodes the selector could match: those it names, those
+        whose fqn starts with the parts before its first wildcard, and the
+        versioned models, whose names can be matched in several ways.
+        """
+        index = self.manifest.selector_index
+        prefix = tuple(
+            takewhile(
+                lambda part: not any(wildcard in part for wildcard in WILDCARD_CHARS),
+                selector.split("."),
+            )
+        )
+        if not prefix:
+            return index.non_source
+        return (
+            index.fqn_prefixes.get(prefix, set())
+            | index.fqn_names.get(selector, set())
+            | index.versioned
+        )
+
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yield all nodes in the graph that match the selector.
 
         :param str selector: The selector or node name
         """
-        non_source_nodes = list(self.non_source_nodes(included_nodes))
-        for unique_id, node in non_source_nodes:
+        for unique_id in self.candidates(selector):
+            if unique_id not in included_nodes:
+                continue
+            node = self.non_source_node(unique_id)
             if self.node_is_match(selector, node.fqn, node.is_versioned):
-                yield unique_id
+                yield UniqueId(unique_id)
 
 
 class TagSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included that have the specified tag"""
-        for unique_id, node in self.all_nodes(included_nodes):
-            if hasattr(node, "tags") and any(fnmatch(tag, selector) for tag in node.tags):
-                yield unique_id
+        yield from matching_ids(self.manifest.selector_index.tags, selector) & included_nodes
 
 
 class GroupSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included in the specified group"""
-        for unique_id, node in self.groupable_nodes(included_nodes):
-            node_group = node.config.get("group")
-            if node_group and fnmatch(node_group, selector):
-                yield unique_id
+        yield from matching_ids(self.manifest.selector_index.groups, selector) & included_nodes
 
 
 class AccessSelectorMethod(SelectorMethod):
@@ -452,7 +502,96 @@ class UnitTestSelectorMethod(SelectorMethod):
             yield unique_id
 
 
+class PathTrie:
+    """The files under a project root and the directories containing them, as
+    nested dicts keyed by path part. Files have no children.
+    """
+
+    def __init__(self) -> None:
+        self.root: Dict[str, Any] = {}
+
+    def add(self, path: Path) -> None:
+        children = self.root
+        for part in path.parts:
+            children = children.setdefault(part, {})
+
+    def glob(self, pattern: Tuple[str, ...]) -> Set[Path]:
+        """The paths Path.glob would find for the pattern's parts. Like it,
+        a pattern ending in "**" matches directories only.
+        """
+        matches: Set[Path] = set()
+        self._glob(Path(), self.root, pattern, matches)
+        return matches
+
+    def _glob(
+        self, path: Path, children: Dict[str, Any], pattern: Tuple[str, ...], matches: Set[Path]
+    ) -> None:
+        if not pattern:
+            matches.add(path)
+            return
+        part, rest = pattern[0], pattern[1:]
+        if part == "**":
+            for directory, directory_children in self._directories(path, children):
+                if rest:
+                    self._glob(directory, directory_children, rest, matches)
+                else:
+                    matches.add(directory)
+            return
+        if any(wildcard in part for wildcard in ("*", "?", "[")):
+            names: Iterable[str] = fnmatch_filter(children, part)
+        else:
+            names = [part] if part in children else []
+        for name in names:
+            # only directories can match a part that isn't the last one
+            if not rest or children[name]:
+                self._glob(path / name, children[name], rest, matches)
+
+    def _directories(
+        self, path: Path, children: Dict[str, Any]
+    ) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+        yield path, children
+        for name, grandchildren in children.items():
+            if grandchildren:
+                yield from self._directories(path / name, grandchildren)
+
+
 class PathSelectorMethod(SelectorMethod):
+    def file_paths(self, root: Path) -> Optional[PathTrie]:
+        """The paths of the files in the manifest under root, or None if it has
+        none there.
+        """
+        file_paths = self.manifest.selector_index.file_paths
+        if root not in file_paths:
+            resolved_root = root.resolve()
+            resolved_project_roots: Dict[str, Path] = {}
+            trie = None
+            for source_file in self.manifest.files.values():
+                project_root = source_file.path.project_root
+                if project_root not in resolved_project_roots:
+                    resolved_project_roots[project_root] = Path(project_root).resolve()
+                if resolved_project_roots[project_root] == resolved_root:
+                    trie = trie or PathTrie()
+                    trie.add(Path(source_file.path.original_file_path))
+            file_paths[root] = trie
+        return file_paths[root]
+
+    def matching_paths(self, root: Path, selector: str) -> Set[Path]:
+        pattern = Path(selector).parts
+        trie = self.file_paths(root)
+        # Matching is done against the paths of the parsed files, unless there
+        # are none, or the pattern isn't one that can be matched without the
+        # filesystem. Path.glob is case-insensitive on Windows.
+        if (
+            trie is None
+            or os.path is not posixpath
+            or not pattern
+            or Path(selector).is_absolute()
+            or ".." in pattern
+            or any("**" in part and part != "**" for part in pattern)
+        ):
+            return set(p.relative_to(root) for p in root.glob(selector))
+        return trie.glob(pattern)
+
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yields nodes from included that match the given path."""
         # get project root from contextvar
@@ -461,7 +600,7 @@ class PathSelectorMethod(SelectorMethod):
             root = Path(project_root)
         else:
             root = Path.cwd()
-        paths = set(p.relative_to(root) for p in root.glob(selector))
+        paths = self.matching_paths(root, selector)
         for unique_id, node in self.all_nodes(included_nodes):
             ofp = Path(node.original_file_path)
             if ofp in paths:
@@ -492,9 +631,7 @@ class PackageSelectorMethod(SelectorMethod):
         if selector == "this" and self.manifest.metadata.project_name is not None:
             selector = self.manifest.metadata.project_name
 
-        for unique_id, node in self.all_nodes(included_nodes):
-            if fnmatch(node.package_name, selector):
-                yield unique_id
+        yield from matching_ids(self.manifest.selector_index.packages, selector) & included_nodes
 
 
 def _getattr_descend(obj: Any, attrs: List[str]) -> Any:
@@ -521,7 +658,80 @@ class CaseInsensitive(str):
             return self.upper() == other
 
 
+def _config_value_matches(selector: Any, value: Any) -> bool:
+    if isinstance(value, list):
+        return (
+            (selector in value)
+            or (CaseInsensitive(selector) == "true" and True in value)
+            or (CaseInsensitive(selector) == "false" and False in value)
+        )
+    else:
+        return (
+            (selector == value)
+            or (CaseInsensitive(selector) == "true" and value is True)
+            or (CaseInsensitive(selector) == "false")
+            and value is False
+        )
+
+
+class ConfigValueIndex:
+    """The nodes and sources with each value of one config. Strings and
+    booleans are looked up. The few nodes with other values, which could
+    compare equal to a string in other ways, are checked one by one.
+    """
+
+    def __init__(self, case_insensitive: bool) -> None:
+        self.case_insensitive = case_insensitive
+        self.strings: DefaultDict[str, Set[UniqueId]] = defaultdict(set)
+        self.true: Set[UniqueId] = set()
+        self.false: Set[UniqueId] = set()
+        self.others: List[Tuple[UniqueId, Any]] = []
+
+    def add(self, unique_id: UniqueId, value: Any) -> None:
+        values = value if isinstance(value, list) else [value]
+        if not all(v is None or type(v) in (str, bool) for v in values):
+            self.others.append((unique_id, value))
+            return
+        for v in values:
+            if v is True:
+                self.true.add(unique_id)
+            elif v is False:
+                self.false.add(unique_id)
+            elif v is not None:
+                self.strings[v.upper() if self.case_insensitive else v].add(unique_id)
+
+    def search(self, selector: Any) -> Set[UniqueId]:
+        key = selector.upper() if self.case_insensitive else selector
+        matched = set(self.strings.get(key, set()))
+        if CaseInsensitive(selector) == "true":
+            matched |= self.true
+        if CaseInsensitive(selector) == "false":
+            matched |= self.false
+        matched.update(
+            unique_id for unique_id, value in self.others if _config_value_matches(selector, value)
+        )
+        return matched
+
+
 class ConfigSelectorMethod(SelectorMethod):
+    def config_value_index(self, parts: List[str]) -> ConfigValueIndex:
+        config_values = self.manifest.selector_index.config_values
+        if tuple(parts) not in config_values:
+            index = ConfigValueIndex(case_insensitive=parts == ["severity"])
+            # search sources is kind of useless now source configs only have
+            # 'enabled', which you can't really filter on anyway, but maybe we'll
+            # add more someday, so search them anyway.
+            for unique_id, node in chain(
+                self.manifest.nodes.items(), self.manifest.sources.items()
+            ):
+                try:
+                    value = _getattr_descend(node.config, parts)
+                except AttributeError:
+                    continue
+                index.add(UniqueId(unique_id), value)
+            config_values[tuple(parts)] = index
+        return config_values[tuple(parts)]
+
     def search(
         self,
         included_nodes: Set[UniqueId],
@@ -533,30 +743,7 @@ class ConfigSelectorMethod(SelectorMethod):
         if parts == ["severity"]:
             selector = CaseInsensitive(selector)
 
-        # search sources is kind of useless now source configs only have
-        # 'enabled', which you can't really filter on anyway, but maybe we'll
-        # add more someday, so search them anyway.
-        for unique_id, node in self.configurable_nodes(included_nodes):
-            try:
-                value = _getattr_descend(node.config, parts)
-            except AttributeError:
-                continue
-            else:
-                if isinstance(value, list):
-                    if (
-                        (selector in value)
-                        or (CaseInsensitive(selector) == "true" and True in value)
-                        or (CaseInsensitive(selector) == "false" and False in value)
-                    ):
-                        yield unique_id
-                else:
-                    if (
-                        (selector == value)
-                        or (CaseInsensitive(selector) == "true" and value is True)
-                        or (CaseInsensitive(selector) == "false")
-                        and value is False
-                    ):
-                        yield unique_id
+        yield from self.config_value_index(parts).search(selector) & included_nodes
 
 
 class ResourceTypeSelectorMethod(SelectorMethod):
@@ -565,9 +752,10 @@ class ResourceTypeSelectorMethod(SelectorMethod):
             resource_type = NodeType(selector)
         except ValueError as exc:
             raise DbtRuntimeError(f'Invalid resource_type selector "{selector}"') from exc
-        for unique_id, node in self.all_nodes(included_nodes):
-            if node.resource_type == resource_type:
-                yield unique_id
+        resource_type_ids = self.manifest.selector_index.resource_types.get(resource_type, set())
+        for unique_id in resource_type_ids:
+            if unique_id in included_nodes:
+                yield UniqueId(unique_id)
 
 
 class TestNameSelectorMethod(SelectorMethod):
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
 from multiprocessing.pool import ThreadPool
+from typing import List, Optional, Tuple
+
+from dbt_common.exceptions import DbtInternalError
 
 
 class DbtThreadPool(ThreadPool):
@@ -16,3 +22,125 @@ class DbtThreadPool(ThreadPool):
 
     def is_closed(self):
         return self.closed
+
+
+class DbtProcessPool(ProcessPoolExecutor):
+    """A ProcessPoolExecutor for CPU-bound work. Workers are forked, so they
+    inherit a snapshot of the parent's state (such as the manifest) and the
+    initializer arguments are never pickled.
+
+    A forked worker only has the thread that forked it, but gets a copy of
+    every lock, including those held by other threads at the time (e.g. the
+    event queue of --log-async or a connection lock). Such a lock is never
+    released in the worker, so the pool can only be started while the caller
+    is the only running thread.
+    """
+
+    def __init__(self, max_workers, initializer=None, initargs=()):
+        running_threads = self.running_threads()
+        if running_threads:
+            raise DbtInternalError(
+                f"Cannot fork a process pool while other threads are running: "
+                f"{', '.join(running_threads)}"
+            )
+        super().__init__(
+            max_workers,
+            mp_context=get_context("fork"),
+            initializer=initializer,
+            initargs=initargs,
+        )
+        # All workers are forked by the first submission. Do that now, before
+        # the executor's own management thread and the caller's thread pool
+        # are running.
+        self.submit(int).result()
+
+    @staticmethod
+    def is_supported() -> bool:
+        return "fork" in get_all_start_methods()
+
+    @staticmethod
+    def running_threads() -> List[str]:
+        """The names of the running threads other than the current one."""
+        current = threading.current_thread()
+        return [thread.name for thread in threading.enumerate() if thread is not current]
+
+
+class AdaptiveConcurrency:
+    """Limits how many nodes are executed at once to a value between
+    min_threads and max_threads, adjusted every time a node finishes.
+
+    The limit starts at min_threads and grows by one while every permit is in
+    use and more nodes are ready to run, up to max_threads. It shrinks
+    multiplicatively when the recent latency of nodes rises well above the
+    long-running average, which is how warehouse queueing and overload show
+    up from the client's side. After shrinking, the nodes that were already
+    running are allowed to finish before the limit can shrink again.
+    """
+
+    def __init__(
+        self,
+        min_threads: int,
+        max_threads: int,
+        tolerance: float = 2.0,
+        backoff: float = 0.75,
+    ) -> None:
+        self.min_threads = max(1, min(min_threads, max_threads))
+        self.max_threads = max(1, max_threads)
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.limit = self.min_threads
+        self.active = 0
+        # exponentially weighted moving averages of node latency
+        self.short_latency: Optional[float] = None
+        self.long_latency: Optional[float] = None
+        self._cooldown = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until fewer than `limit` nodes are executing, then take a permit."""
+        with self._cond:
+            while self.active >= self.limit:
+                self._cond.wait()
+            self.active += 1
+
+    def release(self, latency: Optional[float], ready: int) -> Tuple[int, int, str]:
+        """Return a permit after a node finished in `latency` seconds (None if
+        it was not executed), while `ready` nodes were waiting to be run, and
+        adjust the limit.
+
+        Returns the previous limit, the new limit and the reason for it.
+        """
+        with self._cond:
+            saturated = self.active >= self.limit
+            self.active -= 1
+            if latency is not None:
+                self._observe(latency)
+
+            previous = self.limit
+            if self._cooldown > 0:
+                self._cooldown -= 1
+                reason = "cooling down"
+            elif self._latency_increased():
+                self.limit = max(self.min_threads, int(self.limit * self.backoff))
+                self._cooldown = self.active
+                reason = "latency increased"
+            elif saturated and ready > 0 and self.limit < self.max_threads:
+                self.limit = min(self.max_threads, self.limit + 1)
+                reason = "nodes waiting"
+            else:
+                reason = "steady"
+
+            self._cond.notify_all()
+            return previous, self.limit, reason
+
+    def _latency_increased(self) -> bool:
+        if self.short_latency is None or self.long_latency is None:
+            return False
+        return self.short_latency > self.long_latency * self.tolerance
+
+    def _observe(self, latency: float) -> None:
+        if self.short_latency is None or self.long_latency is None:
+            self.short_latency = self.long_latency = latency
+        else:
+            self.short_latency = 0.5 * self.short_latency + 0.5 * latency
+            self.long_latency = 0.9 * self.long_latency + 0.1 * latency
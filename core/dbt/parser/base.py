@@ -27,6 +27,7 @@ from dbt.flags import get_flags
 from dbt.node_types import AccessType, ModelLanguage, NodeType
 from dbt.parser.common import resource_types_to_schema_file_keys
 from dbt.parser.search import FileBlock
+from dbt.profiler import parse_step_timing
 from dbt_common.dataclass_schema import ValidationError
 from dbt_common.utils import deep_merge
 
@@ -264,11 +265,12 @@ class ConfiguredParser(
         # Given the parsed node and a ContextConfig to use during parsing,
         # render the node's sql with macro capture enabled.
         # Note: this mutates the config object when config calls are rendered.
-        context = self._context_for(parsed_node, config)
+        with parse_step_timing("render"):
+            context = self._context_for(parsed_node, config)
 
-        # this goes through the process of rendering, but just throws away
-        # the rendered result. The "macro capture" is the point?
-        get_rendered(parsed_node.raw_code, context, parsed_node, capture_macros=True)
+            # this goes through the process of rendering, but just throws away
+            # the rendered result. The "macro capture" is the point?
+            get_rendered(parsed_node.raw_code, context, parsed_node, capture_macros=True)
         return context
 
     # This is taking the original config for the node, converting it to a dict,
@@ -450,7 +452,8 @@ class ConfiguredParser(
     def render_update(self, node: FinalNode, config: ContextConfig) -> None:
         try:
             context = self.render_with_context(node, config)
-            self.update_parsed_node_config(node, config, context=context)
+            with parse_step_timing("config"):
+                self.update_parsed_node_config(node, config, context=context)
         except ValidationError as exc:
             # we got a ValidationError - probably bad types in config()
             raise ConfigUpdateError(exc, node=node) from exc
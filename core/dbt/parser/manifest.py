@@ -34,6 +34,7 @@ from dbt.config import Project, RuntimeConfig
 from dbt.constants import (
     MANIFEST_FILE_NAME,
     PARTIAL_PARSE_FILE_NAME,
+    SCHEMA_YAML_CACHE_FILE_NAME,
     SEMANTIC_MANIFEST_FILE_NAME,
 )
 from dbt.context.configured import generate_macro_context
@@ -115,6 +116,8 @@ from dbt.parser.singular_test import SingularTestParser
 from dbt.parser.snapshots import SnapshotParser
 from dbt.parser.sources import SourcePatcher
 from dbt.parser.unit_tests import process_models_for_unit_test
+from dbt.parser.yaml_cache import SchemaYamlCache
+from dbt.profiler import parse_file_timing, parse_timer
 from dbt.utils.artifact_upload import add_artifact_produced
 from dbt.version import __version__
 from dbt_common.clients.jinja import parse
@@ -216,6 +219,8 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
     patch_sources_elapsed: Optional[float] = None
     process_manifest_elapsed: Optional[float] = None
     load_all_elapsed: Optional[float] = None
+    # per file and macro timings, only recorded with --record-parse-timing
+    parse_timing_info: Optional[Dict[str, Any]] = None
     projects: List[ProjectLoaderInfo] = field(default_factory=list)
     _project_index: Dict[str, ProjectLoaderInfo] = field(default_factory=dict)
 
@@ -312,7 +317,8 @@ class ManifestLoader:
             file_diff=file_diff,
         )
 
-        manifest = loader.load()
+        with parse_timer(enable=getattr(flags, "RECORD_PARSE_TIMING", False)) as timer:
+            manifest = loader.load()
 
         _check_manifest(manifest, config)
         manifest.build_flat_graph()
@@ -325,6 +331,10 @@ class ManifestLoader:
         loader._perf_info.load_all_elapsed = time.perf_counter() - start_load_all
         loader.track_project_load()
 
+        if timer is not None:
+            loader._perf_info.parse_timing_info = timer.report()
+            write_perf_info = True
+
         if write_perf_info:
             loader.write_perf_info(config.project_target_path)
 
@@ -340,6 +350,7 @@ class ManifestLoader:
         # of parsers to lists of file strings. The file strings are
         # used to get the SourceFiles from the manifest files.
         saved_files = self.saved_manifest.files if self.saved_manifest else {}
+        yaml_cache = self.read_schema_yaml_cache()
         file_reader: Optional[ReadFiles] = None
         if self.file_diff:
             # We're getting files from a file diff
@@ -349,6 +360,7 @@ class ManifestLoader:
                 saved_files=saved_files,
                 root_project_name=self.root_project.project_name,
                 file_diff=self.file_diff,
+                yaml_cache=yaml_cache,
             )
         else:
             # We're getting files from the file system
@@ -356,11 +368,18 @@ class ManifestLoader:
                 all_projects=self.all_projects,
                 files=self.manifest.files,
                 saved_files=saved_files,
+                yaml_cache=yaml_cache,
             )
 
         # Set the files in the manifest and save the project_parser_files
         file_reader.read_files()
         self.manifest.files = file_reader.files
+        if yaml_cache is not None:
+            yaml_cache.write(
+                source_file.checksum.checksum
+                for source_file in self.manifest.files.values()
+                if isinstance(source_file, SchemaSourceFile)
+            )
         project_parser_files = orig_project_parser_files = file_reader.project_parser_files
         self._perf_info.path_count = len(self.manifest.files)
         self._perf_info.read_files_elapsed = time.perf_counter() - start_read_files
@@ -449,6 +468,7 @@ class ManifestLoader:
             patcher = SourcePatcher(self.root_project, self.manifest)
             patcher.construct_sources()
             self.manifest.sources = patcher.sources
+            self.manifest.invalidate_selector_index()
             self._perf_info.patch_sources_elapsed = time.perf_counter() - start_patch
 
             # We need to rebuild disabled in order to include disabled sources
@@ -729,18 +749,19 @@ class ManifestLoader:
             parser: Parser = parser_cls(project, self.manifest, self.root_project)
             for file_id in parser_files[parser_name]:
                 block = FileBlock(self.manifest.files[file_id])
-                if isinstance(parser, SchemaParser):
-                    assert isinstance(block.file, SchemaSourceFile)
-                    if self.partially_parsing:
-                        dct = block.file.pp_dict
+                with parse_file_timing(file_id, parser_name):
+                    if isinstance(parser, SchemaParser):
+                        assert isinstance(block.file, SchemaSourceFile)
+                        if self.partially_parsing:
+                            dct = block.file.pp_dict
+                        else:
+                            dct = block.file.dict_from_yaml
+                        # this is where the schema file gets parsed
+                        parser.parse_file(block, dct=dct)
+                        # Came out of here with UnpatchedSourceDefinition containing configs at the source level
+                        # and not configs at the table level (as expected)
                     else:
-                        dct = block.file.dict_from_yaml
-                    # this is where the schema file gets parsed
-                    parser.parse_file(block, dct=dct)
-                    # Came out of here with UnpatchedSourceDefinition containing configs at the source level
-                    # and not configs at the table level (as expected)
-                else:
-                    parser.parse_file(block)
+                        parser.parse_file(block)
                 project_parsed_path_count += 1
 
             # Save timing info
@@ -930,6 +951,15 @@ class ManifestLoader:
                     return True
         return False
 
+    def read_schema_yaml_cache(self) -> Optional[SchemaYamlCache]:
+        # The cache is saved alongside the partial parse file and is
+        # disabled along with partial parsing
+        if not get_flags().PARTIAL_PARSE:
+            return None
+        return SchemaYamlCache.from_file(
+            os.path.join(self.root_project.project_target_path, SCHEMA_YAML_CACHE_FILE_NAME)
+        )
+
     def read_manifest_for_partial_parse(self) -> Optional[Manifest]:
         flags = get_flags()
         if not flags.PARTIAL_PARSE:
@@ -22,6 +22,7 @@ from dbt.flags import get_flags
 from dbt.node_types import ModelLanguage, NodeType
 from dbt.parser.base import SimpleSQLParser
 from dbt.parser.search import FileBlock
+from dbt.profiler import parse_step_timing, record_static_parser_result
 from dbt_common.contracts.config.base import merge_config_dicts
 from dbt_common.dataclass_schema import ValidationError
 from dbt_common.exceptions.macros import UndefinedMacroError
@@ -239,9 +240,11 @@ class ModelParser(SimpleSQLParser[ModelNode]):
         if node.language == ModelLanguage.python:
             try:
                 verify_python_model_code(node)
-                context = self._context_for(node, config)
-                self.parse_python_model(node, config, context)
-                self.update_parsed_node_config(node, config, context=context)
+                with parse_step_timing("render"):
+                    context = self._context_for(node, config)
+                    self.parse_python_model(node, config, context)
+                with parse_step_timing("config"):
+                    self.update_parsed_node_config(node, config, context=context)
 
             except ValidationError as exc:
                 # we got a ValidationError - probably bad types in config()
@@ -302,7 +305,8 @@ class ModelParser(SimpleSQLParser[ModelNode]):
             statically_parsed = self.run_experimental_parser(node)
         # run the stable static parser unless it is explicitly turned off
         else:
-            statically_parsed = self.run_static_parser(node)
+            with parse_step_timing("static_parse"):
+                statically_parsed = self.run_static_parser(node)
 
         # if the static parser succeeded, extract some data in easy-to-compare formats
         if isinstance(statically_parsed, dict):
@@ -343,8 +347,10 @@ class ModelParser(SimpleSQLParser[ModelNode]):
                 )
 
             self.manifest._parsing_info.static_analysis_parsed_path_count += 1
+            record_static_parser_result("success")
         # if the static parser didn't succeed, fall back to jinja
         else:
+            record_static_parser_result("fallback")
             # jinja rendering
             super().render_update(node, config)
 
@@ -438,7 +444,8 @@ class ModelParser(SimpleSQLParser[ModelNode]):
 
         # if there are hooks present this, it WILL render jinja. Will need to change
         # when the experimental parser supports hooks
-        self.update_parsed_node_config(node, config)
+        with parse_step_timing("config"):
+            self.update_parsed_node_config(node, config)
 
         # update the unrendered config with values from the file.
         # values from yaml files are in there already
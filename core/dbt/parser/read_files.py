@@ -16,11 +16,10 @@ from dbt.contracts.files import (
     SourceFile,
 )
 from dbt.events.types import InputFileDiffError
-from dbt.exceptions import ParsingError
-from dbt.parser.common import schema_file_keys
 from dbt.parser.schemas import yaml_from_file
 from dbt.parser.search import filesystem_search
-from dbt_common.clients.system import load_file_contents
+from dbt.parser.yaml_cache import SchemaYamlCache
+from dbt_common.clients.system import convert_path, load_file_contents
 from dbt_common.dataclass_schema import dbtClassMixin
 from dbt_common.events.functions import fire_event
 
@@ -47,6 +46,7 @@ def load_source_file(
     parse_file_type: ParseFileType,
     project_name: str,
     saved_files,
+    yaml_cache: Optional[SchemaYamlCache] = None,
 ) -> Optional[AnySourceFile]:
 
     if parse_file_type == ParseFileType.Schema:
@@ -86,51 +86,33 @@ def load_source_file(
         source_file.checksum = FileHash.from_contents(file_contents)
 
     if parse_file_type == ParseFileType.Schema and source_file.contents:
-        dfy = yaml_from_file(source_file)
+        dfy = yaml_from_file(source_file, yaml_cache)
         if dfy:
-            validate_yaml(source_file.path.original_file_path, dfy)
             source_file.dfy = dfy
     return source_file
 
 
-# Do some minimal validation of the yaml in a schema file.
-# Check version, that key values are lists and that each element in
-# the lists has a 'name' key
-def validate_yaml(file_path, dct):
-    for key in schema_file_keys:
-        if key in dct:
-            if not isinstance(dct[key], list):
-                msg = (
-                    f"The schema file at {file_path} is "
-                    f"invalid because the value of '{key}' is not a list"
-                )
-                raise ParsingError(msg)
-            for element in dct[key]:
-                if not isinstance(element, dict):
-                    msg = (
-                        f"The schema file at {file_path} is "
-                        f"invalid because a list element for '{key}' is not a dictionary"
-                    )
-                    raise ParsingError(msg)
-                if "name" not in element:
-                    msg = (
-                        f"The schema file at {file_path} is "
-                        f"invalid because a list element for '{key}' does not have a "
-                        "name attribute."
-                    )
-                    raise ParsingError(msg)
-
-
-# Special processing for big seed files
-def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
-    if match.seed_too_large():
-        # We don't want to calculate a hash of this file. Use the path.
-        source_file = SourceFile.big_seed(match)
-    else:
-        file_contents = load_file_contents(match.absolute_path, strip=True)
-        checksum = FileHash.from_contents(file_contents)
-        source_file = SourceFile(path=match, checksum=checksum)
-        source_file.contents = ""
+# Seed files can be very large and their contents are never parsed, so we
+# stream them through the hash instead of loading them. If the modification
+# time and size match the saved file, the saved checksum is reused.
+def load_seed_source_file(match: FilePath, project_name, saved_files=None) -> SourceFile:
+    match.file_size = os.stat(match.full_path).st_size
+    checksum = None
+    file_id = f"{project_name}://{match.original_file_path}"
+    if saved_files and file_id in saved_files:
+        old_source_file = saved_files[file_id]
+        if (
+            match.modification_time != 0.0
+            and isinstance(old_source_file.path, FilePath)
+            and old_source_file.path.modification_time == match.modification_time
+            and old_source_file.path.file_size == match.file_size
+            and old_source_file.checksum.name not in ("none", "path")
+        ):
+            checksum = old_source_file.checksum
+    if checksum is None:
+        checksum = FileHash.from_file(convert_path(match.absolute_path))
+    source_file = SourceFile(path=match, checksum=checksum)
+    source_file.contents = ""
     source_file.parse_file_type = ParseFileType.Seed
     source_file.project_name = project_name
     return source_file
@@ -138,14 +120,16 @@ def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
 
 # Use the FilesystemSearcher to get a bunch of FilePaths, then turn
 # them into a bunch of FileSource objects
-def get_source_files(project, paths, extension, parse_file_type, saved_files, ignore_spec):
+def get_source_files(
+    project, paths, extension, parse_file_type, saved_files, ignore_spec, yaml_cache=None
+):
     # file path list
     fp_list = filesystem_search(project, paths, extension, ignore_spec)
     # file block list
     fb_list = []
     for fp in fp_list:
         if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
+            fb_list.append(load_seed_source_file(fp, project.project_name, saved_files))
         # singular tests live in /tests but only generic tests live
         # in /tests/generic and fixtures in /tests/fixture so we want to skip those
         else:
@@ -153,19 +137,23 @@ def get_source_files(project, paths, extension, parse_file_type, saved_files, ig
                 path = pathlib.Path(fp.relative_path)
                 if path.parts[0] in ["generic", "fixtures"]:
                     continue
-            file = load_source_file(fp, parse_file_type, project.project_name, saved_files)
+            file = load_source_file(
+                fp, parse_file_type, project.project_name, saved_files, yaml_cache
+            )
             # only append the list if it has contents. added to fix #3568
             if file:
                 fb_list.append(file)
     return fb_list
 
 
-def read_files_for_parser(project, files, parse_ft, file_type_info, saved_files, ignore_spec):
+def read_files_for_parser(
+    project, files, parse_ft, file_type_info, saved_files, ignore_spec, yaml_cache=None
+):
     dirs = file_type_info["paths"]
     parser_files = []
     for extension in file_type_info["extensions"]:
         source_files = get_source_files(
-            project, dirs, extension, parse_ft, saved_files, ignore_spec
+            project, dirs, extension, parse_ft, saved_files, ignore_spec, yaml_cache
         )
         for sf in source_files:
             files[sf.file_id] = sf
@@ -205,6 +193,8 @@ class ReadFilesFromFileSystem:
     # }
     #
     project_parser_files: Dict = field(default_factory=dict)
+    # the loaded contents of schema files from previous invocations
+    yaml_cache: Optional[SchemaYamlCache] = None
 
     def read_files(self):
         for project in self.all_projects.values():
@@ -223,6 +213,7 @@ class ReadFilesFromFileSystem:
                 file_type_info,
                 self.saved_files,
                 dbt_ignore_spec,
+                self.yaml_cache,
             )
 
 
@@ -238,6 +229,7 @@ class ReadFilesFromDiff:
     project_parser_files: Dict = field(default_factory=dict)
     project_file_types: Dict = field(default_factory=dict)
     local_package_dirs: Optional[List[str]] = None
+    yaml_cache: Optional[SchemaYamlCache] = None
 
     def read_files(self):
         # Copy the base file information from the existing manifest.
@@ -281,9 +273,8 @@ class ReadFilesFromDiff:
                 source_file.path.modification_time = input_file.modification_time
                 # Handle creation of dictionary version of schema file content
                 if isinstance(source_file, SchemaSourceFile) and source_file.contents:
-                    dfy = yaml_from_file(source_file)
+                    dfy = yaml_from_file(source_file, self.yaml_cache)
                     if dfy:
-                        validate_yaml(source_file.path.original_file_path, dfy)
                         source_file.dfy = dfy
                     # TODO: ensure we have a file object even for empty files, such as schema files
 
@@ -344,9 +335,8 @@ class ReadFilesFromDiff:
                 parse_file_type=parse_ft,
             )
             if source_file_cls == SchemaSourceFile:
-                dfy = yaml_from_file(source_file)
+                dfy = yaml_from_file(source_file, self.yaml_cache)
                 if dfy:
-                    validate_yaml(source_file.path.original_file_path, dfy)
                     source_file.dfy = dfy
                 else:
                     # don't include in files because no content
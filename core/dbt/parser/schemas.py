@@ -79,12 +79,15 @@ from dbt.parser.common import (
     TestBlock,
     VersionedTestBlock,
     YamlBlock,
+    schema_file_keys,
     schema_file_keys_to_resource_types,
     trimmed,
 )
 from dbt.parser.schema_generic_tests import SchemaGenericTestParser
 from dbt.parser.schema_renderer import SchemaYamlRenderer
 from dbt.parser.search import FileBlock
+from dbt.parser.yaml_cache import SchemaYamlCache
+from dbt.profiler import parse_step_timing
 from dbt.utils import coerce_dict_str
 from dbt_common.contracts.constraints import ConstraintType, ModelLevelConstraint
 from dbt_common.dataclass_schema import ValidationError, dbtClassMixin
@@ -124,11 +127,58 @@ from dbt_common.utils import deep_merge
 # ===============================================================================
 
 
-def yaml_from_file(source_file: SchemaSourceFile) -> Optional[Dict[str, Any]]:
-    """If loading the yaml fails, raise an exception."""
+def validate_yaml(file_path, dct):
+    """Check that each resource list in a schema file is a list of named
+    dictionaries, setting `loaded_at_field_present` on source tables in the
+    same pass.
+    """
+    for key in schema_file_keys:
+        if key not in dct:
+            continue
+        if not isinstance(dct[key], list):
+            msg = (
+                f"The schema file at {file_path} is "
+                f"invalid because the value of '{key}' is not a list"
+            )
+            raise ParsingError(msg)
+        for element in dct[key]:
+            if not isinstance(element, dict):
+                msg = (
+                    f"The schema file at {file_path} is "
+                    f"invalid because a list element for '{key}' is not a dictionary"
+                )
+                raise ParsingError(msg)
+            if "name" not in element:
+                msg = (
+                    f"The schema file at {file_path} is "
+                    f"invalid because a list element for '{key}' does not have a "
+                    "name attribute."
+                )
+                raise ParsingError(msg)
+            if key == "sources":
+                # When loaded_loaded_at_field is defined as None or null, it shows up in
+                # the dict but when it is not defined, it does not show up in the dict
+                # We need to capture this to be able to override source level settings later.
+                for table in element.get("tables") or []:
+                    if isinstance(table, dict) and "loaded_at_field" in table:
+                        table["loaded_at_field_present"] = True
+
+
+def yaml_from_file(
+    source_file: SchemaSourceFile, yaml_cache: Optional[SchemaYamlCache] = None
+) -> Optional[Dict[str, Any]]:
+    """If loading the yaml fails, raise an exception. If a yaml_cache is
+    given, the loaded contents are looked up in and added to it.
+    """
+    checksum = source_file.checksum.checksum
+    if yaml_cache is not None:
+        cached = yaml_cache.get(checksum)
+        if cached is not None:
+            return cached
     try:
         # source_file.contents can sometimes be None
-        contents = load_yaml_text(source_file.contents or "", source_file.path)
+        with parse_step_timing("yaml_load", source_file.file_id):
+            contents = load_yaml_text(source_file.contents or "", source_file.path)
 
         if contents is None:
             return contents
@@ -137,21 +187,16 @@ def yaml_from_file(source_file: SchemaSourceFile) -> Optional[Dict[str, Any]]:
             raise DbtValidationError(
                 f"Contents of file '{source_file.original_file_path}' are not valid. Dictionary expected."
             )
-
-        # When loaded_loaded_at_field is defined as None or null, it shows up in
-        # the dict but when it is not defined, it does not show up in the dict
-        # We need to capture this to be able to override source level settings later.
-        for source in contents.get("sources", []):
-            for table in source.get("tables", []):
-                if "loaded_at_field" in table:
-                    table["loaded_at_field_present"] = True
-
-        return contents
     except DbtValidationError as e:
         raise YamlLoadError(
             project_name=source_file.project_name, path=source_file.path.relative_path, exc=e
         )
 
+    validate_yaml(source_file.path.original_file_path, contents)
+    if yaml_cache is not None and contents:
+        yaml_cache.add(checksum, contents)
+    return contents
+
 
 # This is the main schema file parser, but almost everything happens in the
 # the schema sub-parsers.
@@ -725,12 +770,13 @@ class PatchParser(YamlReader, Generic[NonSourceTarget, Parsed]):
         # We need to re-apply the config_call_dict after the patch config
         config._config_call_dict = node.config_call_dict
         config._unrendered_config_call_dict = node.unrendered_config_call_dict
-        self.schema_parser.update_parsed_node_config(
-            node,
-            config,
-            patch_config_dict=patch.config,
-            patch_file_id=patch.file_id,
-        )
+        with parse_step_timing("config"):
+            self.schema_parser.update_parsed_node_config(
+                node,
+                config,
+                patch_config_dict=patch.config,
+                patch_file_id=patch.file_id,
+            )
 
 
 # Subclasses of NodePatchParser: TestablePatchParser, ModelPatchParser, AnalysisPatchParser,
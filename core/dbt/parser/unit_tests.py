@@ -1,10 +1,13 @@
 import csv
+import json
 import os
+import threading
 from copy import deepcopy
 from csv import DictReader
+from hashlib import sha256
 from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from dbt import utils
 from dbt.artifacts.resources import ModelConfig, UnitTestConfig, UnitTestFormat
@@ -39,14 +42,69 @@ from dbt_common.events.functions import fire_event
 from dbt_common.events.types import SystemStdErr
 from dbt_extractor import ExtractionError, py_extract_from_source  # type: ignore
 
+ColumnTypes = Dict[str, str]
+
+
+class UnitTestManifestCache:
+    """Work that comes out the same for every unit test in an invocation, shared
+    by the UnitTestManifestLoaders that build each test's manifest: the refs and
+    sources of each tested model, the column types of each input relation and
+    the compiled SQL of each fixture.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.tested_node_references: Dict[Tuple[str, str], Tuple[List, List, List]] = {}
+        self.column_types: Dict[str, Optional[ColumnTypes]] = {}
+        # (input unique_id, hash of its rows and column types) -> fixture SQL
+        self.fixture_sql: Dict[Tuple[str, str], str] = {}
+
+    def get_column_types(
+        self, unique_id: str, load: Callable[[], Optional[ColumnTypes]]
+    ) -> Optional[ColumnTypes]:
+        with self._lock:
+            if unique_id in self.column_types:
+                return self.column_types[unique_id]
+        # loaded outside of the lock so other tests aren't held up by the query
+        column_types = load()
+        with self._lock:
+            return self.column_types.setdefault(unique_id, column_types)
+
+    def add_fixture_sql(self, key: Tuple[str, str], fixture_sql: str) -> None:
+        with self._lock:
+            self.fixture_sql.setdefault(key, fixture_sql)
+
+    def invalidate(self, unique_id: str) -> None:
+        """Forget what was looked up about a relation, e.g. after it is rebuilt."""
+        with self._lock:
+            self.column_types.pop(unique_id, None)
+            for key in [key for key in self.fixture_sql if key[0] == unique_id]:
+                del self.fixture_sql[key]
+
 
 class UnitTestManifestLoader:
-    def __init__(self, manifest, root_project, selected) -> None:
+    def __init__(
+        self,
+        manifest,
+        root_project,
+        selected,
+        cache: Optional[UnitTestManifestCache] = None,
+        get_column_types: Optional[Callable[[ModelNode], Optional[ColumnTypes]]] = None,
+    ) -> None:
         self.manifest: Manifest = manifest
         self.root_project: RuntimeConfig = root_project
         # selected comes from the initial selection against a "regular" manifest
         self.selected: Set[UniqueId] = selected
+        self.cache = cache or UnitTestManifestCache()
+        # Looks up the column types of an input's relation, so that fixtures
+        # don't have to query for them each time they are rendered
+        self.get_column_types = get_column_types
         self.unit_test_manifest = Manifest(macros=manifest.macros)
+        # The macros are the same as the manifest's, so are their indexes
+        self.unit_test_manifest._macros_by_name = manifest.get_macros_by_name()
+        self.unit_test_manifest._macros_by_package = manifest.get_macros_by_package()
+        # input node unique_id -> key of its fixture in cache.fixture_sql
+        self._fixture_keys: Dict[str, Tuple[str, str]] = {}
 
     def load(self) -> Manifest:
         for unique_id in self.selected:
@@ -100,14 +158,25 @@ class UnitTestManifestLoader:
             overrides=test_case.overrides,
         )
 
-        ctx = generate_parse_exposure(
-            unit_test_node,  # type: ignore
-            self.root_project,
-            self.manifest,
-            test_case.package_name,
-        )
-        get_rendered(unit_test_node.raw_code, ctx, unit_test_node, capture_macros=True)
-        # unit_test_node now has a populated refs/sources
+        # every test of a model renders the same refs and sources from it
+        references_key = (tested_node.unique_id, test_case.package_name)
+        references = self.cache.tested_node_references.get(references_key)
+        if references is None:
+            ctx = generate_parse_exposure(
+                unit_test_node,  # type: ignore
+                self.root_project,
+                self.manifest,
+                test_case.package_name,
+            )
+            get_rendered(unit_test_node.raw_code, ctx, unit_test_node, capture_macros=True)
+            # unit_test_node now has a populated refs/sources
+            self.cache.tested_node_references[references_key] = deepcopy(
+                (unit_test_node.refs, unit_test_node.sources, unit_test_node.metrics)
+            )
+        else:
+            unit_test_node.refs, unit_test_node.sources, unit_test_node.metrics = deepcopy(
+                references
+            )
 
         self.unit_test_manifest.nodes[unit_test_node.unique_id] = unit_test_node
         # Now create input_nodes for the test inputs
@@ -176,6 +245,9 @@ class UnitTestManifestLoader:
                 # Sources need to go in the sources dictionary in order to create the right lookup
                 self.unit_test_manifest.sources[input_node.unique_id] = input_node  # type: ignore
 
+            if given.format != UnitTestFormat.SQL:
+                self._use_cached_fixture(input_node, original_input_node, given.rows)
+
             # Both ModelNode and UnitTestSourceDefinition need to go in nodes dictionary
             self.unit_test_manifest.nodes[input_node.unique_id] = input_node
 
@@ -186,9 +258,41 @@ class UnitTestManifestLoader:
             # Add unique ids of input_nodes to depends_on
             unit_test_node.depends_on.nodes.append(input_node.unique_id)
 
+    def _use_cached_fixture(self, input_node: ModelNode, original_input_node, rows) -> None:
+        """Pass the column types of the input's relation to the fixture, and
+        reuse its SQL if a fixture with the same rows and column types has been
+        compiled before.
+        """
+        column_types = None
+        get_column_types = self.get_column_types
+        if get_column_types is not None:
+            column_types = self.cache.get_column_types(
+                original_input_node.unique_id, lambda: get_column_types(input_node)
+            )
+            if column_types:
+                input_node.raw_code = self._build_fixture_raw_code(rows, column_types, None)
+
+        key = (
+            original_input_node.unique_id,
+            sha256(json.dumps([rows, column_types], default=str).encode("utf-8")).hexdigest(),
+        )
+        self._fixture_keys[input_node.unique_id] = key
+        fixture_sql = self.cache.fixture_sql.get(key)
+        if fixture_sql is not None:
+            input_node.compiled = True
+            input_node.compiled_code = fixture_sql
+            input_node.extra_ctes_injected = True
+
+    def cache_compiled_fixtures(self) -> None:
+        """Save the SQL of the fixtures compiled for the loaded unit tests."""
+        for unique_id, key in self._fixture_keys.items():
+            input_node = self.unit_test_manifest.nodes[unique_id]
+            if input_node.compiled and input_node.compiled_code is not None:
+                self.cache.add_fixture_sql(key, input_node.compiled_code)
+
     def _build_fixture_raw_code(self, rows, column_name_to_data_types, fixture_format) -> str:
-        # We're not currently using column_name_to_data_types, but leaving here for
-        # possible future use.
+        # column_name_to_data_types is only passed when the column types of the
+        # input's relation have already been looked up
         if fixture_format == UnitTestFormat.SQL:
             return rows
         else:
@@ -613,3 +717,4 @@ def process_models_for_unit_test(
             schema_file.unit_tests.append(versioned_unit_test_unique_id)
             # fqn?
             manifest.unit_tests[versioned_unit_test_unique_id] = new_unit_test_def
+        manifest.invalidate_selector_index()
@@ -0,0 +1,116 @@
+import os
+from typing import Any, Dict, Iterable, Optional
+
+import msgpack
+
+from dbt.version import __version__
+from dbt_common.clients.system import make_directory
+
+
+def has_shared_containers(dfy: Any) -> bool:
+    """Return whether the same dict or list appears more than once in the
+    loaded yaml, which happens when an alias (or a `<<` merge key) refers to
+    an anchor holding one.
+    """
+    seen = set()
+    to_visit = [dfy]
+    while to_visit:
+        value = to_visit.pop()
+        if isinstance(value, dict):
+            children = value.values()
+        elif isinstance(value, list):
+            children = value
+        else:
+            continue
+        if id(value) in seen:
+            return True
+        seen.add(id(value))
+        to_visit.extend(children)
+    return False
+
+
+class SchemaYamlCache:
+    """The loaded contents of schema files from previous invocations, keyed by
+    the checksum of the file's contents.
+
+    Loading the yaml of large schema files can take longer than the rest of
+    parsing them, and is repeated for every file on a full parse, even when
+    the file has not changed. Entries are stored as msgpack in a single file
+    in the target directory, and each one is only unpacked when it is used.
+
+    Contents in which an anchor and its aliases share a dict or list are not
+    cached: parsers modify the loaded dicts, and after a round trip through
+    msgpack the aliases would be separate copies, so a cache hit could parse
+    differently than a fresh load.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._entries: Dict[str, bytes] = {}
+        self._dirty = False
+
+    @classmethod
+    def from_file(cls, path: str) -> "SchemaYamlCache":
+        cache = cls(path)
+        if not os.path.exists(path):
+            return cache
+        try:
+            with open(path, "rb") as fp:
+                data = msgpack.unpackb(fp.read(), raw=False)
+            # the contents of a cached entry depend on the dbt version
+            # that loaded it, e.g. the fixups applied to sources
+            if data["dbt_version"] == __version__:
+                cache._entries = data["entries"]
+        except Exception:
+            cache._entries = {}
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, checksum: str) -> Optional[Dict[str, Any]]:
+        packed = self._entries.get(checksum)
+        if packed is None:
+            return None
+        from dbt.parser.manifest import extended_msgpack_decoder
+
+        try:
+            return msgpack.unpackb(
+                packed, ext_hook=extended_msgpack_decoder, raw=False, strict_map_key=False
+            )
+        except Exception:
+            del self._entries[checksum]
+            self._dirty = True
+            return None
+
+    def add(self, checksum: str, dfy: Dict[str, Any]) -> None:
+        from dbt.parser.manifest import extended_msgpack_encoder
+
+        if has_shared_containers(dfy):
+            return
+        try:
+            packed = msgpack.packb(dfy, default=extended_msgpack_encoder, use_bin_type=True)
+        except (TypeError, ValueError, OverflowError):
+            # the file contains something msgpack can't represent, such as a set
+            return
+        self._entries[checksum] = packed
+        self._dirty = True
+
+    def write(self, live_checksums: Iterable[str]) -> None:
+        """Write the cache, dropping entries for contents no longer in any
+        schema file. Nothing is written if nothing changed.
+        """
+        live = set(live_checksums)
+        stale = [checksum for checksum in self._entries if checksum not in live]
+        if not stale and not self._dirty:
+            return
+        for checksum in stale:
+            del self._entries[checksum]
+        make_directory(os.path.dirname(self.path))
+        with open(self.path, "wb") as fp:
+            fp.write(
+                msgpack.packb(
+                    {"dbt_version": __version__, "entries": self._entries}, use_bin_type=True
+                )
+            )
+        self._dirty = False
@@ -1,7 +1,37 @@
-from contextlib import contextmanager
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
 from cProfile import Profile
 from pstats import Stats
-from typing import Any, Generator
+from types import CodeType, FrameType
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    DefaultDict,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from dbt_common.clients.system import write_file
+
+# The file the sampling profiler adds its summary of slow nodes and macros to
+PERF_INFO_FILE_NAME = "perf_info.json"
+SAMPLE_INTERVAL = 0.005
+TOP_N = 20
+
+# Phases a node's time is attributed to, refined from its runner's current
+# phase ("compile" or "execute") by what is on the stack when it is sampled
+JINJA_RENDER = "jinja render"
+MATERIALIZATION = "materialization"
+ADAPTER_EXECUTE = "adapter execute"
 
 
 @contextmanager
@@ -18,3 +48,322 @@ def profiler(enable: bool, outfile: str) -> Generator[Any, None, None]:
             stats = Stats(profiler)
             stats.sort_stats("tottime")
             stats.dump_stats(str(outfile))
+
+
+class NodeSampler:
+    """Samples the stack of every thread at a fixed interval and attributes
+    each sample to the node the thread is running and the phase it is in.
+
+    Unlike cProfile, which only sees the thread it was enabled on, this covers
+    the worker threads nodes run on, and its overhead does not grow with the
+    number of function calls made.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.samples = 0
+        self.stacks: Counter[str] = Counter()
+        self.node_phases: DefaultDict[str, Dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self.macros: DefaultDict[str, float] = defaultdict(float)
+        # thread ident -> (unique_id, phase) of the node that thread is running
+        self._running: Dict[int, Tuple[str, str]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._call_macro_code: Optional[CodeType] = None
+        self._adapter_paths: Tuple[str, ...] = ()
+        self._jinja_paths: Tuple[str, ...] = ()
+
+    @contextmanager
+    def node_phase(self, unique_id: str, phase: str) -> Generator[None, None, None]:
+        ident = threading.get_ident()
+        previous = self._running.get(ident)
+        self._running[ident] = (unique_id, phase)
+        try:
+            yield
+        finally:
+            if previous is None:
+                self._running.pop(ident, None)
+            else:
+                self._running[ident] = previous
+
+    def start(self) -> None:
+        import jinja2
+
+        import dbt.adapters
+        from dbt_common.clients.jinja import BaseMacroGenerator
+
+        self._call_macro_code = BaseMacroGenerator.call_macro.__code__
+        self._adapter_paths = tuple(os.path.join(p, "") for p in dbt.adapters.__path__)
+        self._jinja_paths = (os.path.join(os.path.dirname(jinja2.__file__), ""), "<template>")
+        self._thread = threading.Thread(target=self._run, name="dbt-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident != own_ident:
+                    self._sample(names.get(ident, str(ident)), ident, frame, elapsed)
+            self.samples += 1
+
+    def _macro_name(self, frame: FrameType) -> Optional[str]:
+        try:
+            return frame.f_locals["self"].get_name()
+        except Exception:
+            return None
+
+    def _sample(self, thread_name: str, ident: int, frame: FrameType, elapsed: float) -> None:
+        frames: List[str] = []
+        macros: List[str] = []
+        in_adapter_execute = False
+        in_jinja = False
+        current: Optional[FrameType] = frame
+        while current is not None:
+            code = current.f_code
+            filename = code.co_filename
+            if code is self._call_macro_code:
+                name = self._macro_name(current)
+                if name is not None:
+                    macros.append(name)
+            elif filename.startswith(self._jinja_paths):
+                in_jinja = True
+            elif code.co_name in ("add_query", "execute") and filename.startswith(
+                self._adapter_paths
+            ):
+                in_adapter_execute = True
+            frames.append(f"{code.co_name} ({os.path.basename(filename)}:{code.co_firstlineno})")
+            current = current.f_back
+        frames.reverse()
+
+        prefix = [thread_name]
+        running = self._running.get(ident)
+        if running is not None:
+            unique_id, phase = running
+            if in_adapter_execute:
+                phase = ADAPTER_EXECUTE
+            elif phase == "execute" and any(m.startswith("materialization_") for m in macros):
+                phase = MATERIALIZATION
+            elif in_jinja:
+                phase = JINJA_RENDER
+            self.node_phases[unique_id][phase] += elapsed
+            prefix += [unique_id, phase]
+        for name in set(macros):
+            self.macros[name] += elapsed
+        self.stacks[";".join(prefix + frames)] += 1
+
+    def summary(self, top_n: int = TOP_N) -> Dict[str, Any]:
+        nodes = sorted(
+            self.node_phases.items(), key=lambda item: sum(item[1].values()), reverse=True
+        )
+        macros = sorted(self.macros.items(), key=lambda item: item[1], reverse=True)
+        return {
+            "sample_interval": self.interval,
+            "samples": self.samples,
+            "slowest_nodes": [
+                {
+                    "unique_id": unique_id,
+                    "elapsed": round(sum(phases.values()), 4),
+                    "phases": {phase: round(elapsed, 4) for phase, elapsed in phases.items()},
+                }
+                for unique_id, phases in nodes[:top_n]
+            ],
+            "slowest_macros": [
+                {"name": name, "elapsed": round(elapsed, 4)} for name, elapsed in macros[:top_n]
+            ],
+        }
+
+    def write(self, outfile: str, perf_info_dir: Optional[str]) -> None:
+        """Write the samples to outfile in the collapsed stack format read by
+        flamegraph.pl and speedscope, and add a summary of the slowest nodes and
+        macros to the perf_info.json in perf_info_dir.
+        """
+        write_file(
+            str(outfile), "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+        )
+        if perf_info_dir is None:
+            return
+        path = os.path.join(perf_info_dir, PERF_INFO_FILE_NAME)
+        perf_info: Dict[str, Any] = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as fp:
+                    perf_info = json.load(fp)
+            except (OSError, ValueError):
+                perf_info = {}
+        perf_info["node_timing_info"] = self.summary()
+        write_file(path, json.dumps(perf_info, indent=4))
+
+
+_active_sampler: Optional[NodeSampler] = None
+
+
+def node_phase(unique_id: str, phase: str) -> ContextManager[None]:
+    """Attribute the current thread's samples to a node and phase while
+    sampling, and do nothing otherwise.
+    """
+    if _active_sampler is None:
+        return nullcontext()
+    return _active_sampler.node_phase(unique_id, phase)
+
+
+class ParseTimer:
+    """Records where parse time goes: per file, the time spent in each step of
+    parsing it and whether the static parser could handle it, and per macro,
+    the time spent inside it while rendering at parse time.
+    """
+
+    def __init__(self) -> None:
+        self.files: DefaultDict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"parse_elapsed": 0.0, "steps": defaultdict(float)}
+        )
+        self.macros: DefaultDict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"calls": 0, "elapsed": 0.0, "self_elapsed": 0.0}
+        )
+        self._file_id: Optional[str] = None
+        # time spent in callees of each macro being rendered
+        self._macro_stack: List[float] = []
+
+    @contextmanager
+    def file(self, file_id: str, parser: str) -> Generator[None, None, None]:
+        self._file_id = file_id
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.files[file_id]["parser"] = parser
+            self.files[file_id]["parse_elapsed"] += time.perf_counter() - start
+            self._file_id = None
+
+    @contextmanager
+    def step(self, name: str, file_id: Optional[str] = None) -> Generator[None, None, None]:
+        file_id = file_id or self._file_id
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if file_id is not None:
+                self.files[file_id]["steps"][name] += time.perf_counter() - start
+
+    def static_parser_result(self, result: str) -> None:
+        if self._file_id is not None:
+            self.files[self._file_id]["static_parser"] = result
+
+    @contextmanager
+    def macro(self, unique_id: str) -> Generator[None, None, None]:
+        self._macro_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            callees_elapsed = self._macro_stack.pop()
+            if self._macro_stack:
+                self._macro_stack[-1] += elapsed
+            info = self.macros[unique_id]
+            info["calls"] += 1
+            info["elapsed"] += elapsed
+            info["self_elapsed"] += elapsed - callees_elapsed
+
+    def report(self, top_n: int = TOP_N) -> Dict[str, Any]:
+        files = []
+        static_parser: Counter[str] = Counter()
+        for file_id, info in self.files.items():
+            steps = {name: round(elapsed, 4) for name, elapsed in info["steps"].items()}
+            # yaml is loaded while reading files, before the file is parsed
+            elapsed = info["parse_elapsed"] + info["steps"].get("yaml_load", 0.0)
+            entry = {"file_id": file_id, "elapsed": round(elapsed, 4), "steps": steps}
+            if "parser" in info:
+                entry["parser"] = info["parser"]
+            if "static_parser" in info:
+                entry["static_parser"] = info["static_parser"]
+                static_parser[info["static_parser"]] += 1
+            files.append(entry)
+        files.sort(key=lambda entry: entry["elapsed"], reverse=True)
+        macros = sorted(
+            self.macros.items(), key=lambda item: item[1]["self_elapsed"], reverse=True
+        )
+        return {
+            "file_count": len(files),
+            "static_parser": dict(static_parser),
+            "slowest_files": files[:top_n],
+            "slowest_macros": [
+                {
+                    "unique_id": unique_id,
+                    "calls": info["calls"],
+                    "elapsed": round(info["elapsed"], 4),
+                    "self_elapsed": round(info["self_elapsed"], 4),
+                }
+                for unique_id, info in macros[:top_n]
+            ],
+        }
+
+
+_active_parse_timer: Optional[ParseTimer] = None
+_NULL_CONTEXT: ContextManager[None] = nullcontext()
+
+
+def parse_file_timing(file_id: str, parser: str) -> ContextManager[None]:
+    if _active_parse_timer is None:
+        return _NULL_CONTEXT
+    return _active_parse_timer.file(file_id, parser)
+
+
+def parse_step_timing(name: str, file_id: Optional[str] = None) -> ContextManager[None]:
+    """Time a step of parsing the current file, or of the given file."""
+    if _active_parse_timer is None:
+        return _NULL_CONTEXT
+    return _active_parse_timer.step(name, file_id)
+
+
+def record_static_parser_result(result: str) -> None:
+    if _active_parse_timer is not None:
+        _active_parse_timer.static_parser_result(result)
+
+
+def parse_macro_timing(unique_id: str) -> ContextManager[None]:
+    if _active_parse_timer is None:
+        return _NULL_CONTEXT
+    return _active_parse_timer.macro(unique_id)
+
+
+@contextmanager
+def parse_timer(enable: bool) -> Generator[Optional[ParseTimer], None, None]:
+    """Record parse timings while parsing, if enabled. Disabled, the hooks
+    above return a shared no-op context manager.
+    """
+    global _active_parse_timer
+    if not enable:
+        yield None
+        return
+    _active_parse_timer = ParseTimer()
+    try:
+        yield _active_parse_timer
+    finally:
+        _active_parse_timer = None
+
+
+@contextmanager
+def sampling_profiler(
+    outfile: str, get_perf_info_dir: Callable[[], Optional[str]]
+) -> Generator[NodeSampler, None, None]:
+    global _active_sampler
+    sampler = NodeSampler()
+    _active_sampler = sampler
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        _active_sampler = None
+        sampler.write(outfile, get_perf_info_dir())
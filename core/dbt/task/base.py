@@ -3,6 +3,7 @@ import threading
 import time
 import traceback
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Future
 from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
@@ -41,6 +42,8 @@ from dbt.events.types import (
 )
 from dbt.flags import get_flags
 from dbt.graph import Graph
+from dbt.graph.thread_pool import DbtProcessPool
+from dbt.profiler import node_phase
 from dbt.task import group_lookup
 from dbt.task.printer import print_run_result_error
 from dbt_common.events.contextvars import get_node_info
@@ -181,6 +184,16 @@ class BaseRunner(metaclass=ABCMeta):
 
         self.run_ephemeral_models = False
 
+        # set when the task compiles nodes in worker processes, see CompileRunner.compile
+        self.process_pool: Optional[DbtProcessPool] = None
+        self.warehouse_ready: Optional[Future] = None
+
+    def set_process_pool(self, process_pool: DbtProcessPool) -> None:
+        self.process_pool = process_pool
+
+    def set_warehouse_ready(self, warehouse_ready: Future) -> None:
+        self.warehouse_ready = warehouse_ready
+
     @abstractmethod
     def compile(self, manifest: Manifest) -> Any:
         pass
@@ -291,7 +304,9 @@ class BaseRunner(metaclass=ABCMeta):
                     node_info=ctx.node.node_info,
                 )
             )
-            with collect_timing_info("compile", ctx.timing.append):
+            with collect_timing_info("compile", ctx.timing.append), node_phase(
+                self.node.unique_id, "compile"
+            ):
                 # if we fail here, we still have a compiled node to return
                 # this has the benefit of showing a build path for the errant
                 # model.  This calls the 'compile' method in CompileTask
@@ -299,13 +314,18 @@ class BaseRunner(metaclass=ABCMeta):
 
             # for ephemeral nodes, we only want to compile, not run
             if not ctx.node.is_ephemeral_model or self.run_ephemeral_models:
+                if self.warehouse_ready is not None:
+                    # schemas may still be being created in the background
+                    self.warehouse_ready.result()
                 ctx.node.update_event_status(node_status=RunningStatus.Executing)
                 fire_event(
                     NodeExecuting(
                         node_info=ctx.node.node_info,
                     )
                 )
-                with collect_timing_info("execute", ctx.timing.append):
+                with collect_timing_info("execute", ctx.timing.append), node_phase(
+                    self.node.unique_id, "execute"
+                ):
                     result = self.run(ctx.node, manifest)
                     ctx.node = result.node
 
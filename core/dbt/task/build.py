@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional, Set, Type
 
+from dbt import selected_resources
 from dbt.artifacts.schemas.results import NodeStatus
 from dbt.artifacts.schemas.run import RunResult
 from dbt.cli.flags import Flags
@@ -8,6 +9,7 @@ from dbt.contracts.graph.manifest import Manifest
 from dbt.exceptions import DbtInternalError
 from dbt.graph import Graph, GraphQueue, ResourceTypeSelector
 from dbt.node_types import NodeType
+from dbt.parser.unit_tests import UnitTestManifestCache
 from dbt.runners import ExposureRunner as exposure_runner
 from dbt.runners import SavedQueryRunner as saved_query_runner
 from dbt.task.base import BaseRunner, resource_types_from_args
@@ -50,6 +52,8 @@ class BuildTask(RunTask):
         super().__init__(args, config, manifest)
         self.selected_unit_tests: Set = set()
         self.model_to_unit_test_map: Dict[str, List] = {}
+        # shared by the unit tests run in this invocation
+        self.unit_test_cache = UnitTestManifestCache()
 
     def resource_types(self, no_unit_tests: bool = False) -> List[NodeType]:
         resource_types = resource_types_from_args(
@@ -69,11 +73,13 @@ class BuildTask(RunTask):
 
         # selector including unit tests
         full_selector = self.get_node_selector(no_unit_tests=False)
+        full_selector.selection_cache = self.get_selection_cache()
         # selected node unique_ids with unit_tests
         full_selected_nodes = full_selector.get_selected(spec)
 
         # This selector removes the unit_tests from the selector
         selector_wo_unit_tests = self.get_node_selector(no_unit_tests=True)
+        selector_wo_unit_tests.selection_cache = self.get_selection_cache()
         # selected node unique_ids without unit_tests
         selected_nodes_wo_unit_tests = selector_wo_unit_tests.get_selected(spec)
 
@@ -83,75 +89,54 @@ class BuildTask(RunTask):
         self.selected_unit_tests = selected_unit_tests
         self.build_model_to_unit_test_map(selected_unit_tests)
 
-        # get_graph_queue in the selector will remove NodeTypes not specified
-        # in the node_selector (filter_selection).
-        return selector_wo_unit_tests.get_graph_queue(spec)
-
-    # overrides handle_job_queue in runnable.py
-    def handle_job_queue(self, pool, callback):
-        if self.run_count == 0:
-            self.num_nodes = self.num_nodes + len(self.selected_unit_tests)
-        node = self.job_queue.get()
+        self.write_selection_cache()
+        # Same as the selector's get_graph_queue, with the unit tests of each
+        # selected model scheduled ahead of it
+        selected_resources.set_selected_resources(selected_nodes_wo_unit_tests)
+        new_graph = self.graph.get_subset_graph(selected_nodes_wo_unit_tests)
+        self.add_unit_tests_to_graph(new_graph)
+        return GraphQueue(new_graph.graph, self.manifest, selected_nodes_wo_unit_tests)
+
+    def add_unit_tests_to_graph(self, graph: Graph) -> None:
+        """Add the unit tests of each model in the graph as its parents, and as
+        children of the model's parents, so that they run concurrently once
+        the model's parents are done, and the model only runs once they are.
+        """
+        for model_unique_id, unit_test_unique_ids in self.model_to_unit_test_map.items():
+            # unit tests only run along with their model
+            if model_unique_id not in graph.graph:
+                continue
+            parents = list(graph.graph.predecessors(model_unique_id))
+            for unit_test_unique_id in unit_test_unique_ids:
+                graph.graph.add_edges_from((parent, unit_test_unique_id) for parent in parents)
+                graph.graph.add_edge(unit_test_unique_id, model_unique_id)
+
+    def get_runner(self, node) -> BaseRunner:
+        runner = super().get_runner(node)
+        if isinstance(runner, test_runner):
+            runner.set_unit_test_cache(self.unit_test_cache)
+        return runner
+
+    def _handle_result(self, result: RunResult) -> None:
+        super()._handle_result(result)
+        node = result.node
         if (
-            node.resource_type == NodeType.Model
-            and self.model_to_unit_test_map
-            and node.unique_id in self.model_to_unit_test_map
+            node.resource_type == NodeType.Unit
+            and result.status in self.MARK_DEPENDENT_ERRORS_STATUSES
         ):
-            self.handle_model_with_unit_tests_node(node, pool, callback)
-
-        else:
-            self.handle_job_queue_node(node, pool, callback)
-
-    def handle_model_with_unit_tests_node(self, node, pool, callback):
-        self._raise_set_error()
-        args = [node, pool]
-        if self.config.args.single_threaded:
-            callback(self.call_model_and_unit_tests_runner(*args))
-        else:
-            pool.apply_async(self.call_model_and_unit_tests_runner, args=args, callback=callback)
-
-    def call_model_and_unit_tests_runner(self, node, pool) -> RunResult:
-        assert self.manifest
-        for unit_test_unique_id in self.model_to_unit_test_map[node.unique_id]:
-            unit_test_node = self.manifest.unit_tests[unit_test_unique_id]
-            unit_test_runner = self.get_runner(unit_test_node)
-            # If the model is marked skip, also skip the unit tests
-            if node.unique_id in self._skipped_children:
-                # cause is only for ephemeral nodes
-                unit_test_runner.do_skip(cause=None)
-            result = self.call_runner(unit_test_runner)
-            self._handle_result(result)
-            if result.status in self.MARK_DEPENDENT_ERRORS_STATUSES:
-                # The _skipped_children dictionary can contain a run_result for ephemeral nodes,
-                # but that should never be the case here.
-                self._skipped_children[node.unique_id] = None
-        runner = self.get_runner(node)
-        if runner.node.unique_id in self._skipped_children:
-            cause = self._skipped_children.pop(runner.node.unique_id)
-            runner.do_skip(cause=cause)
-
-        if isinstance(runner, MicrobatchModelRunner):
-            runner.set_parent_task(self)
-            runner.set_pool(pool)
-
-        return self.call_runner(runner)
-
-    # handle non-model-plus-unit-tests nodes
-    def handle_job_queue_node(self, node, pool, callback):
-        self._raise_set_error()
-        runner = self.get_runner(node)
-        # we finally know what we're running! Make sure we haven't decided
-        # to skip it due to upstream failures
-        if runner.node.unique_id in self._skipped_children:
-            cause = self._skipped_children.pop(runner.node.unique_id)
-            runner.do_skip(cause=cause)
-
-        if isinstance(runner, MicrobatchModelRunner):
-            runner.set_parent_task(self)
-            runner.set_pool(pool)
-
-        args = [runner]
-        self._submit(pool, args, callback)
+            # A failed or skipped unit test skips its model, which runs after
+            # all of its unit tests are done. The _skipped_children dictionary
+            # can contain a run_result for ephemeral nodes, but that should
+            # never be the case here.
+            self._skipped_children[node.depends_on.nodes[0]] = None
+        # a rebuilt relation may have different columns than its unit tests' fixtures
+        self.unit_test_cache.invalidate(node.unique_id)
+
+    # overrides handle_job_queue in run.py
+    def handle_job_queue(self, pool, callback, error_callback=None):
+        if self.run_count == 0:
+            self.num_nodes = self.num_nodes + len(self.selected_unit_tests)
+        super().handle_job_queue(pool, callback, error_callback)
 
     # Make a map of model unique_ids to selected unit test unique_ids,
     # for processing before the model.
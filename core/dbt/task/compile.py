@@ -2,8 +2,10 @@ import threading
 from typing import Optional, Type
 
 from dbt.artifacts.schemas.run import RunResult, RunStatus
+from dbt.compilation import compile_node_in_worker
 from dbt.contracts.graph.manifest import Manifest
 from dbt.events.types import CompiledNode, ParseInlineNodeError
+from dbt.exceptions import ProcessPoolCompilationError
 from dbt.flags import get_flags
 from dbt.graph import ResourceTypeSelector
 from dbt.node_types import EXECUTABLE_NODE_TYPES, NodeType
@@ -40,6 +42,19 @@ class CompileRunner(BaseRunner):
         )
 
     def compile(self, manifest: Manifest):
+        if self.process_pool is not None and self.node.unique_id in manifest.nodes:
+            try:
+                compiled_attrs, error = self.process_pool.submit(
+                    compile_node_in_worker, self.node.unique_id
+                ).result()
+            except RuntimeError:
+                # the pool was shut down or broken, compile in process instead
+                return self.compiler.compile_node(self.node, manifest, {})
+            if error is not None:
+                raise ProcessPoolCompilationError(error, node=self.node)
+            for attr, value in compiled_attrs.items():
+                setattr(self.node, attr, value)
+            return self.node
         return self.compiler.compile_node(self.node, manifest, {})
 
 
@@ -69,6 +84,12 @@ class CompileTask(GraphRunnableTask):
     def get_runner_type(self, _) -> Optional[Type[BaseRunner]]:
         return CompileRunner
 
+    def use_process_pool(self) -> bool:
+        # inline queries are a single node, not worth forking for
+        return bool(getattr(self.args, "process_pool", False)) and not getattr(
+            self.args, "inline", None
+        )
+
     def task_end_messages(self, results) -> None:
         is_inline = bool(getattr(self.args, "inline", None))
         output_format = getattr(self.args, "output", "text")
@@ -115,6 +136,7 @@ class CompileTask(GraphRunnableTask):
                     sql_node.config.enabled = True
                     self.manifest.disabled.pop(sql_node.unique_id)
                     self.manifest.nodes[sql_node.unique_id] = sql_node
+                    self.manifest.invalidate_selector_index()
                 # keep track of the node added to the manifest
                 self._inline_node_id = sql_node.unique_id
             except CompilationError as exc:
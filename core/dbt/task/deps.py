@@ -1,7 +1,11 @@
+import contextvars
+import functools
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha1
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import yaml
 
@@ -13,17 +17,26 @@ from dbt.config.project import load_yml_dict, package_config_from_data
 from dbt.config.renderer import PackageRenderer
 from dbt.constants import PACKAGE_LOCK_FILE_NAME, PACKAGE_LOCK_HASH_KEY
 from dbt.contracts.project import PackageSpec
-from dbt.deps.base import downloads_directory
+from dbt.deps.base import PinnedPackage, downloads_directory
 from dbt.deps.registry import RegistryPinnedPackage
 from dbt.deps.resolver import resolve_lock_packages, resolve_packages
+from dbt.deps.store import (
+    PackageStore,
+    link_tree,
+    package_key,
+    read_installed_packages,
+    write_installed_packages,
+)
 from dbt.events.types import (
     DepsAddPackage,
     DepsFoundDuplicatePackage,
     DepsInstallInfo,
+    DepsLinkFromPackageStore,
     DepsListSubdirectory,
     DepsLockUpdating,
     DepsNoPackagesFound,
     DepsNotifyUpdatesAvailable,
+    DepsPackageUnchanged,
     DepsStartPackageInstall,
     DepsUpdateAvailable,
     DepsUpToDate,
@@ -33,6 +46,8 @@ from dbt_common.clients import system
 from dbt_common.events.functions import fire_event
 from dbt_common.events.types import Formatting
 
+MAX_CONCURRENT_INSTALLS = 8
+
 
 class dbtPackageDumper(yaml.Dumper):
     def increase_indent(self, flow=False, indentless=False):
@@ -223,11 +238,6 @@ class DepsTask(BaseTask):
         if self.args.lock:
             return
 
-        if system.path_exists(self.project.packages_install_path):
-            system.rmtree(self.project.packages_install_path)
-
-        system.make_directory(self.project.packages_install_path)
-
         packages_lock_dict = load_yml_dict(f"{self.project.project_root}/{PACKAGE_LOCK_FILE_NAME}")
 
         renderer = PackageRenderer(self.cli_vars)
@@ -236,6 +246,7 @@ class DepsTask(BaseTask):
         ).packages
 
         if not packages_lock_config:
+            self._clean_packages_install_path(keep=set())
             fire_event(DepsNoPackagesFound())
             return
 
@@ -243,34 +254,117 @@ class DepsTask(BaseTask):
             lock_defined_deps = resolve_lock_packages(packages_lock_config)
             renderer = PackageRenderer(self.cli_vars)
 
-            packages_to_upgrade = []
-
-            for package in lock_defined_deps:
-                package_name = package.name
-                source_type = package.source_type()
-                version = package.get_version()
-
-                fire_event(DepsStartPackageInstall(package_name=package_name))
-                package.install(self.project, renderer)
+            # packages whose pinned spec hasn't changed since the last install are left in place
+            keys = [package_key(package) for package in lock_defined_deps]
+            previously_installed = read_installed_packages(self.project.packages_install_path)
+            unchanged = {
+                key: previously_installed[key]
+                for key in keys
+                if key in previously_installed
+                and os.path.isdir(
+                    os.path.join(self.project.packages_install_path, previously_installed[key])
+                )
+            }
+            self._clean_packages_install_path(keep=set(unchanged.values()))
+
+            store = None
+            if getattr(self.args, "package_store", None):
+                store = PackageStore(self.args.package_store)
+
+            # install concurrently, but report on each package in order
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_INSTALLS) as executor:
+                futures = [
+                    (
+                        executor.submit(
+                            contextvars.copy_context().run,
+                            self._install_package,
+                            package,
+                            key,
+                            renderer,
+                            store,
+                        )
+                        if key not in unchanged
+                        else None
+                    )
+                    for package, key in zip(lock_defined_deps, keys)
+                ]
+
+                installed: Dict[str, str] = {}
+                packages_to_upgrade = []
+                for package, key, future in zip(lock_defined_deps, keys, futures):
+                    package_name = package.name
+                    source_type = package.source_type()
+                    version = package.get_version()
+
+                    fire_event(DepsStartPackageInstall(package_name=package_name))
+                    if future is None:
+                        installed_name = unchanged[key]  # type: ignore[index]
+                        fire_event(DepsPackageUnchanged(version_name=package.nice_version_name()))
+                    else:
+                        installed_name = future.result()
+                        fire_event(DepsInstallInfo(version_name=package.nice_version_name()))
+                    if key is not None:
+                        installed[key] = installed_name
 
-                fire_event(DepsInstallInfo(version_name=package.nice_version_name()))
+                    if isinstance(package, RegistryPinnedPackage):
+                        version_latest = package.get_version_latest()
 
-                if isinstance(package, RegistryPinnedPackage):
-                    version_latest = package.get_version_latest()
+                        if version_latest != version:
+                            packages_to_upgrade.append(package_name)
+                            fire_event(DepsUpdateAvailable(version_latest=version_latest))
+                        else:
+                            fire_event(DepsUpToDate())
 
-                    if version_latest != version:
-                        packages_to_upgrade.append(package_name)
-                        fire_event(DepsUpdateAvailable(version_latest=version_latest))
-                    else:
-                        fire_event(DepsUpToDate())
+                    if package.get_subdirectory():
+                        fire_event(DepsListSubdirectory(subdirectory=package.get_subdirectory()))
 
-                if package.get_subdirectory():
-                    fire_event(DepsListSubdirectory(subdirectory=package.get_subdirectory()))
+                    self.track_package_install(
+                        package_name=package_name, source_type=source_type, version=version
+                    )
 
-                self.track_package_install(
-                    package_name=package_name, source_type=source_type, version=version
-                )
+            write_installed_packages(self.project.packages_install_path, installed)
 
             if packages_to_upgrade:
                 fire_event(Formatting(""))
                 fire_event(DepsNotifyUpdatesAvailable(packages=packages_to_upgrade))
+
+    def _clean_packages_install_path(self, keep: Set[str]) -> None:
+        """Remove everything from packages_install_path except the directories in `keep`."""
+        install_path = self.project.packages_install_path
+        if not keep:
+            if system.path_exists(install_path):
+                system.rmtree(install_path)
+        else:
+            for name in os.listdir(install_path):
+                path = os.path.join(install_path, name)
+                if name in keep:
+                    continue
+                elif os.path.isdir(path) and not system.path_is_symlink(path):
+                    system.rmtree(path)
+                else:
+                    system.remove_file(path)
+        system.make_directory(install_path)
+
+    def _install_package(
+        self,
+        package: PinnedPackage,
+        key: Optional[str],
+        renderer: PackageRenderer,
+        store: Optional[PackageStore],
+    ) -> str:
+        """Install a package, returning the name of its directory in packages_install_path."""
+        if store is None or key is None:
+            package.install(self.project, renderer)
+            return package.get_project_name(self.project, renderer)
+
+        entry = store.get(key)
+        if entry is None:
+            entry = store.add(
+                key,
+                package.get_project_name(self.project, renderer),
+                functools.partial(package.install_to, self.project, renderer),
+            )
+        name, contents_path = entry
+        fire_event(DepsLinkFromPackageStore(path=contents_path))
+        link_tree(contents_path, os.path.join(self.project.packages_install_path, name))
+        return name
@@ -1,16 +1,32 @@
+import base64
 import os
 import shutil
+import zlib
+from concurrent.futures import Future, as_completed
 from dataclasses import replace
 from datetime import datetime
+from functools import partial
 from itertools import chain
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
-
-import agate
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import dbt.compilation
 import dbt.exceptions
 import dbt.utils
+import dbt_common.utils
 import dbt_common.utils.formatting
+from dbt.adapters.base import BaseAdapter, BaseRelation
+from dbt.adapters.contracts.relation import RelationConfig
 from dbt.adapters.events.types import (
     BuildingCatalog,
     CannotGenerateDocs,
@@ -42,11 +58,46 @@ from dbt.parser.manifest import write_manifest
 from dbt.task.compile import CompileTask
 from dbt.task.docs import DOCS_INDEX_FILE_PATH
 from dbt.utils.artifact_upload import add_artifact_produced
-from dbt_common.clients.system import load_file_contents
 from dbt_common.dataclass_schema import ValidationError
 from dbt_common.events.functions import fire_event
 from dbt_common.exceptions import DbtInternalError
 
+# Artifacts are copied into static_index.html in chunks of this size
+STATIC_INDEX_CHUNK_SIZE = 1024 * 1024
+
+# The placeholders in index.html that the artifacts are inlined in place of
+STATIC_INDEX_PLACEHOLDERS = {
+    "manifest": b'"MANIFEST.JSON INLINE DATA"',
+    "catalog": b'"CATALOG.JSON INLINE DATA"',
+}
+
+# With --compress-static, the docs app is started once the inlined artifacts
+# are decompressed, rather than as soon as the page is loaded
+STATIC_INDEX_NG_APP = b' ng-app="dbt"'
+STATIC_INDEX_LOADER = b"""<script>
+        (function () {
+            function inflate(name) {
+                var text = document.getElementById("dbt-inline-" + name).textContent;
+                var bytes = Uint8Array.from(atob(text), function (c) { return c.charCodeAt(0); });
+                var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+                return new Response(stream).json();
+            }
+            Promise.all([inflate("manifest"), inflate("catalog")]).then(function (data) {
+                window.dbtInlineData = { manifest: data[0], catalog: data[1] };
+                angular.bootstrap(document.documentElement, ["dbt"]);
+            });
+        })();
+    </script>
+"""
+
+# Adapters that override any of these collect their catalog their own way,
+# and keep doing so
+CATALOG_METHODS = (
+    "get_filtered_catalog",
+    "get_catalog",
+    "get_catalog_by_relations",
+)
+
 
 def get_stripped_prefix(source: Dict[str, Any], prefix: str) -> Dict[str, Any]:
     """Go through the source, extracting every key/value pair where the key starts
@@ -70,7 +121,7 @@ def build_catalog_table(data) -> CatalogTable:
 
 # keys are database name, schema name, table name
 class Catalog(Dict[CatalogKey, CatalogTable]):
-    def __init__(self, columns: List[PrimitiveDict]) -> None:
+    def __init__(self, columns: Iterable[PrimitiveDict]) -> None:
         super().__init__()
         for col in columns:
             self.add_column(col)
@@ -193,6 +244,12 @@ def mapping_key(node: ResultNode) -> CatalogKey:
     return CatalogKey(dkey, node.schema.lower(), node.identifier.lower())
 
 
+def table_key(table: CatalogTable) -> CatalogKey:
+    metadata = table.metadata
+    dkey = dbt_common.utils.formatting.lowercase(metadata.database)
+    return CatalogKey(dkey, metadata.schema.lower(), metadata.name.lower())
+
+
 def get_unique_id_mapping(
     manifest: Manifest,
 ) -> Tuple[Dict[CatalogKey, str], Dict[CatalogKey, Set[str]]]:
@@ -212,6 +269,207 @@ def get_unique_id_mapping(
     return node_map, source_map
 
 
+def collects_catalog_by_schema(adapter: BaseAdapter) -> bool:
+    """Whether the adapter collects its catalog with BaseAdapter's methods,
+    which run a query per database that can be split up by schema.
+    """
+    for name in CATALOG_METHODS:
+        method = getattr(type(adapter), name, None)
+        base_method = getattr(BaseAdapter, name)
+        if getattr(method, "__func__", method) is not getattr(
+            base_method, "__func__", base_method
+        ):
+            return False
+    return True
+
+
+def schema_key(database: Optional[str], schema: Optional[str]) -> Tuple[str, str]:
+    return (database or "").casefold(), (schema or "").casefold()
+
+
+def get_catalog_by_schema(
+    adapter: BaseAdapter,
+    relation_configs: Iterable[RelationConfig],
+    used_schemas: FrozenSet[Tuple[str, str]],
+    relations: Optional[Set[BaseRelation]] = None,
+) -> Tuple[Catalog, List[Exception]]:
+    """Collect the catalog with a call to adapter.get_filtered_catalog per
+    schema rather than one for the whole project, up to --threads at a time,
+    and add the rows of each schema to the catalog as its call completes.
+    """
+    configs_by_schema: Dict[Tuple[str, str], List[RelationConfig]] = {}
+    for relation_config in relation_configs:
+        key = schema_key(relation_config.database, relation_config.schema)
+        configs_by_schema.setdefault(key, []).append(relation_config)
+    used_by_schema: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+    for database, schema in used_schemas:
+        used_by_schema.setdefault(schema_key(database, schema), set()).add((database, schema))
+    relations_by_schema: Dict[Tuple[str, str], Set[BaseRelation]] = {}
+    for relation in relations or ():
+        key = schema_key(relation.database, relation.schema)
+        relations_by_schema.setdefault(key, set()).add(relation)
+
+    catalog = Catalog([])
+    exceptions: List[Exception] = []
+    with dbt_common.utils.executor(adapter.config) as tpe:  # type: ignore
+        futures: List[Future] = []
+        for key, schema_configs in configs_by_schema.items():
+            if key not in used_by_schema:
+                continue
+            schema_relations: Optional[Set[BaseRelation]] = None
+            if relations is not None:
+                schema_relations = relations_by_schema.get(key)
+                if not schema_relations:
+                    continue
+            fut = tpe.submit(
+                adapter.get_filtered_catalog,
+                schema_configs,
+                frozenset(used_by_schema[key]),
+                schema_relations,
+            )
+            futures.append(fut)
+
+        for future in as_completed(futures):
+            table, schema_exceptions = future.result()
+            exceptions.extend(schema_exceptions)
+            for row in table:
+                catalog.add_column(
+                    dict(zip(table.column_names, map(dbt.utils._coerce_decimal, row)))
+                )
+    return catalog, exceptions
+
+
+def get_catalog(
+    adapter: BaseAdapter,
+    relation_configs: Iterable[RelationConfig],
+    used_schemas: FrozenSet[Tuple[str, str]],
+    relations: Optional[Set[BaseRelation]] = None,
+) -> Tuple[Catalog, List[Exception]]:
+    if collects_catalog_by_schema(adapter):
+        return get_catalog_by_schema(adapter, relation_configs, used_schemas, relations)
+
+    catalog_table, exceptions = adapter.get_filtered_catalog(
+        relation_configs, used_schemas, relations
+    )
+    catalog_data: List[PrimitiveDict] = [
+        dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
+        for row in catalog_table
+    ]
+    return Catalog(catalog_data), exceptions
+
+
+def _write_bytes(data: bytes, out: BinaryIO) -> None:
+    out.write(data)
+
+
+def _copy_file(path: str, out: BinaryIO) -> None:
+    with open(path, "rb") as fp:
+        shutil.copyfileobj(fp, out, STATIC_INDEX_CHUNK_SIZE)
+
+
+def _write_gzipped_base64(path: str, out: BinaryIO) -> None:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)  # gzip format
+    pending = b""
+    with open(path, "rb") as fp:
+        for chunk in iter(partial(fp.read, STATIC_INDEX_CHUNK_SIZE), b""):
+            pending += compressor.compress(chunk)
+            # base64 encodes every 3 bytes separately
+            usable = len(pending) - len(pending) % 3
+            out.write(base64.b64encode(pending[:usable]))
+            pending = pending[usable:]
+    out.write(base64.b64encode(pending + compressor.flush()))
+
+
+def _write_compressed_artifacts(artifact_paths: Dict[str, str], out: BinaryIO) -> None:
+    for name, path in artifact_paths.items():
+        out.write(f'<script type="application/octet-stream" id="dbt-inline-{name}">'.encode())
+        _write_gzipped_base64(path, out)
+        out.write(b"</script>\n    ")
+    out.write(STATIC_INDEX_LOADER)
+
+
+def write_static_index(
+    index_path: str,
+    artifact_paths: Dict[str, str],
+    static_index_path: str,
+    compressed: bool = False,
+) -> None:
+    """Write a copy of the docs index page with the artifacts in
+    artifact_paths, keyed by the names in STATIC_INDEX_PLACEHOLDERS, inlined
+    into it. Artifacts are copied in chunks, and never read into memory whole.
+
+    With compressed, the artifacts are inlined gzipped and base64 encoded, and
+    the page decompresses them before starting the docs app.
+    """
+    with open(index_path, "rb") as fp:
+        template = fp.read()
+
+    # (offset in the template, bytes replaced, writer of the replacement)
+    splices: List[Tuple[int, bytes, Callable[[BinaryIO], None]]] = []
+    for name, placeholder in STATIC_INDEX_PLACEHOLDERS.items():
+        offset = template.find(placeholder)
+        if offset < 0 or name not in artifact_paths:
+            continue
+        if compressed:
+            expression = f"window.dbtInlineData.{name}".encode()
+            splices.append((offset, placeholder, partial(_write_bytes, expression)))
+        else:
+            splices.append((offset, placeholder, partial(_copy_file, artifact_paths[name])))
+    if compressed:
+        offset = template.find(STATIC_INDEX_NG_APP)
+        if offset < 0 or b"</body>" not in template:
+            raise DbtInternalError(f"Can't start the docs app in {index_path} after it loads")
+        splices.append((offset, STATIC_INDEX_NG_APP, partial(_write_bytes, b"")))
+        splices.append(
+            (
+                template.rindex(b"</body>"),
+                b"",
+                partial(_write_compressed_artifacts, artifact_paths),
+            )
+        )
+    splices.sort(key=lambda splice: splice[0])
+
+    template_view = memoryview(template)
+    position = 0
+    with open(static_index_path, "wb") as out:
+        for offset, replaced, write in splices:
+            out.write(template_view[position:offset])
+            write(out)
+            position = offset + len(replaced)
+        out.write(template_view[position:])
+
+
+def merge_catalog_results(
+    previous: CatalogArtifact,
+    manifest: Manifest,
+    selected_node_ids: Set[UniqueId],
+    nodes: Dict[str, CatalogTable],
+    sources: Dict[str, CatalogTable],
+) -> Tuple[Dict[str, CatalogTable], Dict[str, CatalogTable]]:
+    """Merge the tables collected for the selected nodes and sources into
+    those of a previous catalog. Tables of selected nodes that weren't
+    collected, of nodes no longer in the manifest, and of nodes whose
+    relation has since changed, are dropped.
+    """
+    merged_nodes = {
+        unique_id: table
+        for unique_id, table in previous.nodes.items()
+        if unique_id in manifest.nodes
+        and unique_id not in selected_node_ids
+        and table_key(table) == mapping_key(manifest.nodes[unique_id])
+    }
+    merged_nodes.update(nodes)
+    merged_sources = {
+        unique_id: table
+        for unique_id, table in previous.sources.items()
+        if unique_id in manifest.sources
+        and unique_id not in selected_node_ids
+        and table_key(table) == mapping_key(manifest.sources[unique_id])
+    }
+    merged_sources.update(sources)
+    return merged_nodes, merged_sources
+
+
 class GenerateTask(CompileTask):
     def run(self) -> CatalogArtifact:
         compile_results = None
@@ -247,7 +505,7 @@ class GenerateTask(CompileTask):
 
         selected_node_ids: Optional[Set[UniqueId]] = None
         if self.args.empty_catalog:
-            catalog_table: agate.Table = agate.Table([])
+            catalog = Catalog([])
             exceptions: List[Exception] = []
             selected_node_ids = set()
         else:
@@ -275,7 +533,6 @@ class GenerateTask(CompileTask):
                         for node in selected_nodes
                     }
 
-                # This generates the catalog as an agate.Table
                 catalogable_nodes = chain(
                     [
                         node
@@ -285,22 +542,22 @@ class GenerateTask(CompileTask):
                     self.manifest.sources.values(),
                 )
                 used_schemas = self.manifest.get_used_schemas()
-                catalog_table, exceptions = adapter.get_filtered_catalog(
-                    catalogable_nodes, used_schemas, relations
+                catalog, exceptions = get_catalog(
+                    adapter, catalogable_nodes, used_schemas, relations
                 )
 
-        catalog_data: List[PrimitiveDict] = [
-            dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
-            for row in catalog_table
-        ]
-
-        catalog = Catalog(catalog_data)
-
         errors: Optional[List[str]] = None
         if exceptions:
             errors = [str(e) for e in exceptions]
 
+        catalog_path = os.path.join(self.config.project_target_path, CATALOG_FILENAME)
         nodes, sources = catalog.make_unique_id_map(self.manifest, selected_node_ids)
+        if getattr(self.args, "incremental_catalog", False) and not self.args.empty_catalog:
+            previous = self._read_previous_catalog(catalog_path)
+            if previous is not None and selected_node_ids is not None:
+                nodes, sources = merge_catalog_results(
+                    previous, self.manifest, selected_node_ids, nodes, sources
+                )
         results = self.get_catalog_results(
             nodes=nodes,
             sources=sources,
@@ -309,7 +566,6 @@ class GenerateTask(CompileTask):
             errors=errors,
         )
 
-        catalog_path = os.path.join(self.config.project_target_path, CATALOG_FILENAME)
         results.write(catalog_path)
         add_artifact_produced(catalog_path)
         fire_event(
@@ -321,21 +577,16 @@ class GenerateTask(CompileTask):
 
         if self.args.static:
 
-            # Read manifest.json and catalog.json
-            read_manifest_data = load_file_contents(
-                os.path.join(self.config.project_target_path, MANIFEST_FILE_NAME)
+            # Inline manifest.json and catalog.json into a new index file
+            write_static_index(
+                DOCS_INDEX_FILE_PATH,
+                {
+                    "manifest": os.path.join(self.config.project_target_path, MANIFEST_FILE_NAME),
+                    "catalog": catalog_path,
+                },
+                os.path.join(self.config.project_target_path, "static_index.html"),
+                compressed=getattr(self.args, "compress_static", False),
             )
-            read_catalog_data = load_file_contents(catalog_path)
-
-            # Create new static index file contents
-            index_data = load_file_contents(DOCS_INDEX_FILE_PATH)
-            index_data = index_data.replace('"MANIFEST.JSON INLINE DATA"', read_manifest_data)
-            index_data = index_data.replace('"CATALOG.JSON INLINE DATA"', read_catalog_data)
-
-            # Write out the new index file
-            static_index_path = os.path.join(self.config.project_target_path, "static_index.html")
-            with open(static_index_path, "wb") as static_index_file:
-                static_index_file.write(bytes(index_data, "utf8"))
 
         if exceptions:
             fire_event(WriteCatalogFailure(num_exceptions=len(exceptions)))
@@ -381,6 +632,16 @@ class GenerateTask(CompileTask):
 
         return super().interpret_results(compile_results)
 
+    @staticmethod
+    def _read_previous_catalog(catalog_path: str) -> Optional[CatalogArtifact]:
+        if not os.path.exists(catalog_path):
+            return None
+        try:
+            return CatalogArtifact.read_and_check_versions(catalog_path)
+        except Exception:
+            # fall back to writing the catalog from scratch
+            return None
+
     @staticmethod
     def _get_nodes_from_ids(manifest: Manifest, node_ids: Iterable[str]) -> List[ResultNode]:
         selected: List[ResultNode] = []
@@ -67,8 +67,10 @@ class ListTask(GraphRunnableTask):
 
     def _iterate_selected_nodes(self):
         selector = self.get_node_selector()
+        selector.selection_cache = self.get_selection_cache()
         spec = self.get_selection_spec()
         unique_ids = sorted(selector.get_selected(spec))
+        self.write_selection_cache()
         if not unique_ids:
             warn_or_error(NoNodesSelected())
             return
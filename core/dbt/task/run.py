@@ -849,7 +849,7 @@ class RunTask(CompileTask):
         hook_obj = get_hook(statement, index=hook_index)
         return hook_obj.sql or ""
 
-    def handle_job_queue(self, pool, callback):
+    def handle_job_queue(self, pool, callback, error_callback=None):
         node = self.job_queue.get()
         self._raise_set_error()
         runner = self.get_runner(node)
@@ -864,7 +864,7 @@ class RunTask(CompileTask):
             runner.set_pool(pool)
 
         args = [runner]
-        self._submit(pool, args, callback)
+        self._submit(pool, args, callback, error_callback)
 
     def _submit_batch(
         self,
@@ -1067,8 +1067,13 @@ class RunTask(CompileTask):
         with adapter.connection_named("master"):
             self.defer_to_manifest()
             required_schemas = self.get_model_schemas(adapter, selected_uids)
-            self.create_schemas(adapter, required_schemas)
-            self.populate_adapter_cache(adapter, required_schemas)
+            # on-run-start hooks may depend on the schemas existing, so only
+            # overlap creating them with compilation when there are none
+            if self.get_hooks_by_type(RunHookType.Start) or self.config.args.single_threaded:
+                self.create_schemas(adapter, required_schemas)
+                self.populate_adapter_cache(adapter, required_schemas)
+            else:
+                self.setup_warehouse_in_background(adapter, required_schemas)
             self.populate_microbatch_batches(selected_uids)
             group_lookup.init(self.manifest, selected_uids)
             run_hooks_status = self.safe_run_hooks(adapter, RunHookType.Start, {})
@@ -1136,6 +1141,10 @@ class RunTask(CompileTask):
         else:
             return ModelRunner
 
+    def use_process_pool(self) -> bool:
+        # these runners are bound by the warehouse, not by the GIL
+        return False
+
     def task_end_messages(self, results) -> None:
         if results:
             print_run_end_messages(results)
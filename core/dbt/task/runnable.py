@@ -1,7 +1,8 @@
+import contextvars
 import os
 import time
 from abc import abstractmethod
-from concurrent.futures import as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import AbstractSet, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
@@ -20,13 +21,21 @@ from dbt.artifacts.schemas.results import (
 )
 from dbt.artifacts.schemas.run import RunExecutionResult, RunResult
 from dbt.cli.flags import Flags
+from dbt.compilation import init_compile_worker
 from dbt.config.runtime import RuntimeConfig
-from dbt.constants import RUN_RESULTS_FILE_NAME
+from dbt.constants import (
+    RUN_RESULTS_FILE_NAME,
+    SCHEMA_CACHE_FILE_NAME,
+    SELECTION_CACHE_FILE_NAME,
+)
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import Exposure, ResultNode
 from dbt.contracts.state import PreviousState
+from dbt.events.logging import event_is_consumed
 from dbt.events.types import (
+    AdapterCachePopulated,
     ArtifactWritten,
+    ConcurrencyAdjusted,
     ConcurrencyLine,
     DefaultSelector,
     EndRunResult,
@@ -36,7 +45,10 @@ from dbt.events.types import (
     NodeFinished,
     NodeStart,
     NothingToDo,
+    ProcessPoolUnsupported,
     QueryCancelationUnsupported,
+    SchemaCacheStale,
+    SchemaCacheUsed,
     SkippingDetails,
 )
 from dbt.exceptions import DbtInternalError, DbtRuntimeError, FailFastError
@@ -48,11 +60,13 @@ from dbt.graph import (
     UniqueId,
     parse_difference,
 )
-from dbt.graph.thread_pool import DbtThreadPool
+from dbt.graph.selection_cache import SelectionCache
+from dbt.graph.thread_pool import AdaptiveConcurrency, DbtProcessPool, DbtThreadPool
 from dbt.parser.manifest import write_manifest
 from dbt.task import group_lookup
 from dbt.task.base import BaseRunner, ConfiguredTask
 from dbt.task.printer import print_run_end_messages, print_run_result_error
+from dbt.task.schema_cache import SchemaCache
 from dbt.utils.artifact_upload import add_artifact_produced
 from dbt_common.context import _INVOCATION_CONTEXT_VAR, get_invocation_context
 from dbt_common.dataclass_schema import StrEnum
@@ -91,6 +105,11 @@ class GraphRunnableTask(ConfiguredTask):
         self.previous_defer_state: Optional[PreviousState] = None
         self.run_count: int = 0
         self.started_at: float = 0
+        self._process_pool: Optional[DbtProcessPool] = None
+        self._schema_cache: Optional[SchemaCache] = None
+        self._selection_cache: Optional[SelectionCache] = None
+        self._schemas_from_cache: Set[Tuple[Optional[str], str]] = set()
+        self._warehouse_ready: Optional[Future] = None
 
         if self.args.state:
             self.previous_state = PreviousState(
@@ -152,8 +171,28 @@ class GraphRunnableTask(ConfiguredTask):
             )
         self.manifest.merge_from_artifact(other=deferred_manifest)
 
+    def get_selection_cache(self) -> Optional[SelectionCache]:
+        """Return the cache of the selections made by previous invocations of
+        this task, or None if it is turned off with --no-selection-cache.
+        """
+        if self._selection_cache is None:
+            if self.manifest is None or not getattr(get_flags(), "SELECTION_CACHE", False):
+                return None
+            self._selection_cache = SelectionCache.for_task(
+                os.path.join(self.config.project_target_path, SELECTION_CACHE_FILE_NAME),
+                type(self).__name__,
+                self.manifest,
+                self.previous_state,
+            )
+        return self._selection_cache
+
+    def write_selection_cache(self) -> None:
+        if self._selection_cache is not None:
+            self._selection_cache.write()
+
     def get_graph_queue(self) -> GraphQueue:
         selector = self.get_node_selector()
+        selector.selection_cache = self.get_selection_cache()
         # Following uses self.selection_arg and self.exclusion_arg
         spec = self.get_selection_spec()
 
@@ -161,7 +200,9 @@ class GraphRunnableTask(ConfiguredTask):
         if self.get_run_mode() == GraphRunnableMode.Independent:
             preserve_edges = False
 
-        return selector.get_graph_queue(spec, preserve_edges)
+        queue = selector.get_graph_queue(spec, preserve_edges)
+        self.write_selection_cache()
+        return queue
 
     def get_run_mode(self) -> GraphRunnableMode:
         return GraphRunnableMode.Topological
@@ -220,18 +261,20 @@ class GraphRunnableTask(ConfiguredTask):
         if cls is None:
             raise DbtInternalError("Could not find runner type for node.")
 
-        return cls(self.config, adapter, node, run_count, num_nodes)
+        runner = cls(self.config, adapter, node, run_count, num_nodes)
+        if self._process_pool is not None:
+            runner.set_process_pool(self._process_pool)
+        if self._warehouse_ready is not None:
+            runner.set_warehouse_ready(self._warehouse_ready)
+        return runner
 
     def call_runner(self, runner: BaseRunner) -> RunResult:
         with log_contextvars(node_info=runner.node.node_info):
             runner.node.update_event_status(
                 started_at=datetime.utcnow().isoformat(), node_status=RunningStatus.Started
             )
-            fire_event(
-                NodeStart(
-                    node_info=runner.node.node_info,
-                )
-            )
+            if event_is_consumed(NodeStart):
+                fire_event(NodeStart(node_info=runner.node.node_info))
             try:
                 result = runner.run_with_hooks(self.manifest)
             except (KeyboardInterrupt, SystemExit) as exe:
@@ -243,12 +286,13 @@ class GraphRunnableTask(ConfiguredTask):
                 thread_exception = e
             finally:
                 if result is not None:
-                    fire_event(
-                        NodeFinished(
-                            node_info=runner.node.node_info,
-                            run_result=result.to_msg_dict(),
+                    if event_is_consumed(NodeFinished):
+                        fire_event(
+                            NodeFinished(
+                                node_info=runner.node.node_info,
+                                run_result=result.to_msg_dict(),
+                            )
                         )
-                    )
                 else:
                     msg = f"Exception on worker thread. {thread_exception}"
 
@@ -295,7 +339,7 @@ class GraphRunnableTask(ConfiguredTask):
 
         return result
 
-    def _submit(self, pool, args, callback):
+    def _submit(self, pool, args, callback, error_callback=None):
         """If the caller has passed the magic 'single-threaded' flag, call the
         function directly instead of pool.apply_async. The single-threaded flag
          is intended for gathering more useful performance information about
@@ -303,33 +347,83 @@ class GraphRunnableTask(ConfiguredTask):
         tools ignore child threads.
 
         This does still go through the callback path for result collection.
+        `error_callback` is called instead of `callback` if `call_runner`
+        raises on the pool.
         """
         if self.config.args.single_threaded:
             callback(self.call_runner(*args))
         else:
-            pool.apply_async(self.call_runner, args=args, callback=callback)
+            pool.apply_async(
+                self.call_runner, args=args, callback=callback, error_callback=error_callback
+            )
 
     def _raise_set_error(self):
         if self._raise_next_tick is not None:
             raise self._raise_next_tick
 
+    def _get_adaptive_concurrency(self) -> Optional[AdaptiveConcurrency]:
+        if not getattr(self.args, "adaptive_threads", False) or self.config.args.single_threaded:
+            return None
+        return AdaptiveConcurrency(min_threads=1, max_threads=self.config.threads)
+
+    def _adjust_concurrency(
+        self, concurrency: AdaptiveConcurrency, result: Optional[RunResult]
+    ) -> None:
+        """Return the permit of a node that finished with `result` (None if it
+        raised instead), which adjusts the limit, and report the adjustment.
+        """
+        if result is None or result.status == NodeStatus.Skipped:
+            latency = None
+        else:
+            latency = result.execution_time
+        ready = self.job_queue.ready_count() if self.job_queue is not None else 0
+        previous_threads, threads, reason = concurrency.release(latency, ready)
+        fire_event(
+            ConcurrencyAdjusted(
+                previous_threads=previous_threads,
+                threads=threads,
+                reason=reason,
+                active=concurrency.active,
+                ready=ready,
+                latency=latency or 0.0,
+                short_latency=concurrency.short_latency or 0.0,
+                long_latency=concurrency.long_latency or 0.0,
+            )
+        )
+
     def run_queue(self, pool):
         """Given a pool, submit jobs from the queue to the pool."""
         if self.job_queue is None:
             raise DbtInternalError("Got to run_queue with no job queue set")
 
+        # with --adaptive-threads, only a varying number of the pool's threads
+        # is allowed to execute nodes at the same time
+        concurrency = self._get_adaptive_concurrency()
+
         def callback(result):
             """Note: mark_done, at a minimum, must happen here or dbt will
             deadlock during ephemeral result error handling!
             """
-            self._handle_result(result)
+            try:
+                self._handle_result(result)
 
-            if self.job_queue is None:
-                raise DbtInternalError("Got to run_queue callback with no job queue set")
-            self.job_queue.mark_done(result.node.unique_id)
+                if self.job_queue is None:
+                    raise DbtInternalError("Got to run_queue callback with no job queue set")
+                self.job_queue.mark_done(result.node.unique_id)
+            finally:
+                if concurrency is not None:
+                    self._adjust_concurrency(concurrency, result)
+
+        def error_callback(exc):
+            # call_runner raised, so callback won't be called with a result.
+            # Return the node's permit, or the next acquire() blocks forever.
+            if concurrency is not None:
+                self._adjust_concurrency(concurrency, None)
 
         while not self.job_queue.empty():
-            self.handle_job_queue(pool, callback)
+            if concurrency is not None:
+                concurrency.acquire()
+            self.handle_job_queue(pool, callback, error_callback)
 
         # block on completion
         if get_flags().FAIL_FAST:
@@ -347,7 +441,7 @@ class GraphRunnableTask(ConfiguredTask):
         return
 
     # The build command overrides this
-    def handle_job_queue(self, pool, callback):
+    def handle_job_queue(self, pool, callback, error_callback=None):
         node = self.job_queue.get()
         self._raise_set_error()
         runner = self.get_runner(node)
@@ -357,7 +451,7 @@ class GraphRunnableTask(ConfiguredTask):
             cause = self._skipped_children.pop(runner.node.unique_id)
             runner.do_skip(cause=cause)
         args = [runner]
-        self._submit(pool, args, callback)
+        self._submit(pool, args, callback, error_callback)
 
     def _handle_result(self, result: RunResult) -> None:
         """Mark the result as completed, insert the `CompileResultNode` into
@@ -381,6 +475,40 @@ class GraphRunnableTask(ConfiguredTask):
                 cause = None
             self._mark_dependent_errors(node.unique_id, result, cause)
 
+        if result.status == NodeStatus.Error and self._schemas_from_cache:
+            self._verify_cached_schema(node)
+
+    def _verify_cached_schema(self, node: ResultNode) -> None:
+        """If a node failed in a schema that was only known to exist because
+        of the schema cache, the schema may have been dropped since it was
+        cached. Check whether it still exists, and create it if it doesn't so
+        that the remaining nodes in it (and the next invocation) can succeed.
+        """
+        if not node.is_relational or node.is_ephemeral_model or node.schema is None:
+            return
+        db_schema = (dbt_common.utils.formatting.lowercase(node.database), node.schema.lower())
+        if db_schema not in self._schemas_from_cache:
+            return
+        self._schemas_from_cache.discard(db_schema)
+
+        adapter = get_adapter(self.config)
+        relation = adapter.Relation.create_from(self.config, node).without_identifier()
+        try:
+            with adapter.connection_named(f"verify_{node.database or ''}_{node.schema}"):
+                if adapter.check_schema_exists(node.database, node.schema):
+                    return
+                adapter.create_schema(relation)
+        except DbtRuntimeError:
+            # the node has failed either way; make sure the next invocation
+            # lists the database rather than trusting the cache
+            pass
+        else:
+            fire_event(SchemaCacheStale(database=node.database or "", schema=node.schema))
+
+        if self._schema_cache is not None:
+            self._schema_cache.invalidate(node.database)
+            self._schema_cache.write()
+
     def _cancel_connections(self, pool):
         """Given a pool, cancel all adapter connections and wait until all
         runners gentle terminates.
@@ -405,9 +533,56 @@ class GraphRunnableTask(ConfiguredTask):
 
         pool.join()
 
+    def use_process_pool(self) -> bool:
+        """Tasks whose runners are CPU-bound (i.e. only compile) can return True
+        to compile nodes in forked worker processes, sidestepping the GIL. The
+        runners themselves still run on the thread pool, so tasks whose runners
+        talk to the warehouse should not opt in.
+        """
+        return False
+
+    def _start_process_pool(self, num_processes: int) -> None:
+        if not self.use_process_pool() or self.config.args.single_threaded:
+            return
+        if not DbtProcessPool.is_supported():
+            fire_event(
+                ProcessPoolUnsupported(
+                    reason="the 'fork' start method is not available on this platform"
+                )
+            )
+            return
+        # e.g. the logger thread of --log-async or the sampling profiler
+        running_threads = DbtProcessPool.running_threads()
+        if running_threads:
+            fire_event(
+                ProcessPoolUnsupported(
+                    reason=f"other threads are running ({', '.join(running_threads)})"
+                )
+            )
+            return
+        # The pool is started after deferral and before any nodes are compiled,
+        # so every worker gets a snapshot of the complete manifest exactly once
+        self._process_pool = DbtProcessPool(
+            num_processes,
+            init_compile_worker,
+            (self.config, self.manifest, get_invocation_context()),
+        )
+
+    def _stop_process_pool(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+
     def execute_nodes(self):
         num_threads = self.config.threads
 
+        self._start_process_pool(num_threads)
+        try:
+            return self._execute_nodes(num_threads)
+        finally:
+            self._stop_process_pool()
+
+    def _execute_nodes(self, num_threads: int):
         pool = DbtThreadPool(
             num_threads, self._pool_thread_initializer, [get_invocation_context()]
         )
@@ -453,6 +628,10 @@ class GraphRunnableTask(ConfiguredTask):
         pool.close()
         pool.join()
 
+        if self._warehouse_ready is not None:
+            # trigger/re-raise any exceptions while setting up the warehouse
+            self._warehouse_ready.result()
+
         return self.node_results
 
     @staticmethod
@@ -464,13 +643,14 @@ class GraphRunnableTask(ConfiguredTask):
     ) -> None:
         if self.graph is None:
             raise DbtInternalError("graph is None in _mark_dependent_errors")
-        fire_event(
-            MarkSkippedChildren(
-                unique_id=node_id,
-                status=result.status,
-                run_result=result.to_msg_dict(),
+        if event_is_consumed(MarkSkippedChildren):
+            fire_event(
+                MarkSkippedChildren(
+                    unique_id=node_id,
+                    status=result.status,
+                    run_result=result.to_msg_dict(),
+                )
             )
-        )
         for dep_node_id in self.graph.get_dependent_nodes(UniqueId(node_id)):
             self._skipped_children[dep_node_id] = cause
 
@@ -484,29 +664,135 @@ class GraphRunnableTask(ConfiguredTask):
             raise DbtInternalError("manifest was None in populate_adapter_cache")
 
         start_populate_cache = time.perf_counter()
-        # the cache only cares about executable nodes
-        cachable_nodes = [
-            node
-            for node in self.manifest.nodes.values()
-            if (node.is_relational and not node.is_ephemeral_model and not node.is_external_node)
-        ]
-
-        if get_flags().CACHE_SELECTED_ONLY is True:
+        selected_only = get_flags().CACHE_SELECTED_ONLY is True
+        if selected_only:
+            cachable_nodes, cache_schemas = self.get_selected_cache_relations(adapter)
+            required_schemas = cache_schemas | (required_schemas or set())
+        else:
+            # the cache only cares about executable nodes
+            cachable_nodes = [
+                node for node in self.manifest.nodes.values() if self._is_cachable(node)
+            ]
+        if getattr(self.args, "REUSE_ADAPTER", False):
+            # The relation cache is kept from earlier invocations in the same
+            # session, so only list the schemas it doesn't know yet
+            if not selected_only:
+                required_schemas = {
+                    adapter.Relation.create_from(self.config, node).without_identifier()
+                    for node in cachable_nodes
+                } | (required_schemas or set())
+            required_schemas = {
+                schema
+                for schema in required_schemas or set()
+                if (schema.database, schema.schema) not in adapter.cache
+            }
+            if required_schemas:
+                adapter.set_relations_cache(cachable_nodes, required_schemas=required_schemas)
+        elif selected_only:
             adapter.set_relations_cache(cachable_nodes, required_schemas=required_schemas)
         else:
             adapter.set_relations_cache(cachable_nodes)
         cache_populate_time = time.perf_counter() - start_populate_cache
+
+        num_schemas = len(adapter.cache.schemas)
+        num_relations = len(adapter.cache.relations)
+        fire_event(
+            AdapterCachePopulated(
+                num_schemas=num_schemas,
+                num_relations=num_relations,
+                elapsed=cache_populate_time,
+                selected_only=selected_only,
+            )
+        )
         if dbt.tracking.active_user is not None:
             dbt.tracking.track_runnable_timing(
-                {"adapter_cache_construction_elapsed": cache_populate_time}
+                {
+                    "adapter_cache_construction_elapsed": cache_populate_time,
+                    "adapter_cache_schemas": num_schemas,
+                    "adapter_cache_relations": num_relations,
+                }
             )
 
+    @staticmethod
+    def _is_cachable(node) -> bool:
+        return node.is_relational and not node.is_ephemeral_model and not node.is_external_node
+
+    def get_selected_cache_relations(self, adapter) -> Tuple[List[ResultNode], Set[BaseRelation]]:
+        """Return the nodes whose relations will be looked up in the relation
+        cache when running the selected nodes, and the schemas they are in.
+
+        That is the selected nodes themselves, plus the nodes they `ref`,
+        looking through ephemeral models, and the relations any of those were
+        deferred to. A ref to an unselected node is resolved to its deferred
+        relation without a lookup when favoring state, so only the deferred
+        relation's schema is included for those.
+        """
+        if self.manifest is None:
+            raise DbtInternalError("manifest was None in get_selected_cache_relations")
+
+        selected_uids = {node.unique_id for node in self._flattened_nodes or []}
+        favor_state = bool(
+            getattr(self.args, "defer", None) and getattr(self.args, "favor_state", None)
+        )
+        nodes: Dict[str, ResultNode] = {}
+        schemas: Set[BaseRelation] = set()
+        visited: Set[str] = set()
+        to_visit = list(selected_uids)
+        while to_visit:
+            unique_id = to_visit.pop()
+            if unique_id in visited or unique_id not in self.manifest.nodes:
+                continue
+            visited.add(unique_id)
+            node = self.manifest.nodes[unique_id]
+            selected = unique_id in selected_uids
+            if selected or node.is_ephemeral_model:
+                to_visit.extend(node.depends_on_nodes)
+
+            if not self._is_cachable(node):
+                continue
+            defer_relation = getattr(node, "defer_relation", None)
+            if defer_relation is not None:
+                schemas.add(
+                    adapter.Relation.create_from(self.config, defer_relation).without_identifier()
+                )
+                if favor_state and not selected:
+                    continue
+            nodes[unique_id] = node
+            schemas.add(adapter.Relation.create_from(self.config, node).without_identifier())
+
+        return list(nodes.values()), schemas
+
     def before_run(self, adapter: BaseAdapter, selected_uids: AbstractSet[str]) -> RunStatus:
         with adapter.connection_named("master"):
             self.defer_to_manifest()
             self.populate_adapter_cache(adapter)
             return RunStatus.Success
 
+    def setup_warehouse_in_background(
+        self, adapter: BaseAdapter, required_schemas: Set[BaseRelation]
+    ) -> None:
+        """Create the required schemas and populate the adapter cache on a
+        separate thread, so that the first nodes can be compiled in the
+        meantime. Runners wait for it to finish before executing anything.
+        """
+
+        def setup_warehouse() -> None:
+            with adapter.connection_named("master"):
+                self.create_schemas(adapter, required_schemas)
+                self.populate_adapter_cache(adapter, required_schemas)
+
+        def on_done(future: Future) -> None:
+            exc = future.exception()
+            if exc is not None and self._raise_next_tick is None:
+                if not isinstance(exc, DbtRuntimeError):
+                    exc = DbtRuntimeError(str(exc))
+                self._raise_next_tick = exc
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._warehouse_ready = executor.submit(contextvars.copy_context().run, setup_warehouse)
+        self._warehouse_ready.add_done_callback(on_done)
+        executor.shutdown(wait=False)
+
     def after_run(self, adapter, results) -> None:
         pass
 
@@ -561,7 +847,9 @@ class GraphRunnableTask(ConfiguredTask):
 
             self.after_run(adapter, res)
         finally:
-            adapter.cleanup_connections()
+            # a dbtSession keeps the connections open for its next invocation
+            if not getattr(self.args, "REUSE_ADAPTER", False):
+                adapter.cleanup_connections()
             elapsed = time.time() - self.started_at
             self.print_results_line(self.node_results, elapsed)
             result = self.get_result(
@@ -654,12 +942,27 @@ class GraphRunnableTask(ConfiguredTask):
 
         return result
 
+    def _get_schema_cache(self) -> Optional[SchemaCache]:
+        ttl = getattr(self.args, "schema_cache_ttl", 0)
+        if not ttl:
+            return None
+        return SchemaCache(
+            os.path.join(self.config.project_target_path, SCHEMA_CACHE_FILE_NAME),
+            f"{self.config.profile_name}.{self.config.target_name}",
+            ttl,
+        )
+
     def create_schemas(self, adapter, required_schemas: Set[BaseRelation]):
+        schema_cache = self._schema_cache = self._get_schema_cache()
+
         # we want the string form of the information schema database
-        required_databases: Set[BaseRelation] = set()
+        # relations only compare equal when their schemas match too, so collect
+        # one per database to list each database once
+        required_databases: Dict[Optional[str], BaseRelation] = {}
         for required in required_schemas:
             db_only = required.include(database=True, schema=False, identifier=False)
-            required_databases.add(db_only)
+            db_lowercase = dbt_common.utils.formatting.lowercase(db_only.database)
+            required_databases.setdefault(db_lowercase, db_only)
 
         existing_schemas_lowered: Set[Tuple[Optional[str], Optional[str]]]
         existing_schemas_lowered = set()
@@ -685,23 +988,42 @@ class GraphRunnableTask(ConfiguredTask):
             schema = relation.schema
             with adapter.connection_named(f"create_{db}_{schema}"):
                 adapter.create_schema(relation)
+            if schema_cache is not None:
+                schema_cache.add(relation.database, schema)
 
-        list_futures = []
+        list_futures: Dict[Future, BaseRelation] = {}
         create_futures = []
 
         # TODO: following has a mypy issue because profile and project config
         # defines threads as int and HasThreadingConfig defines it as Optional[int]
         with dbt_common.utils.executor(self.config) as tpe:  # type: ignore
-            for req in required_databases:
+            for req in required_databases.values():
+                cached_schemas = schema_cache.get(req.database) if schema_cache else None
+                if schema_cache is not None and cached_schemas is not None:
+                    db_lowercase = dbt_common.utils.formatting.lowercase(req.database)
+                    from_cache = {(db_lowercase, s) for s in cached_schemas}
+                    self._schemas_from_cache.update(from_cache)
+                    existing_schemas_lowered.update(from_cache)
+                    fire_event(
+                        SchemaCacheUsed(
+                            database=req.database or "",
+                            num_schemas=len(cached_schemas),
+                            age=time.time() - (schema_cache.listed_at(req.database) or 0),
+                        )
+                    )
+                    continue
                 if req.database is None:
                     name = "list_schemas"
                 else:
                     name = f"list_{req.database}"
                 fut = tpe.submit_connected(adapter, name, list_schemas, req)
-                list_futures.append(fut)
+                list_futures[fut] = req
 
             for ls_future in as_completed(list_futures):
-                existing_schemas_lowered.update(ls_future.result())
+                listed = ls_future.result()
+                existing_schemas_lowered.update(listed)
+                if schema_cache is not None:
+                    schema_cache.set(list_futures[ls_future].database, (s for _, s in listed))
 
             for info in required_schemas:
                 if info.schema is None:
@@ -720,9 +1042,13 @@ class GraphRunnableTask(ConfiguredTask):
                     )
                     create_futures.append(fut)
 
-            for create_future in as_completed(create_futures):
-                # trigger/re-raise any exceptions while creating schemas
-                create_future.result()
+            try:
+                for create_future in as_completed(create_futures):
+                    # trigger/re-raise any exceptions while creating schemas
+                    create_future.result()
+            finally:
+                if schema_cache is not None:
+                    schema_cache.write()
 
     def get_result(self, results, elapsed_time, generated_at):
         return RunExecutionResult(
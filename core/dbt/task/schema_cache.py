@@ -0,0 +1,79 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+from dbt_common.clients.system import write_file
+
+
+def _key(database: Optional[str]) -> str:
+    return (database or "").lower()
+
+
+class SchemaCache:
+    """Schemas known to exist in each database of a target, persisted between
+    invocations so that `create_schemas` doesn't have to list them every time.
+
+    Entries are keyed by target and database, and expire `ttl` seconds after
+    the database was last listed. Like `create_schemas`, database and schema
+    names are compared lowercased, and databases are stored under "" when the
+    warehouse doesn't support them.
+    """
+
+    def __init__(self, path: str, target_key: str, ttl: int) -> None:
+        self.path = path
+        self.target_key = target_key
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self._targets: Dict[str, Dict[str, Dict[str, Any]]] = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as fp:
+                targets = json.load(fp)
+        except (OSError, ValueError):
+            # a corrupt cache is no worse than no cache
+            return {}
+        return targets if isinstance(targets, dict) else {}
+
+    @property
+    def _databases(self) -> Dict[str, Dict[str, Any]]:
+        return self._targets.setdefault(self.target_key, {})
+
+    def get(self, database: Optional[str]) -> Optional[Set[str]]:
+        """Return the cached schemas of a database, or None if it has to be listed."""
+        with self.lock:
+            entry = self._databases.get(_key(database))
+            if entry is None or time.time() - entry["listed_at"] > self.ttl:
+                return None
+            return set(entry["schemas"])
+
+    def listed_at(self, database: Optional[str]) -> Optional[float]:
+        with self.lock:
+            entry = self._databases.get(_key(database))
+            return entry["listed_at"] if entry else None
+
+    def set(self, database: Optional[str], schemas: Iterable[str]) -> None:
+        with self.lock:
+            self._databases[_key(database)] = {
+                "listed_at": time.time(),
+                "schemas": sorted({s.lower() for s in schemas}),
+            }
+
+    def add(self, database: Optional[str], schema: str) -> None:
+        """Record a schema created by dbt, without changing when the database was listed."""
+        with self.lock:
+            entry = self._databases.get(_key(database))
+            if entry is not None and schema.lower() not in entry["schemas"]:
+                entry["schemas"].append(schema.lower())
+
+    def invalidate(self, database: Optional[str]) -> None:
+        with self.lock:
+            self._databases.pop(_key(database), None)
+
+    def write(self) -> None:
+        with self.lock:
+            write_file(self.path, json.dumps(self._targets))
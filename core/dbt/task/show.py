@@ -71,6 +71,10 @@ class ShowTask(CompileTask):
         else:
             return ShowRunner
 
+    def use_process_pool(self) -> bool:
+        # show runners execute queries, so they stay on threads
+        return False
+
     def task_end_messages(self, results) -> None:
         is_inline = bool(getattr(self.args, "inline", None))
 
@@ -2,6 +2,7 @@ import io
 import json
 import re
 import threading
+from collections import Counter
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
@@ -21,11 +22,14 @@ from dbt.adapters.exceptions import MissingMaterializationError
 from dbt.artifacts.schemas.catalog import PrimitiveDict
 from dbt.artifacts.schemas.results import TestStatus
 from dbt.artifacts.schemas.run import RunResult
+from dbt.cli.flags import Flags
 from dbt.clients.jinja import MacroGenerator
+from dbt.config.runtime import RuntimeConfig
 from dbt.context.providers import generate_runtime_model_context
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import (
     GenericTestNode,
+    ModelNode,
     SingularTestNode,
     TestNode,
     UnitTestDefinition,
@@ -36,7 +40,11 @@ from dbt.exceptions import BooleanError, DbtInternalError
 from dbt.flags import get_flags
 from dbt.graph import ResourceTypeSelector
 from dbt.node_types import TEST_NODE_TYPES, NodeType
-from dbt.parser.unit_tests import UnitTestManifestLoader
+from dbt.parser.unit_tests import (
+    ColumnTypes,
+    UnitTestManifestCache,
+    UnitTestManifestLoader,
+)
 from dbt.task import group_lookup
 from dbt.task.base import BaseRunner, resource_types_from_args
 from dbt.task.compile import CompileRunner
@@ -94,6 +102,13 @@ class UnitTestResultData(dbtClassMixin):
 class TestRunner(CompileRunner):
     _ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
+    def __init__(self, config, adapter, node, node_index: int, num_nodes: int) -> None:
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        self.unit_test_cache: Optional[UnitTestManifestCache] = None
+
+    def set_unit_test_cache(self, unit_test_cache: UnitTestManifestCache) -> None:
+        self.unit_test_cache = unit_test_cache
+
     def describe_node_name(self) -> str:
         if self.node.resource_type == NodeType.Unit:
             name = f"{self.node.model}::{self.node.versioned_name}"
@@ -195,18 +210,47 @@ class TestRunner(CompileRunner):
         TestResultData.validate(test_result_dct)
         return TestResultData.from_dict(test_result_dct)
 
+    def _get_fixture_column_types(self, input_node: ModelNode) -> Optional[ColumnTypes]:
+        # This mirrors the lookup in the get_fixture_sql macro. If it fails,
+        # the macro will look the columns up again and report the error.
+        relation = self.adapter.Relation.create_from(self.config, input_node)
+        try:
+            if input_node.defer_relation and not self.adapter.get_relation(
+                relation.database, relation.schema, relation.identifier
+            ):
+                relation = self.adapter.Relation.create_from(
+                    self.config, input_node.defer_relation
+                )
+            columns = self.adapter.get_columns_in_relation(relation)
+        except DbtBaseException:
+            return None
+        return {column.name.lower(): column.data_type for column in columns} or None
+
+    def get_unit_test_manifest_loader(
+        self, unit_test_def: UnitTestDefinition, manifest: Manifest
+    ) -> UnitTestManifestLoader:
+        # a loader for a unit test manifest with only the test from this UnitTestDefinition
+        if self.unit_test_cache is None:
+            return UnitTestManifestLoader(manifest, self.config, {unit_test_def.unique_id})
+        return UnitTestManifestLoader(
+            manifest,
+            self.config,
+            {unit_test_def.unique_id},
+            cache=self.unit_test_cache,
+            get_column_types=self._get_fixture_column_types,
+        )
+
     def build_unit_test_manifest_from_test(
         self, unit_test_def: UnitTestDefinition, manifest: Manifest
     ) -> Manifest:
-        # build a unit test manifest with only the test from this UnitTestDefinition
-        loader = UnitTestManifestLoader(manifest, self.config, {unit_test_def.unique_id})
-        return loader.load()
+        return self.get_unit_test_manifest_loader(unit_test_def, manifest).load()
 
     def execute_unit_test(
         self, unit_test_def: UnitTestDefinition, manifest: Manifest
     ) -> Tuple[UnitTestNode, UnitTestResultData]:
 
-        unit_test_manifest = self.build_unit_test_manifest_from_test(unit_test_def, manifest)
+        loader = self.get_unit_test_manifest_loader(unit_test_def, manifest)
+        unit_test_manifest = loader.load()
 
         # The unit test node and definition have the same unique_id
         unit_test_node = unit_test_manifest.nodes[unit_test_def.unique_id]
@@ -215,6 +259,7 @@ class TestRunner(CompileRunner):
         # Compile the node
         unit_test_node = self.compiler.compile_node(unit_test_node, unit_test_manifest, {})
         assert isinstance(unit_test_node, UnitTestNode)
+        loader.cache_compiled_fixtures()
 
         # generate_runtime_unit_test_context not strictly needed - this is to run the 'unit'
         # materialization, not compile the node.compiled_code
@@ -255,22 +300,25 @@ class TestRunner(CompileRunner):
         result = context["load_result"]("main")
         adapter_response = result["response"].to_dict(omit_none=True)
         table = result["table"]
-        actual = self._get_unit_test_agate_table(table, "actual")
-        expected = self._get_unit_test_agate_table(table, "expected")
 
         # generate diff, if exists
         should_error, diff = False, None
-        daff_diff = self._get_daff_diff(expected, actual)
-        if daff_diff.hasDifference():
-            should_error = True
-            rendered = self._render_daff_diff(daff_diff)
-            rendered = f"\n\n{green('actual')} differs from {red('expected')}:\n\n{rendered}\n"
-
-            diff = UnitTestDiff(
-                actual=json_rows_from_table(actual),
-                expected=json_rows_from_table(expected),
-                rendered=rendered,
-            )
+        # Most tests pass, so check for that first without building a diff
+        actual_rows, expected_rows = self._split_unit_test_rows(table)
+        if not unit_test_rows_match(expected_rows, actual_rows):
+            actual = self._get_unit_test_agate_table(table, "actual")
+            expected = self._get_unit_test_agate_table(table, "expected")
+            daff_diff = self._get_daff_diff(expected, actual)
+            if daff_diff.hasDifference():
+                should_error = True
+                rendered = self._render_daff_diff(daff_diff)
+                rendered = f"\n\n{green('actual')} differs from {red('expected')}:\n\n{rendered}\n"
+
+                diff = UnitTestDiff(
+                    actual=json_rows_from_table(actual),
+                    expected=json_rows_from_table(expected),
+                    rendered=rendered,
+                )
 
         unit_test_result_data = UnitTestResultData(
             diff=diff,
@@ -355,6 +403,22 @@ class TestRunner(CompileRunner):
     def after_execute(self, result) -> None:
         self.print_result_line(result)
 
+    @staticmethod
+    def _split_unit_test_rows(
+        result_table: "agate.Table",
+    ) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+        """Split the rows of a unit test's result into its actual and expected
+        rows, without the actual_or_expected column.
+        """
+        column_index = result_table.column_names.index("actual_or_expected")
+        actual: List[Tuple[Any, ...]] = []
+        expected: List[Tuple[Any, ...]] = []
+        for row in result_table.rows:
+            values = tuple(row)
+            rows = actual if values[column_index] == "actual" else expected
+            rows.append(values[:column_index] + values[column_index + 1 :])
+        return actual, expected
+
     def _get_unit_test_agate_table(self, result_table, actual_or_expected: str):
         unit_test_table = result_table.where(
             lambda row: row["actual_or_expected"] == actual_or_expected
@@ -401,6 +465,11 @@ class TestTask(RunTask):
 
     __test__ = False
 
+    def __init__(self, args: Flags, config: RuntimeConfig, manifest: Manifest) -> None:
+        super().__init__(args, config, manifest)
+        # shared by the unit tests run in this invocation
+        self.unit_test_cache = UnitTestManifestCache()
+
     def raise_on_first_error(self) -> bool:
         return False
 
@@ -427,6 +496,12 @@ class TestTask(RunTask):
     def get_runner_type(self, _) -> Optional[Type[BaseRunner]]:
         return TestRunner
 
+    def get_runner(self, node) -> BaseRunner:
+        runner = super().get_runner(node)
+        if isinstance(runner, TestRunner):
+            runner.set_unit_test_cache(self.unit_test_cache)
+        return runner
+
 
 # This was originally in agate_helper, but that was moved out into dbt_common
 def json_rows_from_table(table: "agate.Table") -> List[Dict[str, Any]]:
@@ -437,6 +512,23 @@ def json_rows_from_table(table: "agate.Table") -> List[Dict[str, Any]]:
     return json.loads(output.getvalue())
 
 
+def unit_test_rows_match(
+    expected_rows: List[Tuple[Any, ...]], actual_rows: List[Tuple[Any, ...]]
+) -> bool:
+    """Return True if the actual rows of a unit test are the expected rows, in
+    any order. Both come from the same result table, so their columns match.
+
+    A False result means a diff is needed to tell, not that the rows differ.
+    """
+    if len(expected_rows) != len(actual_rows):
+        return False
+    try:
+        return Counter(expected_rows) == Counter(actual_rows)
+    except TypeError:
+        # unhashable values, e.g. from json columns
+        return False
+
+
 # This was originally in agate_helper, but that was moved out into dbt_common
 def list_rows_from_table(table: "agate.Table", sort: bool = False) -> List[Any]:
     """
@@ -352,9 +352,13 @@ def args_to_dict(args):
             "fail_fast",
             "warn_error",
             "single_threaded",
+            "process_pool",
+            "adaptive_threads",
+            "log_async",
             "log_cache_events",
             "store_failures",
             "use_experimental_parser",
+            "record_parse_timing",
         )
         default_empty_yaml_dict_keys = ("vars", "warn_error_options")
         if key in default_false_keys and var_args[key] is False:
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""Measure how long importing the dbt CLI takes, using `python -X importtime`.
+
+Starting the CLI should only import what parsing the command line needs: the
+tasks, adapters, event types and the libraries they use are imported by the
+commands that need them. Exits non-zero if the import takes longer than the
+budget, or if it imports any of the modules that should be imported lazily.
+
+    python scripts/bench_import_time.py --budget-ms 300
+"""
+import argparse
+import subprocess
+import sys
+
+# Modules that must not be imported just to start the CLI
+LAZY_MODULES = [
+    "agate",
+    "networkx",
+    "jinja2",
+    "dbt.adapters.factory",
+    "dbt.contracts.graph.manifest",
+    "dbt.events.core_types_pb2",
+    "dbt.events.types",
+    "dbt.parser.manifest",
+    "dbt.task.base",
+]
+
+
+def import_times(module):
+    """Return the cumulative import time in microseconds of `module` and of
+    each module it imports, imported in a fresh interpreter.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Each import is listed after the imports it triggered, indented by how
+    # deeply it is nested. The top level imports before `module` are the
+    # interpreter's own startup.
+    times = {}
+    group = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        group[name.strip()] = int(cumulative)
+        if name[1:2] != " ":
+            if name.strip() == module:
+                times.update(group)
+            group = {}
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="dbt.cli.main")
+    parser.add_argument("--budget-ms", type=float, default=300.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times[args.module])
+    total_ms = best[args.module] / 1000
+
+    print(f"import {args.module}: {total_ms:.1f}ms (best of {args.repeat})")
+    for name, cumulative in sorted(best.items(), key=lambda item: item[1], reverse=True)[
+        1 : args.top + 1
+    ]:
+        print(f"  {cumulative / 1000:8.1f}ms  {name}")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in best]
+    if eager:
+        print(f"imported modules that should be imported lazily: {', '.join(eager)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"over the budget of {args.budget_ms:.0f}ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
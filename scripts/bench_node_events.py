@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""Time the per-node cost of the NodeStart and NodeFinished events fired for
+each node a task runs, building them always and only when a logger or callback
+would handle them.
+
+    python scripts/bench_node_events.py --nodes 2000 --log-level-file info
+"""
+import argparse
+import tempfile
+import time
+from argparse import Namespace
+from datetime import datetime
+
+from dbt.artifacts.resources.types import NodeType
+from dbt.artifacts.schemas.results import RunningStatus, RunStatus, TimingInfo
+from dbt.artifacts.schemas.run import RunResult
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.nodes import ModelNode
+from dbt.events.logging import event_is_consumed, setup_event_logger
+from dbt.events.types import NodeFinished, NodeStart
+from dbt.flags import get_flags, set_from_args
+from dbt_common.events.contextvars import log_contextvars
+from dbt_common.events.functions import fire_event
+
+
+def make_nodes(count):
+    nodes = []
+    for i in range(count):
+        node = ModelNode(
+            language="sql",
+            raw_code="select 1 as id",
+            database="dbt",
+            schema="dbt_schema",
+            alias=f"model_{i}",
+            name=f"model_{i}",
+            fqn=["bench", f"model_{i}"],
+            unique_id=f"model.bench.model_{i}",
+            package_name="bench",
+            path=f"model_{i}.sql",
+            original_file_path=f"models/model_{i}.sql",
+            resource_type=NodeType.Model,
+            checksum=FileHash.from_contents(""),
+            meta={"owner": "bench", "tier": i % 3},
+        )
+        result = RunResult(
+            status=RunStatus.Success,
+            timing=[TimingInfo(name="execute", started_at=datetime.now())],
+            thread_id="Thread-1",
+            execution_time=0.1,
+            adapter_response={"_message": "OK", "rows_affected": 1},
+            message="OK",
+            failures=None,
+            batch_results=None,
+            node=node,
+        )
+        nodes.append((node, result))
+    return nodes
+
+
+def fire_always(node, result):
+    with log_contextvars(node_info=node.node_info):
+        node.update_event_status(
+            started_at=datetime.utcnow().isoformat(), node_status=RunningStatus.Started
+        )
+        fire_event(NodeStart(node_info=node.node_info))
+        fire_event(NodeFinished(node_info=node.node_info, run_result=result.to_msg_dict()))
+
+
+def fire_if_consumed(node, result):
+    with log_contextvars(node_info=node.node_info):
+        node.update_event_status(
+            started_at=datetime.utcnow().isoformat(), node_status=RunningStatus.Started
+        )
+        if event_is_consumed(NodeStart):
+            fire_event(NodeStart(node_info=node.node_info))
+        if event_is_consumed(NodeFinished):
+            fire_event(NodeFinished(node_info=node.node_info, run_result=result.to_msg_dict()))
+
+
+def per_node_us(nodes, fire, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for node, result in nodes:
+            fire(node, result)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / len(nodes) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--log-level-file", default="info")
+    args = parser.parse_args()
+
+    nodes = make_nodes(args.nodes)
+    with tempfile.TemporaryDirectory() as log_path:
+        set_from_args(
+            Namespace(
+                log_path=log_path,
+                log_level=args.log_level,
+                log_level_file=args.log_level_file,
+            ),
+            {},
+        )
+        setup_event_logger(get_flags())
+        always = per_node_us(nodes, fire_always, args.repeat)
+        if_consumed = per_node_us(nodes, fire_if_consumed, args.repeat)
+
+    print(f"log level {args.log_level}, file log level {args.log_level_file}")
+    print(f"always built:          {always:8.1f}us per node")
+    print(f"built when consumed:   {if_consumed:8.1f}us per node ({always / if_consumed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Time loading large generated schema files, with and without the schema
+yaml cache that dbt keeps in the target directory.
+
+    python scripts/bench_schema_yaml.py --models 500 --columns 100
+"""
+import argparse
+import tempfile
+import time
+
+import yaml
+
+from dbt.clients.yaml_helper import Dumper, Loader
+from dbt.contracts.files import FileHash, FilePath, ParseFileType, SchemaSourceFile
+from dbt.parser.schemas import yaml_from_file
+from dbt.parser.yaml_cache import SchemaYamlCache
+
+
+def generate_schema(models, columns):
+    return {
+        "version": 2,
+        "models": [
+            {
+                "name": f"model_{m}",
+                "description": f"Model {m}",
+                "columns": [
+                    {
+                        "name": f"column_{c}",
+                        "description": f"Column {c} of model {m}",
+                        "data_tests": ["not_null"] if c == 0 else [],
+                    }
+                    for c in range(columns)
+                ],
+            }
+            for m in range(models)
+        ],
+        "sources": [
+            {
+                "name": "raw",
+                "tables": [
+                    {"name": f"table_{m}", "loaded_at_field": "updated_at"} for m in range(models)
+                ],
+            }
+        ],
+    }
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=500)
+    parser.add_argument("--columns", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    contents = yaml.dump(generate_schema(args.models, args.columns), Dumper=Dumper).strip()
+    source_file = SchemaSourceFile(
+        path=FilePath(
+            searched_path="models",
+            relative_path="schema.yml",
+            modification_time=0.0,
+            project_root=".",
+        ),
+        checksum=FileHash.from_contents(contents),
+        project_name="bench",
+        parse_file_type=ParseFileType.Schema,
+        contents=contents,
+    )
+    print(f"{len(contents) / 1024 / 1024:.1f} MiB, libyaml: {Loader.__name__ == 'CLoader'}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = f"{tmp_dir}/schema_yaml_cache.msgpack"
+        uncached = best_of(args.repeat, lambda: yaml_from_file(source_file))
+
+        cache = SchemaYamlCache(cache_path)
+        yaml_from_file(source_file, cache)
+        cache.write([source_file.checksum.checksum])
+        cached = best_of(
+            args.repeat,
+            lambda: yaml_from_file(source_file, SchemaYamlCache.from_file(cache_path)),
+        )
+
+    print(f"yaml load:   {uncached:.3f}s")
+    print(f"cached load: {cached:.3f}s ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
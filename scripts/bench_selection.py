@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Time node selection for composite selection specs on a generated project,
+with a not_null test on each model and a relationships test on every tenth.
+
+    python scripts/bench_selection.py --models 5000
+"""
+import argparse
+import time
+from argparse import Namespace
+
+from dbt.artifacts.resources import DependsOn, TestMetadata
+from dbt.compilation import Linker
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import GenericTestNode, ModelNode
+from dbt.flags import set_from_args
+from dbt.graph import Graph, NodeSelector, parse_difference
+from dbt.node_types import NodeType
+
+SPECS = {
+    "tags with children": (["tag:tag_1+", "tag:tag_2+", "tag:tag_3+"], None),
+    "models and parents": ([f"+model_{i}" for i in range(0, 5000, 250)], None),
+    "intersection": (["tag:tag_1,+model_4999", "tag:tag_2,+model_4999"], None),
+    "exclude": (["fqn:*"], ["tag:tag_1", "tag:tag_1+"]),
+    "cautious": (["tag:tag_1+", "tag:tag_2"], None),
+}
+
+
+def make_model(i):
+    parents = [f"model.bench.model_{p}" for p in (i - 1, i // 2) if p >= 0 and p != i]
+    return ModelNode(
+        language="sql",
+        raw_code="select 1 as id",
+        database="dbt",
+        schema="dbt_schema",
+        alias=f"model_{i}",
+        name=f"model_{i}",
+        fqn=["bench", f"layer_{i % 10}", f"model_{i}"],
+        unique_id=f"model.bench.model_{i}",
+        package_name="bench",
+        path=f"layer_{i % 10}/model_{i}.sql",
+        original_file_path=f"models/layer_{i % 10}/model_{i}.sql",
+        resource_type=NodeType.Model,
+        checksum=FileHash.from_contents(""),
+        tags=[f"tag_{i % 7}"],
+        depends_on=DependsOn(nodes=sorted(set(parents))),
+    )
+
+
+def make_test(name, parents):
+    return GenericTestNode(
+        language="sql",
+        raw_code="select 1",
+        test_metadata=TestMetadata(name=name.split("_")[0], kwargs={}),
+        database="dbt",
+        schema="dbt_schema",
+        alias=name,
+        name=name,
+        fqn=["bench", name],
+        unique_id=f"test.bench.{name}",
+        package_name="bench",
+        path=f"{name}.sql",
+        original_file_path="models/schema.yml",
+        resource_type=NodeType.Test,
+        checksum=FileHash.from_contents(""),
+        depends_on=DependsOn(nodes=parents),
+    )
+
+
+def make_manifest(models):
+    nodes = {}
+    for i in range(models):
+        model = make_model(i)
+        nodes[model.unique_id] = model
+        test = make_test(f"not_null_model_{i}", [model.unique_id])
+        nodes[test.unique_id] = test
+        if i % 10 == 0 and i > 0:
+            test = make_test(
+                f"relationships_model_{i}", [model.unique_id, f"model.bench.model_{i // 3}"]
+            )
+            nodes[test.unique_id] = test
+    return Manifest(nodes=nodes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    manifest = make_manifest(args.models)
+    linker = Linker()
+    for node in manifest.nodes.values():
+        linker.dependency(node.unique_id, node.unique_id)
+        for parent in node.depends_on_nodes:
+            linker.dependency(node.unique_id, parent)
+    graph = Graph(linker.graph)
+
+    for name, (select, exclude) in SPECS.items():
+        indirect_selection = "cautious" if name == "cautious" else "eager"
+        set_from_args(Namespace(INDIRECT_SELECTION=indirect_selection), {})
+        spec = parse_difference(select, exclude)
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            selector = NodeSelector(graph, manifest)
+            selected = selector.get_selected(spec)
+            timings.append(time.perf_counter() - start)
+        print(f"{name + ':':22s}{min(timings) * 1000:8.1f}ms  {len(selected)} nodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import json
 import os
 import random
 import shutil
@@ -208,29 +209,29 @@ class TestChangedSeedContents(BaseModifiedState):
         seed_contents = "\n".join(seed_lines)
         write_file(seed_contents, "seeds", "seed.csv")
 
-        # now if we run again, we should get a warning
+        # large seeds are hashed by their contents like any other seed
         results = run_dbt(
             ["ls", "--resource-type", "seed", "--select", "state:modified", "--state", "./state"]
         )
         assert len(results) == 1
         assert results[0] == "test.seed"
 
-        with pytest.raises(CompilationError) as exc:
-            run_dbt(
-                [
-                    "--warn-error",
-                    "ls",
-                    "--resource-type",
-                    "seed",
-                    "--select",
-                    "state:modified",
-                    "--state",
-                    "./state",
-                ]
-            )
-        assert ">1MB" in str(exc.value)
+        # and there is nothing to warn about
+        results = run_dbt(
+            [
+                "--warn-error",
+                "ls",
+                "--resource-type",
+                "seed",
+                "--select",
+                "state:modified",
+                "--state",
+                "./state",
+            ]
+        )
+        assert len(results) == 1
+        assert results[0] == "test.seed"
 
-        # now check if unmodified returns none
         results = run_dbt(
             ["ls", "--resource-type", "seed", "--select", "state:unmodified", "--state", "./state"]
         )
@@ -239,42 +240,53 @@ class TestChangedSeedContents(BaseModifiedState):
         shutil.rmtree("./state")
         self.copy_state()
 
-        # once it"s in path mode, we don"t mark it as modified if it changes
-        write_file(seed_contents + "\n1,test", "seeds", "seed.csv")
+        # an unchanged large seed is unmodified
+        results = run_dbt(
+            ["ls", "--resource-type", "seed", "--select", "state:unmodified", "--state", "./state"]
+        )
+        assert len(results) == 1
+        assert results[0] == "test.seed"
 
         results = run_dbt(
-            ["ls", "--resource-type", "seed", "--select", "state:modified", "--state", "./state"],
-            expect_pass=True,
+            ["ls", "--resource-type", "seed", "--select", "state:modified", "--state", "./state"]
         )
         assert len(results) == 0
 
+        # and a large seed whose contents change is modified
+        write_file(seed_contents + "\n1,test", "seeds", "seed.csv")
+
         results = run_dbt(
-            [
-                "ls",
-                "--resource-type",
-                "seed",
-                "--exclude",
-                "state:unmodified",
-                "--state",
-                "./state",
-            ],
-            expect_pass=True,
+            ["ls", "--resource-type", "seed", "--select", "state:modified", "--state", "./state"]
+        )
+        assert len(results) == 1
+        assert results[0] == "test.seed"
+
+        results = run_dbt(
+            ["ls", "--resource-type", "seed", "--select", "state:unmodified", "--state", "./state"]
         )
         assert len(results) == 0
 
+        # a seed hashed by its path, by an older version of dbt, is modified
+        write_file(seed_contents, "seeds", "seed.csv")
+        with open("state/manifest.json") as fp:
+            manifest = json.load(fp)
+        manifest["nodes"]["seed.test.seed"]["checksum"] = {
+            "name": "path",
+            "checksum": os.path.join("seeds", "seed.csv"),
+        }
+        with open("state/manifest.json", "w") as fp:
+            json.dump(manifest, fp)
+
         results = run_dbt(
-            [
-                "ls",
-                "--resource-type",
-                "seed",
-                "--select",
-                "state:unmodified",
-                "--state",
-                "./state",
-            ],
-            expect_pass=True,
+            ["ls", "--resource-type", "seed", "--select", "state:modified", "--state", "./state"]
         )
         assert len(results) == 1
+        assert results[0] == "test.seed"
+
+        results = run_dbt(
+            ["ls", "--resource-type", "seed", "--select", "state:unmodified", "--state", "./state"]
+        )
+        assert len(results) == 0
 
 
 class TestChangedSeedConfig(BaseModifiedState):
@@ -1,7 +1,12 @@
+import subprocess
+import sys
+from argparse import Namespace
+from unittest import mock
+
 import click
 
 from dbt.cli.flags import command_args
-from dbt.cli.main import cli
+from dbt.cli.main import cli, dbtSession
 from dbt.cli.types import Command
 
 
@@ -52,3 +57,76 @@ class TestCLI:
                 continue
             cmd = Command.from_str(command.name)
             command_args(cmd)
+
+    def test_import_is_lazy(self):
+        # starting the CLI shouldn't import the tasks, adapters or event types
+        lazy_modules = [
+            "agate",
+            "networkx",
+            "dbt.adapters.factory",
+            "dbt.events.types",
+            "dbt.parser.manifest",
+            "dbt.task.base",
+        ]
+        code = f"import sys, dbt.cli.main; print([m for m in {lazy_modules} if m in sys.modules])"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "[]"
+
+
+class TestDbtSession:
+    def flags(self, tmp_path, **kwargs):
+        args = dict(
+            PROJECT_DIR=str(tmp_path),
+            PROFILES_DIR=str(tmp_path),
+            PROFILE=None,
+            TARGET=None,
+            THREADS=None,
+            VARS={},
+            VERSION_CHECK=True,
+            WHICH="run",
+        )
+        args.update(kwargs)
+        return Namespace(**args)
+
+    def test_keeps_state_until_it_changes(self, tmp_path):
+        (tmp_path / "dbt_project.yml").write_text("name: test\n")
+        session = dbtSession(manifest=mock.sentinel.manifest)
+        load_profile = mock.Mock(side_effect=lambda: mock.Mock())
+        load_project = mock.Mock(side_effect=lambda: mock.Mock())
+
+        def invoke(flags):
+            profile = session.get_profile(flags, load_profile)
+            session.get_project(flags, profile, load_project)
+            session.adapter_ready = True
+
+        # the first invocation starts with the manifest the session was created with
+        invoke(self.flags(tmp_path))
+        assert session.manifest is mock.sentinel.manifest
+        invoke(self.flags(tmp_path))
+        assert load_profile.call_count == load_project.call_count == 1
+        assert session.adapter_ready
+
+        invoke(self.flags(tmp_path, VARS={"a": 1}))
+        assert load_profile.call_count == load_project.call_count == 2
+        assert session.manifest is None
+
+        session.manifest = mock.sentinel.parsed
+        (tmp_path / "dbt_project.yml").write_text("name: changed\n")
+        invoke(self.flags(tmp_path, VARS={"a": 1}))
+        assert load_profile.call_count == 2
+        assert load_project.call_count == 3
+        assert session.manifest is None
+
+        # parse always reparses
+        session.manifest = mock.sentinel.parsed
+        session.adapter_ready = True
+        with session.invocation(self.flags(tmp_path, WHICH="parse")):
+            assert session.manifest is None
+            assert not session.adapter_ready
+
+        # projects loaded without the session's profile aren't kept
+        session.get_project(self.flags(tmp_path), mock.Mock(), load_project)
+        session.get_project(self.flags(tmp_path), mock.Mock(), load_project)
+        assert load_project.call_count == 5
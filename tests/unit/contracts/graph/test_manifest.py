@@ -26,7 +26,12 @@ from dbt.artifacts.resources import (
     WhereFilterIntersection,
 )
 from dbt.contracts.files import FileHash
-from dbt.contracts.graph.manifest import DisabledLookup, Manifest, ManifestMetadata
+from dbt.contracts.graph.manifest import (
+    DisabledLookup,
+    Manifest,
+    ManifestMetadata,
+    build_node_edges,
+)
 from dbt.contracts.graph.nodes import (
     DependsOn,
     Exposure,
@@ -2152,3 +2157,40 @@ class TestDisabledLookup:
         lookup = DisabledLookup(manifest)
 
         assert lookup.find("name", "package", resource_types=[]) is None
+
+
+def test_build_parent_and_child_maps_incrementally():
+    model_one = MockNode("pkg", "model_one", depends_on_nodes=[])
+    model_two = MockNode("pkg", "model_two", depends_on_nodes=["model.pkg.model_one"])
+    model_three = MockNode(
+        "pkg", "model_three", depends_on_nodes=["model.pkg.model_two", "model.pkg.missing"]
+    )
+    manifest = make_manifest(nodes=[model_one, model_two, model_three])
+
+    def assert_maps_match():
+        manifest.build_parent_and_child_maps()
+        child_map, parent_map = build_node_edges(list(manifest.nodes.values()))
+        assert manifest.child_map == child_map
+        assert list(manifest.child_map) == list(child_map)
+        assert manifest.parent_map == parent_map
+        assert list(manifest.parent_map) == list(parent_map)
+
+    assert_maps_match()
+    assert manifest.child_map["model.pkg.model_one"] == ["model.pkg.model_two"]
+
+    # dependencies are added to depends_on in place
+    model_three.depends_on_nodes.append("model.pkg.model_one")
+    assert_maps_match()
+    assert manifest.child_map["model.pkg.model_one"] == [
+        "model.pkg.model_three",
+        "model.pkg.model_two",
+    ]
+
+    del manifest.nodes["model.pkg.model_two"]
+    assert_maps_match()
+    assert manifest.child_map["model.pkg.model_one"] == ["model.pkg.model_three"]
+
+    missing = MockNode("pkg", "missing", depends_on_nodes=[])
+    manifest.nodes[missing.unique_id] = missing
+    assert_maps_match()
+    assert manifest.child_map["model.pkg.missing"] == ["model.pkg.model_three"]
@@ -0,0 +1,48 @@
+import os
+
+from dbt.deps.git import GitPinnedPackage
+from dbt.deps.local import LocalPinnedPackage
+from dbt.deps.registry import RegistryPinnedPackage
+from dbt.deps.store import PackageStore, link_tree, package_key
+
+
+def test_package_key():
+    sha = "0" * 40
+    assert package_key(RegistryPinnedPackage("org/pkg", "1.0.0", "1.0.0")) == package_key(
+        RegistryPinnedPackage("org/pkg", "1.0.0", "1.1.0")
+    )
+    assert package_key(RegistryPinnedPackage("org/pkg", "1.0.0", "1.0.0")) != package_key(
+        RegistryPinnedPackage("org/pkg", "1.0.1", "1.0.1")
+    )
+    assert package_key(GitPinnedPackage("url", "url", sha)) != package_key(
+        GitPinnedPackage("url", "url", sha, subdirectory="sub")
+    )
+    # contents that can change without the spec changing are never stored
+    assert package_key(GitPinnedPackage("url", "url", "main")) is None
+    assert package_key(LocalPinnedPackage("../pkg")) is None
+
+
+def _install(path):
+    os.makedirs(os.path.join(path, "macros"))
+    with open(os.path.join(path, "macros", "m.sql"), "w") as fp:
+        fp.write("{% macro m() %}{% endmacro %}")
+
+
+def test_package_store(tmp_path):
+    store = PackageStore(str(tmp_path / "store"))
+    assert store.get("abcdef") is None
+
+    name, contents_path = store.add("abcdef", "pkg", _install)
+    assert name == "pkg"
+    assert store.get("abcdef") == (name, contents_path)
+
+    # storing the same package again (e.g. from a concurrent install) keeps the first copy
+    assert store.add("abcdef", "pkg", _install) == (name, contents_path)
+    assert sorted(os.listdir(os.path.dirname(contents_path))) == ["contents", "package.json"]
+    assert os.listdir(tmp_path / "store" / "ab") == ["abcdef"]
+
+    link_tree(contents_path, str(tmp_path / "dbt_packages" / "pkg"))
+    assert os.path.samefile(
+        os.path.join(contents_path, "macros", "m.sql"),
+        tmp_path / "dbt_packages" / "pkg" / "macros" / "m.sql",
+    )
@@ -1,12 +1,26 @@
+import threading
 from argparse import Namespace
 
+import pytest
 from pytest_mock import MockerFixture
 
-from dbt.events.logging import setup_event_logger
+from dbt.events.logging import (
+    AsyncEventManager,
+    event_is_consumed,
+    flush_event_logger,
+    setup_event_logger,
+)
+from dbt.events.types import LogEventsDropped, MainReportVersion, NodeStart
 from dbt.flags import get_flags, set_from_args
-from dbt_common.events.base_types import BaseEvent
-from dbt_common.events.event_manager_client import get_event_manager
+from dbt_common.events.base_types import BaseEvent, EventLevel
+from dbt_common.events.event_manager import EventManager, TestEventManager
+from dbt_common.events.event_manager_client import (
+    ctx_set_event_manager,
+    get_event_manager,
+)
 from dbt_common.events.logger import LoggerConfig
+from dbt_common.events.types import Note
+from dbt_common.exceptions.events import EventCompilationError
 from tests.utils import EventCatcher
 
 
@@ -36,3 +50,90 @@ class TestSetupEventLogger:
         patched_file_handler.assert_called_once_with(
             filename="logs/dbt.log", encoding="utf8", maxBytes=1234567, backupCount=5
         )
+
+
+class TestEventIsConsumed:
+    def test_event_is_consumed(self) -> None:
+        set_from_args(Namespace(log_level="info", log_level_file="none"), {})
+        setup_event_logger(get_flags())
+        assert not event_is_consumed(NodeStart)
+        assert event_is_consumed(NodeStart, EventLevel.INFO)
+        assert event_is_consumed(MainReportVersion)
+        assert event_is_consumed(Note, EventLevel.WARN)
+
+        set_from_args(Namespace(log_level="info", log_level_file="debug"), {})
+        setup_event_logger(get_flags())
+        assert event_is_consumed(NodeStart)
+
+        set_from_args(Namespace(log_level="none", log_level_file="none"), {})
+        setup_event_logger(get_flags(), callbacks=[EventCatcher(NodeStart).catch])
+        assert event_is_consumed(NodeStart)
+
+    def test_other_event_managers_consume_everything(self) -> None:
+        ctx_set_event_manager(TestEventManager())
+        try:
+            assert event_is_consumed(NodeStart)
+        finally:
+            ctx_set_event_manager(EventManager())
+
+
+class TestAsyncEventManager:
+    @pytest.fixture
+    def manager(self):
+        manager = AsyncEventManager(queue_size=2, overflow="drop")
+        yield manager
+        manager.close()
+
+    def test_dispatches_in_order_on_its_own_thread(self, manager) -> None:
+        threads = set()
+        catcher = EventCatcher(Note)
+        manager.add_callback(lambda msg: threads.add(threading.current_thread().name))
+        manager.add_callback(catcher.catch)
+        for i in range(20):
+            manager.fire_event(Note(msg=str(i)), level=EventLevel.INFO)
+        manager.flush()
+
+        assert [msg.data.msg for msg in catcher.caught_events] == [str(i) for i in range(20)]
+        assert threads == {"dbt-events"}
+
+    def test_drops_debug_events_when_full(self, manager) -> None:
+        handling, release = threading.Event(), threading.Event()
+        catcher = EventCatcher(Note)
+        dropped = EventCatcher(LogEventsDropped)
+
+        def block(msg) -> None:
+            handling.set()
+            release.wait()
+
+        manager.add_callback(block)
+        manager.add_callback(catcher.catch)
+        manager.add_callback(dropped.catch)
+        manager.fire_event(Note(msg="0"), level=EventLevel.DEBUG)
+        handling.wait()
+        # two of these fill the queue and the rest are dropped
+        for i in range(1, 6):
+            manager.fire_event(Note(msg=str(i)), level=EventLevel.DEBUG)
+        release.set()
+        manager.flush()
+
+        assert [msg.data.msg for msg in catcher.caught_events] == ["0", "1", "2"]
+        assert dropped.caught_events[0].data.count == 3
+        assert manager.dropped == 0
+
+    def test_raises_warnings_as_errors_when_fired(self, manager) -> None:
+        manager.warn_error = True
+        with pytest.raises(EventCompilationError):
+            manager.fire_event(Note(msg="warning"), force_warn_or_error_handling=True)
+
+    def test_setup_event_logger(self) -> None:
+        set_from_args(Namespace(log_level="none", log_level_file="none", log_async=True), {})
+        setup_event_logger(get_flags())
+        manager = get_event_manager()
+        assert isinstance(manager, AsyncEventManager)
+
+        set_from_args(Namespace(log_level="none", log_level_file="none"), {})
+        setup_event_logger(get_flags())
+        assert not manager._thread.is_alive()
+        assert type(get_event_manager()) is EventManager
+        flush_event_logger()
+        ctx_set_event_manager(EventManager())
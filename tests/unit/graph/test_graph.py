@@ -162,3 +162,28 @@ class TestGraph:
         # neither nodes parents set is a subset of the other
         assert not non_shareds_parents.issubset(tables_parents)
         assert not tables_parents.issubset(non_shareds_parents)
+
+    def test_subgraph(
+        self,
+        graph: Graph,
+        extra_parent_model: ModelNode,
+        non_shared_child_of_extra: ModelNode,
+        model_with_two_direct_parents: ModelNode,
+    ) -> None:
+        nodes = {
+            extra_parent_model.unique_id,
+            non_shared_child_of_extra.unique_id,
+            model_with_two_direct_parents.unique_id,
+        }
+        subgraph = graph.subgraph(nodes)
+
+        assert subgraph.nodes() == nodes
+        assert set(subgraph.edges()) == {
+            (extra_parent_model.unique_id, non_shared_child_of_extra.unique_id),
+            (extra_parent_model.unique_id, model_with_two_direct_parents.unique_id),
+        }
+        # the subgraph is a copy, not a view of the graph
+        subgraph.graph.remove_node(extra_parent_model.unique_id)
+        assert extra_parent_model.unique_id in graph.nodes()
+        # a subgraph of all of the nodes is the graph itself
+        assert graph.subgraph(graph.nodes()).graph is graph.graph
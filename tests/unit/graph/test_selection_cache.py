@@ -0,0 +1,183 @@
+import copy
+from argparse import Namespace
+from unittest import mock
+
+import networkx as nx
+import pytest
+
+from dbt.contracts.files import FileHash, FilePath, SourceFile
+from dbt.exceptions import InvalidSelectorError
+from dbt.flags import set_from_args
+from dbt.graph import (
+    Graph,
+    NodeSelector,
+    ResourceTypeSelector,
+    SelectionCriteria,
+    SelectionUnion,
+    parse_difference,
+)
+from dbt.graph.selection_cache import SelectionCache, manifest_checksum
+from dbt.node_types import NodeType
+from tests.unit.utils.manifest import make_manifest, make_model
+
+set_from_args(Namespace(WARN_ERROR=False), None)
+
+
+def make_source_file(file_path, contents):
+    searched_path, relative_path = file_path.split("/", 1)
+    return SourceFile(
+        path=FilePath(
+            searched_path=searched_path,
+            relative_path=relative_path,
+            modification_time=0.0,
+            project_root="/path/does/not/exist",
+        ),
+        checksum=FileHash.from_contents(contents),
+        project_name="pkg",
+    )
+
+
+@pytest.fixture
+def manifest():
+    model_one = make_model(pkg="pkg", name="model_one", code="select 1")
+    model_two = make_model(
+        pkg="pkg", name="model_two", code="select * from {{ ref('model_one') }}", refs=[model_one]
+    )
+    files = {
+        f"pkg://{model.original_file_path}": make_source_file(
+            model.original_file_path, model.raw_code
+        )
+        for model in (model_one, model_two)
+    }
+    return make_manifest(nodes=[model_one, model_two], files=files)
+
+
+@pytest.fixture
+def graph(manifest):
+    graph = nx.DiGraph()
+    graph.add_nodes_from(manifest.nodes)
+    graph.add_edge("model.pkg.model_one", "model.pkg.model_two")
+    return Graph(graph)
+
+
+def children_of_model_one(indirect_selection):
+    return SelectionUnion(
+        [
+            SelectionCriteria.selection_criteria_from_dict(
+                "model_one+",
+                {"value": "model_one", "children": "+", "indirect_selection": indirect_selection},
+            )
+        ]
+    )
+
+
+def cached_selector(graph, manifest, path):
+    selector = NodeSelector(graph, manifest)
+    selector.selection_cache = SelectionCache.for_task(str(path), "RunTask", manifest, None)
+    return selector
+
+
+def test_manifest_checksum(manifest):
+    checksum = manifest_checksum(manifest)
+    assert checksum == manifest_checksum(manifest)
+
+    manifest.env_vars["DBT_TARGET_SCHEMA"] = "dev"
+    assert manifest_checksum(manifest) != checksum
+    checksum = manifest_checksum(manifest)
+
+    manifest.state_check.vars_hash = FileHash.from_contents("{'run_date': '2024-01-01'}")
+    assert manifest_checksum(manifest) != checksum
+    checksum = manifest_checksum(manifest)
+
+    manifest.files["pkg://models/model_one.sql"] = make_source_file(
+        "models/model_one.sql", "select 2"
+    )
+    assert manifest_checksum(manifest) != checksum
+
+    # a manifest that wasn't parsed can't be checksummed
+    assert manifest_checksum(make_manifest(nodes=list(manifest.nodes.values()))) is None
+
+
+def test_selection_is_reused(graph, manifest, tmp_path):
+    path = tmp_path / "selection_cache.msgpack"
+    spec = children_of_model_one("eager")
+    selector = cached_selector(graph, manifest, path)
+    selected = selector.get_selected(spec)
+    assert selected == {"model.pkg.model_one", "model.pkg.model_two"}
+    selector.selection_cache.write()
+
+    selector = cached_selector(graph, manifest, path)
+    assert len(selector.selection_cache) == 1
+    with mock.patch.object(selector, "select_nodes", side_effect=AssertionError):
+        assert selector.get_selected(children_of_model_one("eager")) == selected
+        # the indirect selection mode is part of the key
+        with pytest.raises(AssertionError):
+            selector.get_selected(children_of_model_one("cautious"))
+
+    # selections from other selectors aren't shared
+    source_selector = ResourceTypeSelector(graph, manifest, None, [NodeType.Source])
+    source_selector.selection_cache = SelectionCache.for_task(str(path), "RunTask", manifest, None)
+    assert source_selector.get_selected(spec) == set()
+
+
+def test_selection_is_invalidated_by_changed_files(graph, manifest, tmp_path):
+    path = tmp_path / "selection_cache.msgpack"
+    spec = parse_difference(["model_one"], None)
+    selector = cached_selector(graph, manifest, path)
+    selector.get_selected(spec)
+    selector.selection_cache.write()
+
+    manifest.files["pkg://models/model_one.sql"] = make_source_file(
+        "models/model_one.sql", "select 2"
+    )
+    selector = cached_selector(graph, manifest, path)
+    with mock.patch.object(selector, "select_nodes", wraps=selector.select_nodes) as select:
+        selector.get_selected(spec)
+    assert select.called
+
+
+def test_warnings_are_fired_again(graph, manifest, tmp_path):
+    path = tmp_path / "selection_cache.msgpack"
+    spec = parse_difference(["missing"], None)
+    for _ in range(2):
+        selector = cached_selector(graph, manifest, path)
+        with mock.patch("dbt.graph.selector.warn_or_error") as warn_or_error:
+            assert selector.get_selected(spec) == set()
+        selector.selection_cache.write()
+        (call,) = warn_or_error.call_args_list
+        assert call.args[0].spec_raw == "missing"
+
+
+def test_invalid_selectors_are_not_cached(graph, manifest, tmp_path):
+    selector = cached_selector(graph, manifest, tmp_path / "selection_cache.msgpack")
+    with mock.patch.object(selector, "get_method", side_effect=InvalidSelectorError("invalid")):
+        selector.get_selected(parse_difference(["model_one"], None))
+    assert len(selector.selection_cache) == 0
+
+
+def test_state_selections_are_not_cached(graph, manifest, tmp_path):
+    previous_manifest = copy.deepcopy(manifest)
+    previous_manifest.nodes["model.pkg.model_one"].contract.enforced = True
+    previous_state = mock.MagicMock(
+        project_root=tmp_path, state_path="state", target_path="target"
+    )
+    previous_state.manifest = previous_manifest
+    spec = parse_difference(["state:modified"], None)
+    warnings = []
+    for _ in range(2):
+        selector = NodeSelector(graph, manifest, previous_state=previous_state)
+        selector.selection_cache = SelectionCache.for_task(
+            str(tmp_path / "selection_cache.msgpack"), "RunTask", manifest, previous_state
+        )
+        with mock.patch(
+            "dbt.contracts.graph.nodes.get_adapter_constraint_support", return_value={}
+        ), mock.patch("dbt.contracts.graph.nodes.warn_or_error") as warn_or_error:
+            assert "model.pkg.model_one" in selector.get_selected(spec)
+        selector.selection_cache.write()
+        assert len(selector.selection_cache) == 0
+        warnings.append([call.args[0].model_name for call in warn_or_error.call_args_list])
+    # disabling an enforced contract is a breaking change, which has to be
+    # reported every time
+    assert warnings[0]
+    assert set(warnings[0]) == {"model_one"}
+    assert warnings[1] == warnings[0]
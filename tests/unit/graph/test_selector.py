@@ -2,6 +2,7 @@ import string
 from argparse import Namespace
 from queue import Empty
 from typing import List
+from unittest import mock
 from unittest.mock import MagicMock
 
 import networkx as nx
@@ -17,6 +18,7 @@ import dbt.parser.manifest
 import dbt.utils
 import dbt_common.exceptions
 from dbt.config.runtime import RuntimeConfig
+from dbt.contracts.graph.manifest import SelectorIndex
 from dbt.flags import set_from_args
 from dbt.graph import NodeSelector, parse_difference
 from dbt.node_types import NodeType
@@ -60,7 +62,17 @@ def _get_manifest(graph):
     nodes["m.X.e"].tags = ["efg", "bcef"]
     nodes["m.Y.f"].tags = ["efg", "bcef"]
     nodes["m.X.g"].tags = ["efg"]
-    return MagicMock(nodes=nodes)
+    manifest = MagicMock(
+        nodes=nodes,
+        sources={},
+        exposures={},
+        metrics={},
+        unit_tests={},
+        semantic_models={},
+        saved_queries={},
+    )
+    manifest.selector_index = SelectorIndex(manifest)
+    return manifest
 
 
 @pytest.fixture
@@ -137,6 +149,37 @@ def test_run_specs(include, exclude, expected, graph, mock_manifest_with_mock_gr
     assert selected == expected
 
 
+def test_union_walks_graph_once(graph, mock_manifest_with_mock_graph):
+    selector = graph_selector.NodeSelector(graph, mock_manifest_with_mock_graph)
+    spec = graph_cli.parse_difference(["X.c+", "Y.b+", "missing+"], None)
+    with mock.patch.object(
+        selector.graph, "select_children", wraps=selector.graph.select_children
+    ) as select_children, mock.patch.object(graph_selector, "warn_or_error") as warn_or_error:
+        selected, _ = selector.select_nodes(spec)
+
+    assert selected == {"m.X.c", "m.Y.f", "m.X.g", "m.Y.b", "m.Y.d", "m.X.e"}
+    select_children.assert_called_once()
+    # specs that select nothing are still reported
+    (call,) = warn_or_error.call_args_list
+    assert call.args[0].spec_raw == "missing+"
+
+
+def test_repeated_criteria_are_selected_once(graph, mock_manifest_with_mock_graph):
+    selector = graph_selector.NodeSelector(graph, mock_manifest_with_mock_graph)
+    spec = graph_cli.parse_difference(["tag:abc,X.a"], ["tag:abc,Y.b"])
+    with mock.patch.object(
+        selector, "select_included", wraps=selector.select_included
+    ) as select_included:
+        selected, _ = selector.select_nodes(spec)
+
+    assert selected == {"m.X.a"}
+    assert [call.args[1].raw for call in select_included.call_args_list] == [
+        "tag:abc",
+        "X.a",
+        "Y.b",
+    ]
+
+
 param_specs = [
     ("a", False, None, False, None, "fqn", "a", False),
     ("+a", True, None, False, None, "fqn", "a", False),
@@ -8,6 +8,7 @@ import pytest
 
 import dbt_common.exceptions
 from dbt.artifacts.resources import ColumnInfo, FileHash
+from dbt.contracts.files import FilePath, SourceFile
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.state import PreviousState
 from dbt.graph.selector_methods import (
@@ -31,6 +32,7 @@ from dbt.graph.selector_methods import (
     UnitTestSelectorMethod,
     VersionSelectorMethod,
 )
+from dbt_common.events.contextvars import task_contextvars
 from tests.unit.utils import replace_config
 from tests.unit.utils.manifest import (
     make_exposure,
@@ -165,6 +167,40 @@ def test_select_tag(manifest):
     }
 
 
+def test_selector_index_follows_added_nodes(manifest):
+    methods = MethodManager(manifest, None)
+    method = methods.get_method("tag", [])
+    assert not search_manifest_using_method(manifest, method, "nightly")
+    index = manifest.selector_index
+
+    model = make_model("pkg", "nightly_model", "select 1", tags=["nightly"])
+    manifest.nodes[model.unique_id] = model
+    assert search_manifest_using_method(manifest, method, "nightly") == {"nightly_model"}
+    assert manifest.selector_index is not index
+    # only included nodes are selected
+    assert not set(method.search(set(), "nightly"))
+
+
+def test_selector_index_follows_replaced_nodes(manifest):
+    methods = MethodManager(manifest, None)
+    method = methods.get_method("tag", [])
+    model = make_model("pkg", "nightly_model", "select 1", tags=["nightly"])
+    manifest.add_node_nofile(model)
+    assert search_manifest_using_method(manifest, method, "nightly") == {"nightly_model"}
+
+    # the number of nodes doesn't change
+    del manifest.nodes[model.unique_id]
+    model = make_model("pkg", "nightly_model", "select 1", tags=["hourly"])
+    manifest.add_node_nofile(model)
+    assert not search_manifest_using_method(manifest, method, "nightly")
+    assert search_manifest_using_method(manifest, method, "hourly") == {"nightly_model"}
+
+    # deferral replaces nodes too
+    index = manifest.selector_index
+    manifest.merge_from_artifact(copy.deepcopy(manifest))
+    assert manifest.selector_index is not index
+
+
 def test_select_group(manifest, view_model):
     group_name = "my_group"
     group = make_group("test", group_name)
@@ -246,28 +282,69 @@ def test_select_source(manifest):
     }
 
 
-# TODO: this requires writing out files
-@pytest.mark.skip("TODO: write manifest files to disk")
 def test_select_path(manifest):
     methods = MethodManager(manifest, None)
     method = methods.get_method("path", [])
     assert isinstance(method, PathSelectorMethod)
     assert method.arguments == []
 
-    assert search_manifest_using_method(manifest, method, "subdirectory/*.sql") == {
-        "union_model",
-        "table_model",
-    }
-    assert search_manifest_using_method(manifest, method, "subdirectory/union_model.sql") == {
-        "union_model"
-    }
-    assert search_manifest_using_method(manifest, method, "models/*.sql") == {
-        "view_model",
-        "ephemeral_model",
-    }
-    assert not search_manifest_using_method(manifest, method, "missing")
-    assert not search_manifest_using_method(manifest, method, "models/missing.sql")
-    assert not search_manifest_using_method(manifest, method, "models/missing*")
+    # paths are matched against the files in the manifest, not the filesystem
+    project_root = "/path/does/not/exist"
+    manifest.nodes["model.pkg.view_model"].patch_path = "pkg://models/subdirectory/props.yml"
+    file_paths = {node.original_file_path for node in manifest.nodes.values()}
+    file_paths.add("models/subdirectory/props.yml")
+    for file_path in file_paths:
+        searched_path, relative_path = file_path.split("/", 1)
+        manifest.files[f"pkg://{file_path}"] = SourceFile(
+            path=FilePath(
+                searched_path=searched_path,
+                relative_path=relative_path,
+                modification_time=0.0,
+                project_root=project_root,
+            ),
+            checksum=FileHash.empty(),
+            project_name="pkg",
+        )
+
+    with task_contextvars(project_root=project_root):
+        assert search_manifest_using_method(manifest, method, "models/subdirectory/*.sql") == {
+            "table_model",
+            "union_model",
+            "mynamespace.union_model",
+            "versioned_model.v1",
+            "versioned_model.v2",
+            "versioned_model.v3",
+            "versioned_model.v12",
+        }
+        assert search_manifest_using_method(
+            manifest, method, "models/subdirectory/union_model.sql"
+        ) == {"union_model", "mynamespace.union_model"}
+        assert search_manifest_using_method(manifest, method, "models/*.sql") == {
+            "view_model",
+            "ephemeral_model",
+            "ext_model",
+            "mynamespace.ephemeral_model",
+        }
+        assert search_manifest_using_method(manifest, method, "models/*/nested_dir") == {
+            "versioned_model.v4"
+        }
+        assert search_manifest_using_method(manifest, method, "models/**/*_v3.sql") == {
+            "versioned_model.v3",
+            "versioned_model.v4",
+        }
+        # the yml file a node's properties are in selects it
+        assert search_manifest_using_method(manifest, method, "models/*/props.yml") == {
+            "view_model"
+        }
+        assert search_manifest_using_method(manifest, method, "data") == {
+            "seed",
+            "mynamespace.seed",
+        }
+        assert not search_manifest_using_method(manifest, method, "missing")
+        assert not search_manifest_using_method(manifest, method, "models/missing.sql")
+        assert not search_manifest_using_method(manifest, method, "models/missing*")
+        # parts before the last must be directories
+        assert not search_manifest_using_method(manifest, method, "models/view_model.sql/*")
 
 
 def test_select_file(manifest):
@@ -420,6 +497,11 @@ def test_select_config_meta(manifest):
         "table_model"
     }
 
+    # values that aren't strings or booleans are compared one by one
+    int_method = methods.get_method("config", ["meta", "int_property"])
+    assert not search_manifest_using_method(manifest, int_method, "1")
+    assert not search_manifest_using_method(manifest, int_method, "true")
+
     list_method = methods.get_method("config", ["meta", "list_property"])
     assert search_manifest_using_method(manifest, list_method, "some_value") == {"table_model"}
     assert search_manifest_using_method(manifest, list_method, "true") == {"table_model"}
@@ -765,64 +847,6 @@ def test_select_state_changed_seed_checksum_sha_to_sha(manifest, previous_state,
     assert "seed" not in search_manifest_using_method(manifest, method, "unmodified")
 
 
-def test_select_state_changed_seed_checksum_path_to_path(manifest, previous_state, seed):
-    change_node(
-        previous_state.manifest,
-        replace(seed, checksum=FileHash(name="path", checksum=seed.original_file_path)),
-    )
-    change_node(
-        manifest, replace(seed, checksum=FileHash(name="path", checksum=seed.original_file_path))
-    )
-    method = statemethod(manifest, previous_state)
-    with mock.patch("dbt.contracts.graph.nodes.warn_or_error") as warn_or_error_patch:
-        assert not search_manifest_using_method(manifest, method, "modified")
-        warn_or_error_patch.assert_called_once()
-        event = warn_or_error_patch.call_args[0][0]
-        assert type(event).__name__ == "SeedExceedsLimitSamePath"
-        msg = event.message()
-        assert msg.startswith("Found a seed (pkg.seed) >1MB in size")
-    with mock.patch("dbt.contracts.graph.nodes.warn_or_error") as warn_or_error_patch:
-        assert not search_manifest_using_method(manifest, method, "new")
-        warn_or_error_patch.assert_not_called()
-    with mock.patch("dbt.contracts.graph.nodes.warn_or_error") as warn_or_error_patch:
-        assert search_manifest_using_method(manifest, method, "old")
-        warn_or_error_patch.assert_not_called()
-    with mock.patch("dbt.contracts.graph.nodes.warn_or_error") as warn_or_error_patch:
-        assert search_manifest_using_method(manifest, method, "unmodified")
-        warn_or_error_patch.assert_called_once()
-        event = warn_or_error_patch.call_args[0][0]
-        assert type(event).__name__ == "SeedExceedsLimitSamePath"
-        msg = event.message()
-        assert msg.startswith("Found a seed (pkg.seed) >1MB in size")
-
-
-def test_select_state_changed_seed_checksum_sha_to_path(manifest, previous_state, seed):
-    change_node(
-        manifest, replace(seed, checksum=FileHash(name="path", checksum=seed.original_file_path))
-    )
-    method = statemethod(manifest, previous_state)
-    with mock.patch("dbt.contracts.graph.nodes.warn_or_error") as warn_or_error_patch:
-        assert search_manifest_using_method(manifest, method, "modified") == {"seed"}
-        warn_or_error_patch.assert_called_once()
-        event = warn_or_error_patch.call_args[0][0]
-        assert type(event).__name__ == "SeedIncreased"
-        msg = event.message()
-        assert msg.startswith("Found a seed (pkg.seed) >1MB in size")
-    with mock.patch("dbt.contracts.graph.nodes.warn_or_error") as warn_or_error_patch:
-        assert not search_manifest_using_method(manifest, method, "new")
-        warn_or_error_patch.assert_not_called()
-    with mock.patch("dbt.contracts.graph.nodes.warn_or_error") as warn_or_error_patch:
-        assert search_manifest_using_method(manifest, method, "old")
-        warn_or_error_patch.assert_not_called()
-    with mock.patch("dbt.contracts.graph.nodes.warn_or_error") as warn_or_error_patch:
-        assert search_manifest_using_method(manifest, method, "unmodified")
-        warn_or_error_patch.assert_called_once()
-        event = warn_or_error_patch.call_args[0][0]
-        assert type(event).__name__ == "SeedIncreased"
-        msg = event.message()
-        assert msg.startswith("Found a seed (pkg.seed) >1MB in size")
-
-
 def test_select_state_changed_seed_checksum_path_to_sha(manifest, previous_state, seed):
     change_node(
         previous_state.manifest,
@@ -0,0 +1,67 @@
+import threading
+
+from dbt.graph.thread_pool import AdaptiveConcurrency
+
+
+class TestAdaptiveConcurrency:
+    def test_starts_at_min_threads(self):
+        concurrency = AdaptiveConcurrency(min_threads=1, max_threads=4)
+        assert concurrency.limit == 1
+
+    def test_min_threads_is_clamped(self):
+        concurrency = AdaptiveConcurrency(min_threads=8, max_threads=4)
+        assert concurrency.min_threads == 4
+        concurrency = AdaptiveConcurrency(min_threads=0, max_threads=4)
+        assert concurrency.min_threads == 1
+
+    def test_shrinks_when_latency_increases(self):
+        concurrency = AdaptiveConcurrency(min_threads=1, max_threads=8)
+        concurrency.limit = 8
+        for _ in range(8):
+            concurrency.acquire()
+        assert concurrency.release(1.0, ready=0) == (8, 8, "steady")
+        concurrency.acquire()
+        assert concurrency.release(10.0, ready=0) == (8, 6, "latency increased")
+        # the nodes that were running when the limit shrank finish first
+        for _ in range(7):
+            assert concurrency.release(10.0, ready=0)[2] == "cooling down"
+        assert concurrency.limit == 6
+
+    def test_never_shrinks_below_min_threads(self):
+        concurrency = AdaptiveConcurrency(min_threads=2, max_threads=2)
+        concurrency.acquire()
+        concurrency.release(1.0, ready=0)
+        concurrency.acquire()
+        assert concurrency.release(100.0, ready=0) == (2, 2, "latency increased")
+
+    def test_grows_when_saturated_and_nodes_are_waiting(self):
+        concurrency = AdaptiveConcurrency(min_threads=1, max_threads=4)
+        concurrency.limit = 2
+        concurrency.acquire()
+        concurrency.acquire()
+        assert concurrency.release(1.0, ready=3) == (2, 3, "nodes waiting")
+        # not saturated any more
+        assert concurrency.release(1.0, ready=3) == (3, 3, "steady")
+
+    def test_skipped_nodes_do_not_count_towards_latency(self):
+        concurrency = AdaptiveConcurrency(min_threads=1, max_threads=4)
+        concurrency.acquire()
+        concurrency.release(None, ready=0)
+        assert concurrency.short_latency is None
+        assert concurrency.long_latency is None
+
+    def test_acquire_blocks_at_limit(self):
+        concurrency = AdaptiveConcurrency(min_threads=1, max_threads=1)
+        concurrency.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            concurrency.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(0.1)
+        concurrency.release(1.0, ready=0)
+        assert acquired.wait(5)
+        thread.join()
@@ -55,6 +55,8 @@ from dbt.parser.schemas import (
 )
 from dbt.parser.search import FileBlock
 from dbt.parser.sources import SourcePatcher
+from dbt.parser.yaml_cache import SchemaYamlCache
+from dbt.profiler import parse_file_timing, parse_timer
 from tests.unit.utils import (
     MockNode,
     config_from_parts_or_dicts,
@@ -241,6 +243,33 @@ sources:
 """
 
 
+# the tables share a meta dict, through the merge key
+ANCHORED_SOURCE_TABLES = """
+sources:
+    - name: my_source
+      tables:
+        - &my_table
+          name: my_table
+          loaded_at_field: updated_at
+          meta:
+            owner: data
+        - <<: *my_table
+          name: other_table
+"""
+
+# the tables only share scalars
+ANCHORED_SOURCE_TABLE_SCALARS = """
+sources:
+    - name: my_source
+      tables:
+        - &my_table
+          name: my_table
+          loaded_at_field: updated_at
+        - <<: *my_table
+          name: other_table
+"""
+
+
 MULTIPLE_TABLE_SOURCE_META = """
 sources:
     - name: my_source
@@ -563,6 +592,30 @@ class SchemaParserSourceTest(SchemaParserTest):
         with self.assertRaises(ParsingError):
             self.source_patcher.parse_source(unpatched_src_default)
 
+    def parse_with_yaml_cache(self, data, yaml_cache):
+        block = self.file_block_for(data, "test_one.yml")
+        parser = SchemaParser(
+            project=self.snowplow_project_config,
+            manifest=deepcopy(self.manifest),
+            root_project=self.root_project_config,
+        )
+        parser.parse_file(block, yaml_from_file(block.file, yaml_cache))
+        return {
+            unique_id: source.to_dict() for unique_id, source in parser.manifest.sources.items()
+        }
+
+    def test_parse_anchored_source_tables_from_yaml_cache(self):
+        for data, cached in (
+            (ANCHORED_SOURCE_TABLES, False),
+            (ANCHORED_SOURCE_TABLE_SCALARS, True),
+        ):
+            yaml_cache = SchemaYamlCache(os.path.join("target", "schema_yaml_cache.msgpack"))
+            from_load = self.parse_with_yaml_cache(data, yaml_cache)
+            self.assertEqual(len(yaml_cache), int(cached))
+            from_cache = self.parse_with_yaml_cache(data, yaml_cache)
+            self.assertEqual(from_cache, from_load)
+            self.assertEqual(len(from_load), 2)
+
     def test__parse_basic_source(self):
         block = self.file_block_for(SINGLE_TABLE_SOURCE, "test_one.yml")
         dct = yaml_from_file(block.file)
@@ -1193,6 +1246,19 @@ class ModelParserTest(BaseParserTest):
         self.assertIn(file_id, self.parser.manifest.files)
         self.assertEqual(self.parser.manifest.files[file_id].nodes, ["model.snowplow.model_1"])
 
+    def test_parse_timing(self):
+        block = self.file_block_for(sql_model, "nested/model_1.sql")
+        self.parser.manifest.files[block.file.file_id] = block.file
+        with parse_timer(enable=True) as timer:
+            with parse_file_timing(block.file.file_id, "ModelParser"):
+                self.parser.parse_file(block)
+        report = timer.report()
+        self.assertEqual(report["file_count"], 1)
+        (file_timing,) = report["slowest_files"]
+        self.assertEqual(file_timing["file_id"], block.file.file_id)
+        self.assertEqual(file_timing["parser"], "ModelParser")
+        self.assertIn("config", file_timing["steps"])
+
     def test_sql_model_parse_error(self):
         block = self.file_block_for(sql_model_parse_error, "nested/model_1.sql")
         with self.assertRaises(CompilationError):
@@ -0,0 +1,122 @@
+import os
+from unittest import mock
+
+import pytest
+
+from dbt.artifacts.resources.base import FileHash
+from dbt.contracts.files import FilePath, ParseFileType
+from dbt.exceptions import ParsingError
+from dbt.parser.read_files import load_seed_source_file, load_source_file
+from dbt.parser.yaml_cache import SchemaYamlCache
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "a,b\n1,2\n",
+        "\n\n  a,b\n1,2\n\n   \n",
+        "   \n\t\n",
+        "",
+        "id,name\n" + "\n".join(f"{i},näme {i}  " for i in range(500)) + "\n \n",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+def test_file_hash_from_file_matches_from_contents(tmp_path, contents, chunk_size):
+    path = tmp_path / "seed.csv"
+    path.write_bytes(contents.encode("utf-8"))
+    expected = FileHash.from_contents(contents.strip())
+    assert FileHash.from_file(str(path), chunk_size=chunk_size) == expected
+
+
+class TestLoadSeedSourceFile:
+    @pytest.fixture
+    def seed_path(self, tmp_path):
+        seeds_dir = tmp_path / "seeds"
+        seeds_dir.mkdir()
+        (seeds_dir / "my_seed.csv").write_text("a,b\n1,2\n")
+        return FilePath(
+            searched_path="seeds",
+            relative_path="my_seed.csv",
+            modification_time=os.path.getmtime(seeds_dir / "my_seed.csv"),
+            project_root=str(tmp_path),
+        )
+
+    def test_streams_checksum(self, seed_path):
+        source_file = load_seed_source_file(seed_path, "test")
+        assert source_file.parse_file_type == ParseFileType.Seed
+        assert source_file.contents == ""
+        assert source_file.checksum == FileHash.from_contents("a,b\n1,2")
+        assert seed_path.file_size == 8
+
+    def test_reuses_saved_checksum(self, seed_path):
+        saved_file = load_seed_source_file(seed_path, "test")
+        saved_file.checksum = FileHash(name="sha256", checksum="saved")
+        saved_files = {saved_file.file_id: saved_file}
+
+        source_file = load_seed_source_file(seed_path, "test", saved_files)
+        assert source_file.checksum.checksum == "saved"
+
+        # a saved path checksum is never reused
+        saved_file.checksum = FileHash.path(seed_path.original_file_path)
+        source_file = load_seed_source_file(seed_path, "test", saved_files)
+        assert source_file.checksum == FileHash.from_contents("a,b\n1,2")
+
+    def test_rehashes_when_size_changes(self, seed_path):
+        saved_file = load_seed_source_file(seed_path, "test")
+        saved_file.checksum = FileHash(name="sha256", checksum="saved")
+        saved_file.path = FilePath(
+            searched_path=seed_path.searched_path,
+            relative_path=seed_path.relative_path,
+            modification_time=seed_path.modification_time,
+            project_root=seed_path.project_root,
+            file_size=seed_path.file_size + 1,
+        )
+        saved_files = {saved_file.file_id: saved_file}
+
+        source_file = load_seed_source_file(seed_path, "test", saved_files)
+        assert source_file.checksum == FileHash.from_contents("a,b\n1,2")
+
+
+class TestLoadSchemaSourceFile:
+    @pytest.fixture
+    def schema_path(self, tmp_path):
+        models_dir = tmp_path / "models"
+        models_dir.mkdir()
+        (models_dir / "schema.yml").write_text(
+            "sources:\n"
+            "  - name: src\n"
+            "    tables:\n"
+            "      - name: with_field\n"
+            "        loaded_at_field: null\n"
+            "      - name: without_field\n"
+        )
+        return FilePath(
+            searched_path="models",
+            relative_path="schema.yml",
+            modification_time=os.path.getmtime(models_dir / "schema.yml"),
+            project_root=str(tmp_path),
+        )
+
+    def test_loads_from_cache(self, tmp_path, schema_path):
+        yaml_cache = SchemaYamlCache(str(tmp_path / "target" / "cache.msgpack"))
+        source_file = load_source_file(schema_path, ParseFileType.Schema, "test", {}, yaml_cache)
+        tables = source_file.dfy["sources"][0]["tables"]
+        assert tables[0]["loaded_at_field_present"] is True
+        assert "loaded_at_field_present" not in tables[1]
+        assert len(yaml_cache) == 1
+
+        yaml_cache.write([source_file.checksum.checksum])
+        yaml_cache = SchemaYamlCache.from_file(yaml_cache.path)
+        with mock.patch("dbt.parser.schemas.load_yaml_text") as load_yaml_text:
+            cached_file = load_source_file(
+                schema_path, ParseFileType.Schema, "test", {}, yaml_cache
+            )
+        load_yaml_text.assert_not_called()
+        assert cached_file.dfy == source_file.dfy
+
+    def test_validates(self, tmp_path, schema_path):
+        (tmp_path / "models" / "schema.yml").write_text("models:\n  - description: no name\n")
+        yaml_cache = SchemaYamlCache(str(tmp_path / "cache.msgpack"))
+        with pytest.raises(ParsingError, match="does not have a name attribute"):
+            load_source_file(schema_path, ParseFileType.Schema, "test", {}, yaml_cache)
+        assert len(yaml_cache) == 0
@@ -1,14 +1,23 @@
 from unittest import mock
 
+import pytest
+
 from dbt.artifacts.resources import DependsOn, UnitTestConfig, UnitTestFormat
+from dbt.config.runtime import RuntimeConfig
+from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import NodeType, UnitTestDefinition
-from dbt.contracts.graph.unparsed import UnitTestOutputFixture
+from dbt.contracts.graph.unparsed import UnitTestInputFixture, UnitTestOutputFixture
 from dbt.parser import SchemaParser
-from dbt.parser.unit_tests import UnitTestParser
+from dbt.parser.unit_tests import (
+    UnitTestManifestCache,
+    UnitTestManifestLoader,
+    UnitTestParser,
+)
 from dbt_common.events.event_manager_client import add_callback_to_manager
 from dbt_common.events.types import SystemStdErr
 from tests.unit.parser.test_parser import SchemaParserTest, assertEqualNodes
 from tests.unit.utils import MockNode
+from tests.unit.utils.manifest import make_model
 from tests.utils import EventCatcher
 
 UNIT_TEST_MODEL_NOT_FOUND_SOURCE = """
@@ -322,3 +331,73 @@ class UnitTestParserTest(SchemaParserTest):
         UnitTestParser(self.parser, block).parse()
 
         assert len(catcher.caught_events) == 1
+
+
+class TestUnitTestManifestLoader:
+    @pytest.fixture
+    def manifest(self, runtime_config: RuntimeConfig):
+        pkg = runtime_config.project_name
+        upstream = make_model(pkg, "upstream", "select 1 as id")
+        model = make_model(pkg, "my_model", "select * from {{ ref('upstream') }}", refs=[upstream])
+        unit_tests = {}
+        for name, rows in (("test_a", [{"id": 1}]), ("test_b", [{"id": 1}]), ("test_c", [])):
+            unit_test = UnitTestDefinition(
+                name=name,
+                model="my_model",
+                resource_type=NodeType.Unit,
+                package_name=pkg,
+                path="unit_tests.yml",
+                original_file_path="models/unit_tests.yml",
+                unique_id=f"unit_test.{pkg}.my_model.{name}",
+                given=[UnitTestInputFixture(input="ref('upstream')", rows=rows)],
+                expect=UnitTestOutputFixture(rows=[{"id": 1}]),
+                depends_on=DependsOn(nodes=[model.unique_id]),
+                fqn=[pkg, "my_model", name],
+                config=UnitTestConfig(),
+            )
+            unit_tests[unit_test.unique_id] = unit_test
+        return Manifest(
+            nodes={upstream.unique_id: upstream, model.unique_id: model}, unit_tests=unit_tests
+        )
+
+    def load(self, runtime_config, manifest, name, cache, get_column_types):
+        unique_id = f"unit_test.{runtime_config.project_name}.my_model.{name}"
+        loader = UnitTestManifestLoader(
+            manifest, runtime_config, {unique_id}, cache=cache, get_column_types=get_column_types
+        )
+        unit_test_manifest = loader.load()
+        (input_id,) = unit_test_manifest.nodes[unique_id].depends_on.nodes
+        return loader, unit_test_manifest.nodes[input_id]
+
+    def test_shares_work_between_tests(self, runtime_config, manifest):
+        cache = UnitTestManifestCache()
+        get_column_types = mock.Mock(return_value={"id": "integer"})
+
+        loader, input_node = self.load(runtime_config, manifest, "test_a", cache, get_column_types)
+        assert input_node.raw_code == "{{ get_fixture_sql([{'id': 1}], {'id': 'integer'}) }}"
+        assert not input_node.compiled
+        input_node.compiled = True
+        input_node.compiled_code = "select 1 as id"
+        loader.cache_compiled_fixtures()
+
+        # the same fixture is reused, and the columns are only looked up once
+        _, input_node = self.load(runtime_config, manifest, "test_b", cache, get_column_types)
+        assert input_node.compiled
+        assert input_node.compiled_code == "select 1 as id"
+        _, input_node = self.load(runtime_config, manifest, "test_c", cache, get_column_types)
+        assert not input_node.compiled
+        get_column_types.assert_called_once()
+        assert len(cache.tested_node_references) == 1
+
+        cache.invalidate(f"model.{runtime_config.project_name}.upstream")
+        assert not cache.fixture_sql
+        _, input_node = self.load(runtime_config, manifest, "test_b", cache, get_column_types)
+        assert not input_node.compiled
+        assert get_column_types.call_count == 2
+
+    def test_columns_not_found(self, runtime_config, manifest):
+        _, input_node = self.load(
+            runtime_config, manifest, "test_a", UnitTestManifestCache(), lambda node: None
+        )
+        # the fixture looks the columns up itself, and reports the missing relation
+        assert input_node.raw_code == "{{ get_fixture_sql([{'id': 1}], None) }}"
@@ -0,0 +1,44 @@
+import datetime
+from unittest import mock
+
+from dbt.parser.yaml_cache import SchemaYamlCache, has_shared_containers
+
+
+def test_schema_yaml_cache(tmp_path):
+    path = str(tmp_path / "target" / "schema_yaml_cache.msgpack")
+    cache = SchemaYamlCache.from_file(path)
+    assert len(cache) == 0
+
+    dfy = {"models": [{"name": "a", "meta": {"since": datetime.date(2024, 1, 2), 1: None}}]}
+    cache.add("abc", dfy)
+    cache.add("def", {"models": [{"name": "b"}]})
+    # contents msgpack can't represent aren't cached
+    cache.add("ghi", {"models": [{"name": "c", "meta": {"tags": {"x"}}}]})
+    assert len(cache) == 2
+
+    cache.write(["abc", "ghi"])
+    cache = SchemaYamlCache.from_file(path)
+    assert len(cache) == 1
+    assert cache.get("abc") == dfy
+    # every lookup returns a fresh copy, which parsing is free to modify
+    assert cache.get("abc") is not cache.get("abc")
+    assert cache.get("def") is None
+
+    # entries written by another version of dbt are discarded
+    with mock.patch("dbt.parser.yaml_cache.__version__", "0.0.0"):
+        assert len(SchemaYamlCache.from_file(path)) == 0
+
+    (tmp_path / "target" / "schema_yaml_cache.msgpack").write_bytes(b"not msgpack")
+    assert len(SchemaYamlCache.from_file(path)) == 0
+
+
+def test_shared_containers_are_not_cached(tmp_path):
+    meta = {"owner": "data"}
+    dfy = {"sources": [{"name": "s", "tables": [{"name": "a", "meta": meta}, {"name": "b"}]}]}
+    assert not has_shared_containers(dfy)
+    dfy["sources"][0]["tables"][1]["meta"] = meta
+    assert has_shared_containers(dfy)
+
+    cache = SchemaYamlCache(str(tmp_path / "schema_yaml_cache.msgpack"))
+    cache.add("abc", dfy)
+    assert len(cache) == 0
@@ -1,5 +1,16 @@
+from argparse import Namespace
+
+import networkx as nx
+import pytest
+
+from dbt.artifacts.schemas.results import RunStatus, TestStatus
+from dbt.artifacts.schemas.run import RunResult
 from dbt.contracts.graph.nodes import SavedQuery
+from dbt.flags import get_flags, set_from_args
+from dbt.graph import Graph, GraphQueue
 from dbt.runners import SavedQueryRunner
+from dbt.task.build import BuildTask
+from tests.unit.utils.manifest import make_manifest, make_model, make_unit_test
 
 
 def test_saved_query_runner_on_skip(saved_query: SavedQuery):
@@ -12,3 +23,58 @@ def test_saved_query_runner_on_skip(saved_query: SavedQuery):
     )
     # on_skip would work
     runner.on_skip()
+
+
+@pytest.fixture
+def unit_test_manifest():
+    upstream = make_model("pkg", "upstream", "select 1 as id")
+    model = make_model("pkg", "model", "select * from {{ ref('upstream') }}", refs=[upstream])
+    model.depends_on.nodes = [upstream.unique_id]
+    unit_tests = [make_unit_test("pkg", name, model) for name in ("test_a", "test_b")]
+    for unit_test in unit_tests:
+        unit_test.depends_on.nodes = [model.unique_id]
+    return make_manifest(nodes=[upstream, model], unit_tests=unit_tests)
+
+
+@pytest.fixture
+def build_task(unit_test_manifest):
+    set_from_args(Namespace(), {})
+    task = BuildTask(get_flags(), None, unit_test_manifest)
+    graph = nx.DiGraph()
+    graph.add_edge("model.pkg.upstream", "model.pkg.model")
+    for unit_test_id in unit_test_manifest.unit_tests:
+        graph.add_edge("model.pkg.model", unit_test_id)
+    task.graph = Graph(graph)
+    task.selected_unit_tests = set(unit_test_manifest.unit_tests)
+    task.build_model_to_unit_test_map(task.selected_unit_tests)
+    return task
+
+
+def test_unit_tests_are_queued_ahead_of_their_model(build_task, unit_test_manifest):
+    selected = {"model.pkg.upstream", "model.pkg.model"}
+    graph = build_task.graph.get_subset_graph(selected)
+    build_task.add_unit_tests_to_graph(graph)
+    queue = GraphQueue(graph.graph, unit_test_manifest, selected)
+
+    assert queue.get(block=False).unique_id == "model.pkg.upstream"
+    assert queue.inner.empty()
+    queue.mark_done("model.pkg.upstream")
+
+    # both unit tests are ready at once, and gate the model
+    unit_tests = {queue.get(block=False).unique_id, queue.get(block=False).unique_id}
+    assert unit_tests == set(unit_test_manifest.unit_tests)
+    assert queue.inner.empty()
+    for unit_test_id in unit_tests:
+        queue.mark_done(unit_test_id)
+    assert queue.get(block=False).unique_id == "model.pkg.model"
+
+
+def test_failed_unit_test_skips_its_model(build_task, unit_test_manifest):
+    unit_test = unit_test_manifest.unit_tests["unit.pkg.model__test_a"]
+    result = RunResult.from_node(unit_test, RunStatus.Success, None)
+    build_task._handle_result(result)
+    assert build_task._skipped_children == {}
+
+    result = RunResult.from_node(unit_test, TestStatus.Fail, None)
+    build_task._handle_result(result)
+    assert build_task._skipped_children == {"model.pkg.model": None}
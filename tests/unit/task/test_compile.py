@@ -0,0 +1,141 @@
+import threading
+from argparse import Namespace
+from unittest import mock
+
+import pytest
+
+from dbt.compilation import Compiler, compile_node_in_worker, init_compile_worker
+from dbt.contracts.graph.manifest import Manifest
+from dbt.exceptions import ProcessPoolCompilationError
+from dbt.graph.thread_pool import DbtProcessPool
+from dbt.task.compile import CompileRunner, CompileTask
+from dbt.task.run import RunTask
+from dbt.tests.util import safe_set_invocation_context
+from dbt_common.context import get_invocation_context
+from dbt_common.exceptions import CompilationError, DbtInternalError
+from tests.unit.fixtures import model_node
+
+
+class TestCompileRunnerProcessPool:
+    @pytest.fixture
+    def node(self):
+        node = model_node()
+        node.compiled = False
+        node.compiled_code = None
+        return node
+
+    @pytest.fixture
+    def runner(self, node):
+        return CompileRunner(mock.MagicMock(), mock.MagicMock(), node, 1, 1)
+
+    def test_applies_compiled_attrs(self, runner, node):
+        process_pool = mock.MagicMock()
+        process_pool.submit.return_value.result.return_value = (
+            {"compiled": True, "compiled_code": "select 1"},
+            None,
+        )
+        runner.set_process_pool(process_pool)
+        runner.compiler = mock.MagicMock()
+
+        assert runner.compile(Manifest(nodes={node.unique_id: node})) is node
+        assert node.compiled is True
+        assert node.compiled_code == "select 1"
+        runner.compiler.compile_node.assert_not_called()
+
+    def test_falls_back_to_in_process_compile(self, runner, node):
+        process_pool = mock.MagicMock()
+        process_pool.submit.return_value.result.side_effect = RuntimeError("shut down")
+        runner.set_process_pool(process_pool)
+        runner.compiler = mock.MagicMock()
+
+        manifest = Manifest(nodes={node.unique_id: node})
+        runner.compile(manifest)
+        runner.compiler.compile_node.assert_called_once_with(node, manifest, {})
+
+    def test_raises_worker_errors(self, runner, node):
+        error = str(CompilationError("'oops' is undefined", node=node))
+        process_pool = mock.MagicMock()
+        process_pool.submit.return_value.result.return_value = ({}, error)
+        runner.set_process_pool(process_pool)
+        runner.compiler = mock.MagicMock()
+
+        with pytest.raises(ProcessPoolCompilationError) as exc_info:
+            runner.compile(Manifest(nodes={node.unique_id: node}))
+        assert str(exc_info.value) == error
+        assert exc_info.value.node is node
+        runner.compiler.compile_node.assert_not_called()
+
+
+def compile_in_worker(node, fake_compile_node):
+    manifest = Manifest(nodes={node.unique_id: node})
+    with mock.patch("dbt.compilation.get_adapter"), mock.patch.object(
+        Compiler, "compile_node", fake_compile_node
+    ):
+        process_pool = DbtProcessPool(
+            1, init_compile_worker, (mock.MagicMock(), manifest, get_invocation_context())
+        )
+        try:
+            return process_pool.submit(compile_node_in_worker, node.unique_id).result()
+        finally:
+            process_pool.shutdown()
+
+
+@pytest.mark.skipif(not DbtProcessPool.is_supported(), reason="requires the fork start method")
+def test_compile_node_in_worker():
+    safe_set_invocation_context()
+    node = model_node()
+    node.compiled = False
+    node.compiled_code = None
+
+    def fake_compile_node(self, node, manifest, extra_context):
+        node.compiled = True
+        node.compiled_code = "select 1"
+        return node
+
+    compiled_attrs, error = compile_in_worker(node, fake_compile_node)
+    assert error is None
+    assert compiled_attrs["compiled"] is True
+    assert compiled_attrs["compiled_code"] == "select 1"
+    # the parent's node is only updated by the runner
+    assert node.compiled_code is None
+
+
+@pytest.mark.skipif(not DbtProcessPool.is_supported(), reason="requires the fork start method")
+def test_compile_node_in_worker_error():
+    safe_set_invocation_context()
+    node = model_node()
+
+    def fake_compile_node(self, node, manifest, extra_context):
+        raise CompilationError("'oops' is undefined")
+
+    compiled_attrs, error = compile_in_worker(node, fake_compile_node)
+    assert compiled_attrs == {}
+    # formatted as it would have been when compiling in process
+    assert error == str(CompilationError("'oops' is undefined", node=node))
+
+
+def test_process_pool_refuses_to_fork_while_threads_are_running():
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait, name="dbt-events")
+    thread.start()
+    try:
+        assert DbtProcessPool.running_threads() == ["dbt-events"]
+        with pytest.raises(DbtInternalError, match="dbt-events"):
+            DbtProcessPool(1)
+    finally:
+        stop.set()
+        thread.join()
+    assert DbtProcessPool.running_threads() == []
+
+
+def test_use_process_pool():
+    task = CompileTask.__new__(CompileTask)
+    task.args = Namespace(process_pool=True, inline=None)
+    assert task.use_process_pool()
+
+    task.args = Namespace(process_pool=True, inline="select 1")
+    assert not task.use_process_pool()
+
+    task = RunTask.__new__(RunTask)
+    task.args = Namespace(process_pool=True)
+    assert not task.use_process_pool()
@@ -0,0 +1,166 @@
+import functools
+import json
+import os
+import subprocess
+import tarfile
+import threading
+from argparse import Namespace
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+
+from dbt.config.project import package_config_from_data
+from dbt.constants import PACKAGE_LOCK_FILE_NAME
+from dbt.deps.store import INSTALLED_PACKAGES_FILE_NAME
+from dbt.events.types import DepsInstallInfo, DepsPackageUnchanged
+from dbt.flags import set_from_args
+from dbt.task.deps import DepsTask
+from dbt.tests.util import safe_set_invocation_context
+from dbt_common.events.event_manager_client import add_callback_to_manager
+from tests.utils import EventCatcher
+
+
+def _write_project(path, name):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "dbt_project.yml").write_text(f"name: {name}\nversion: '1.0'\nconfig-version: 2\n")
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """A local stand-in for the package hub, serving one package with one version."""
+    root = tmp_path / "registry"
+    _write_project(root / "build" / "stub_pkg-1.0.0", "stub_pkg")
+    (root / "build" / "stub_pkg-1.0.0" / "macros").mkdir()
+    (root / "build" / "stub_pkg-1.0.0" / "macros" / "m.sql").write_text(
+        "{% macro m() %}{% endmacro %}"
+    )
+    with tarfile.open(root / "stub_pkg.tar.gz", "w:gz") as tar:
+        tar.add(root / "build" / "stub_pkg-1.0.0", arcname="stub_pkg-1.0.0")
+
+    requests = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.path)
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(Handler, directory=str(root)))
+    base_url = f"http://127.0.0.1:{server.server_port}/"
+    version = {
+        "name": "stub_pkg",
+        "packages": [],
+        "downloads": {"tarball": f"{base_url}stub_pkg.tar.gz"},
+    }
+    (root / "api" / "v1" / "test-org").mkdir(parents=True)
+    (root / "api" / "v1" / "index.json").write_text(json.dumps(["test-org/stub_pkg"]))
+    (root / "api" / "v1" / "test-org" / "stub_pkg.json").write_text(
+        json.dumps({"name": "stub_pkg", "versions": {"1.0.0": version}})
+    )
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with mock.patch("dbt.clients.registry.DEFAULT_REGISTRY_BASE_URL", base_url):
+        yield requests
+    server.shutdown()
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    path = tmp_path / "git_pkg"
+    _write_project(path, "git_pkg")
+    git = ["git", "-C", str(path), "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    subprocess.run(git + ["add", "."], check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "init"], check=True)
+    return str(path)
+
+
+class TestDepsTaskInstall:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        safe_set_invocation_context()
+        set_from_args(Namespace(version_check=False), None)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("DBT_DOWNLOADS_DIR", str(tmp_path / "downloads"))
+        monkeypatch.setattr("dbt.deps.base.DOWNLOADS_PATH", None)
+        self.events = EventCatcher(DepsInstallInfo)
+        self.unchanged_events = EventCatcher(DepsPackageUnchanged)
+        add_callback_to_manager(self.events.catch)
+        add_callback_to_manager(self.unchanged_events.catch)
+
+    def run_deps(self, project_root, git_repo, store):
+        packages = package_config_from_data(
+            {
+                "packages": [
+                    {"package": "test-org/stub_pkg", "version": "1.0.0"},
+                    {"git": git_repo},
+                ]
+            }
+        ).packages
+        project = mock.MagicMock(
+            project_root=str(project_root),
+            project_name="root",
+            packages_install_path=str(project_root / "dbt_packages"),
+        )
+        project.packages.packages = packages
+        args = Namespace(
+            project_dir=str(project_root),
+            add_package=None,
+            upgrade=False,
+            lock=False,
+            vars={},
+            package_store=str(store),
+        )
+        self.events.flush()
+        self.unchanged_events.flush()
+        with mock.patch.object(DepsTask, "track_package_install"), mock.patch(
+            "dbt.deps.git.warn_or_error"
+        ):
+            DepsTask(args, project).run()
+
+    def test_installs_from_store_and_skips_unchanged(self, tmp_path, registry, git_repo):
+        store = tmp_path / "store"
+        project_root = tmp_path / "project"
+        _write_project(project_root, "root")
+
+        self.run_deps(project_root, git_repo, store)
+        installed = project_root / "dbt_packages"
+        assert len(self.events.caught_events) == 2
+        assert (installed / "stub_pkg" / "macros" / "m.sql").exists()
+        assert (installed / "git_pkg" / "dbt_project.yml").exists()
+        assert (installed / INSTALLED_PACKAGES_FILE_NAME).exists()
+        assert registry.count("/stub_pkg.tar.gz") == 1
+
+        # files are hardlinked from the store
+        stored = [
+            os.path.join(root, name)
+            for root, _, names in os.walk(store)
+            for name in names
+            if name == "m.sql"
+        ]
+        assert len(stored) == 1
+        assert os.path.samefile(stored[0], installed / "stub_pkg" / "macros" / "m.sql")
+
+        # nothing changed, so nothing is reinstalled
+        (installed / "leftover").mkdir()
+        self.run_deps(project_root, git_repo, store)
+        assert len(self.unchanged_events.caught_events) == 2
+        assert not self.events.caught_events
+        assert not (installed / "leftover").exists()
+
+        # another project with the same lock file is installed from the store
+        other_root = tmp_path / "other_project"
+        _write_project(other_root, "root")
+        (other_root / PACKAGE_LOCK_FILE_NAME).write_text(
+            (project_root / PACKAGE_LOCK_FILE_NAME).read_text()
+        )
+        with mock.patch("dbt.clients.git.clone_and_checkout") as clone:
+            self.run_deps(other_root, git_repo, store)
+        clone.assert_not_called()
+        assert registry.count("/stub_pkg.tar.gz") == 1
+        assert (other_root / "dbt_packages" / "git_pkg" / "dbt_project.yml").exists()
+        assert (other_root / "dbt_packages" / "stub_pkg" / "macros" / "m.sql").exists()
@@ -1,8 +1,19 @@
+import base64
+import gzip
+import json
+import re
 import unittest
+from datetime import datetime
 from decimal import Decimal
 from unittest import mock
 
+import agate
+import pytest
+
+from dbt.adapters.postgres import PostgresAdapter
 from dbt.task.docs import generate
+from dbt.tests.util import safe_set_invocation_context
+from dbt_common.exceptions import DbtRuntimeError
 
 
 class GenerateTest(unittest.TestCase):
@@ -329,3 +340,182 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+
+def catalog_rows(database, schema, table_name, column_names=("id",)):
+    return [
+        (database, schema, table_name, "BASE TABLE", None, None, name, Decimal(i), "integer", None)
+        for i, name in enumerate(column_names, 1)
+    ]
+
+
+CATALOG_COLUMNS = [
+    "table_database",
+    "table_schema",
+    "table_name",
+    "table_type",
+    "table_comment",
+    "table_owner",
+    "column_name",
+    "column_index",
+    "column_type",
+    "column_comment",
+]
+
+
+def test_collects_catalog_by_schema():
+    class FilteringAdapter(PostgresAdapter):
+        @classmethod
+        def _catalog_filter_table(cls, table, used_schemas):
+            return table
+
+    class OverridingAdapter(PostgresAdapter):
+        def get_catalog(self, relation_configs, used_schemas):
+            return agate.Table([], CATALOG_COLUMNS), []
+
+    assert generate.collects_catalog_by_schema(PostgresAdapter.__new__(PostgresAdapter))
+    assert generate.collects_catalog_by_schema(FilteringAdapter.__new__(FilteringAdapter))
+    assert not generate.collects_catalog_by_schema(OverridingAdapter.__new__(OverridingAdapter))
+
+
+def test_get_catalog_by_schema():
+    safe_set_invocation_context()
+    adapter = mock.MagicMock()
+    adapter.config.threads = 2
+    adapter.config.args.single_threaded = False
+
+    def get_filtered_catalog(relation_configs, used_schemas, relations):
+        ((database, schema),) = used_schemas
+        assert {(c.database, c.schema) for c in relation_configs} == {(database, schema)}
+        if schema == "broken":
+            return agate.Table([], CATALOG_COLUMNS), [DbtRuntimeError("permission denied")]
+        rows = catalog_rows(database, schema, "table", ["id", "name"])
+        return agate.Table(rows, CATALOG_COLUMNS), []
+
+    adapter.get_filtered_catalog.side_effect = get_filtered_catalog
+    relation_configs = [
+        mock.MagicMock(database=database, schema=schema)
+        for database, schema in (("db", "one"), ("DB", "TWO"), ("db", "broken"), ("db", "unused"))
+    ]
+    used_schemas = frozenset({("db", "one"), ("DB", "TWO"), ("db", "broken")})
+    catalog, exceptions = generate.get_catalog_by_schema(adapter, relation_configs, used_schemas)
+
+    # a schema that isn't used is never queried
+    assert adapter.get_filtered_catalog.call_count == 3
+    assert set(catalog) == {
+        generate.CatalogKey("db", "one", "table"),
+        generate.CatalogKey("DB", "TWO", "table"),
+    }
+    table = catalog[generate.CatalogKey("db", "one", "table")]
+    assert list(table.columns) == ["id", "name"]
+    assert table.columns["name"].index == 2
+    assert [str(exc) for exc in exceptions] == ["Runtime Error\n  permission denied"]
+
+
+def test_get_catalog_by_schema_with_relations():
+    safe_set_invocation_context()
+    adapter = mock.MagicMock()
+    adapter.config.threads = 2
+    adapter.config.args.single_threaded = False
+    adapter.get_filtered_catalog.return_value = (agate.Table([], CATALOG_COLUMNS), [])
+    relation_configs = [mock.MagicMock(database="db", schema=schema) for schema in ("one", "two")]
+    relation = mock.MagicMock(database="db", schema="one")
+    used_schemas = frozenset({("db", "one"), ("db", "two")})
+    generate.get_catalog_by_schema(adapter, relation_configs, used_schemas, {relation})
+
+    # only the schema of a selected relation is queried
+    adapter.get_filtered_catalog.assert_called_once_with(
+        [relation_configs[0]], frozenset({("db", "one")}), {relation}
+    )
+
+
+def test_merge_catalog_results():
+    def table(name):
+        return generate.CatalogTable(
+            metadata=generate.TableMetadata(type="table", database="db", schema="s", name=name),
+            columns={},
+            stats={},
+            unique_id=f"model.pkg.{name}",
+        )
+
+    def node(name, schema="S"):
+        return mock.MagicMock(database="DB", schema=schema, identifier=name)
+
+    previous = generate.CatalogArtifact.from_results(
+        generated_at=datetime.utcnow(),
+        nodes={
+            f"model.pkg.{name}": table(name) for name in ("kept", "selected", "deleted", "moved")
+        },
+        sources={},
+        compile_results=None,
+        errors=None,
+    )
+    manifest = mock.MagicMock()
+    manifest.nodes = {f"model.pkg.{name}": node(name) for name in ("kept", "selected", "new")}
+    manifest.nodes["model.pkg.moved"] = node("moved", schema="other")
+    manifest.sources = {}
+    nodes, sources = generate.merge_catalog_results(
+        previous,
+        manifest,
+        {"model.pkg.selected", "model.pkg.new"},
+        {"model.pkg.new": table("new")},
+        {},
+    )
+    # the selected model wasn't found in the warehouse, the deleted one isn't
+    # in the manifest, and the moved one's relation is now in another schema
+    assert set(nodes) == {"model.pkg.kept", "model.pkg.new"}
+    assert sources == {}
+
+
+STATIC_INDEX_TEMPLATE = """<html lang="en-US" ng-app="dbt">
+<body>
+    <script>var n = { manifest: "MANIFEST.JSON INLINE DATA", catalog: "CATALOG.JSON INLINE DATA" };</script>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def static_index_files(tmp_path):
+    index_path = tmp_path / "index.html"
+    index_path.write_text(STATIC_INDEX_TEMPLATE)
+    artifact_paths = {}
+    for name in ("manifest", "catalog"):
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps({"name": name, "nodes": {"model.pkg.é": list(range(1000))}}))
+        artifact_paths[name] = str(path)
+    return str(index_path), artifact_paths
+
+
+def test_write_static_index(static_index_files, tmp_path):
+    index_path, artifact_paths = static_index_files
+    static_index_path = tmp_path / "static_index.html"
+    with mock.patch.object(generate, "STATIC_INDEX_CHUNK_SIZE", 100):
+        generate.write_static_index(index_path, artifact_paths, str(static_index_path))
+
+    expected = STATIC_INDEX_TEMPLATE.replace(
+        '"MANIFEST.JSON INLINE DATA"', open(artifact_paths["manifest"]).read()
+    ).replace('"CATALOG.JSON INLINE DATA"', open(artifact_paths["catalog"]).read())
+    assert static_index_path.read_text() == expected
+
+
+def test_write_compressed_static_index(static_index_files, tmp_path):
+    index_path, artifact_paths = static_index_files
+    static_index_path = tmp_path / "static_index.html"
+    with mock.patch.object(generate, "STATIC_INDEX_CHUNK_SIZE", 100):
+        generate.write_static_index(
+            index_path, artifact_paths, str(static_index_path), compressed=True
+        )
+
+    static_index = static_index_path.read_text()
+    # the docs app is started by the loader instead
+    assert 'ng-app="dbt"' not in static_index
+    assert (
+        "{ manifest: window.dbtInlineData.manifest, catalog: window.dbtInlineData.catalog }"
+        in static_index
+    )
+    for name, path in artifact_paths.items():
+        match = re.search(f'id="dbt-inline-{name}">([^<]*)</script>', static_index)
+        data = gzip.decompress(base64.b64decode(match.group(1)))
+        assert data == open(path, "rb").read()
+    assert static_index.index("angular.bootstrap") < static_index.index("</body>")
@@ -29,6 +29,7 @@ from dbt.task.run import MicrobatchModelRunner, ModelRunner, RunTask, _get_adapt
 from dbt.tests.util import safe_set_invocation_context
 from dbt_common.events.base_types import EventLevel
 from dbt_common.events.event_manager_client import add_callback_to_manager
+from tests.unit.fixtures import model_node
 from tests.utils import EventCatcher
 
 
@@ -385,3 +386,32 @@ class TestRunTask:
             assert not isinstance(expected_result, RunStatus)
             assert issubclass(expected_result, BaseException)
             assert type(e) == expected_result
+
+
+class TestSetupWarehouseInBackground:
+    @pytest.fixture
+    def task(self, runtime_config: RuntimeConfig):
+        safe_set_invocation_context()
+        set_from_args(Namespace(write_json=False), None)
+        return RunTask(get_flags(), runtime_config, None)
+
+    def test_runners_wait_for_setup(self, task):
+        adapter = MagicMock()
+        with patch.object(RunTask, "create_schemas") as create_schemas, patch.object(
+            RunTask, "populate_adapter_cache"
+        ):
+            task.setup_warehouse_in_background(adapter, set())
+            task._warehouse_ready.result(timeout=5)
+            create_schemas.assert_called_once_with(adapter, set())
+
+        with patch("dbt.task.runnable.get_adapter"):
+            task.manifest = MagicMock()
+            runner = task.get_runner(model_node())
+        assert runner.warehouse_ready is task._warehouse_ready
+
+    def test_setup_failure_is_raised(self, task):
+        with patch.object(RunTask, "create_schemas", side_effect=DbtRuntimeError("boom")):
+            task.setup_warehouse_in_background(MagicMock(), set())
+            with pytest.raises(DbtRuntimeError):
+                task._warehouse_ready.result(timeout=5)
+        assert str(task._raise_next_tick) == "Runtime Error\n  boom"
@@ -0,0 +1,139 @@
+from argparse import Namespace
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.base import BaseRelation
+from dbt.artifacts.resources import DeferRelation, NodeConfig
+from dbt.config.runtime import RuntimeConfig
+from dbt.contracts.graph.manifest import Manifest
+from dbt.flags import get_flags, set_from_args
+from dbt.graph.thread_pool import AdaptiveConcurrency
+from dbt.task.run import RunTask
+from tests.unit.fixtures import model_node
+from tests.unit.utils.manifest import make_model
+
+
+def _schemas(*names):
+    return {f'"dbt"."{name}"' for name in names}
+
+
+class TestGetSelectedCacheRelations:
+    @pytest.fixture
+    def nodes(self):
+        upstream = make_model("pkg", "upstream", "select 1")
+        upstream.schema = "upstream_schema"
+        ephemeral = make_model(
+            "pkg",
+            "ephemeral",
+            "select 1",
+            refs=[upstream],
+            config_kwargs={"materialized": "ephemeral"},
+        )
+        selected = make_model("pkg", "selected", "select 1", refs=[ephemeral])
+        selected.schema = "selected_schema"
+        unrelated = make_model("pkg", "unrelated", "select 1")
+        unrelated.schema = "unrelated_schema"
+        return {n.name: n for n in (upstream, ephemeral, selected, unrelated)}
+
+    @pytest.fixture
+    def adapter(self):
+        adapter = mock.MagicMock()
+        adapter.Relation = BaseRelation
+        return adapter
+
+    def get_task(self, runtime_config, nodes, **args):
+        set_from_args(Namespace(**args), None)
+        manifest = Manifest(nodes={n.unique_id: n for n in nodes.values()})
+        task = RunTask(get_flags(), runtime_config, manifest)
+        task._flattened_nodes = [nodes["selected"]]
+        return task
+
+    def test_follows_refs_through_ephemeral_models(
+        self, runtime_config: RuntimeConfig, nodes, adapter
+    ):
+        task = self.get_task(runtime_config, nodes)
+        cachable_nodes, schemas = task.get_selected_cache_relations(adapter)
+        assert {n.name for n in cachable_nodes} == {"selected", "upstream"}
+        assert {str(s) for s in schemas} == _schemas("selected_schema", "upstream_schema")
+
+    @staticmethod
+    def defer_relation(name, schema):
+        return DeferRelation(
+            database="dbt",
+            schema=schema,
+            alias=name,
+            relation_name=None,
+            resource_type="model",
+            name=name,
+            description="",
+            compiled_code=None,
+            meta={},
+            tags=[],
+            config=NodeConfig(),
+        )
+
+    def test_includes_deferred_relations(self, runtime_config: RuntimeConfig, nodes, adapter):
+        nodes["upstream"].defer_relation = self.defer_relation("upstream", "prod_upstream")
+        nodes["selected"].defer_relation = self.defer_relation("selected", "prod_selected")
+
+        # unselected parents are resolved to their deferred relation
+        task = self.get_task(runtime_config, nodes, defer=True, favor_state=True)
+        cachable_nodes, schemas = task.get_selected_cache_relations(adapter)
+        assert {n.name for n in cachable_nodes} == {"selected"}
+        assert {str(s) for s in schemas} == _schemas(
+            "selected_schema", "prod_selected", "prod_upstream"
+        )
+
+        # unselected parents are resolved to their deferred relation if they
+        # don't exist in the target
+        task = self.get_task(runtime_config, nodes, defer=True, favor_state=False)
+        cachable_nodes, schemas = task.get_selected_cache_relations(adapter)
+        assert {n.name for n in cachable_nodes} == {"selected", "upstream"}
+        assert {str(s) for s in schemas} == _schemas(
+            "selected_schema", "prod_selected", "upstream_schema", "prod_upstream"
+        )
+
+    def test_populate_adapter_cache(self, runtime_config: RuntimeConfig, nodes, adapter):
+        task = self.get_task(runtime_config, nodes, cache_selected_only=True, populate_cache=True)
+        task.populate_adapter_cache(
+            adapter, {BaseRelation.create(database="dbt", schema="extra_schema")}
+        )
+        adapter.set_relations_cache.assert_called_once()
+        required_schemas = adapter.set_relations_cache.call_args.kwargs["required_schemas"]
+        assert {str(s) for s in required_schemas} == _schemas(
+            "selected_schema", "upstream_schema", "extra_schema"
+        )
+
+
+class TestRunQueueWithAdaptiveConcurrency:
+    def run_queue(self, runtime_config, submit):
+        set_from_args(Namespace(adaptive_threads=True), None)
+        task = RunTask(get_flags(), runtime_config, Manifest())
+        task.job_queue = mock.MagicMock()
+        task.job_queue.empty.side_effect = [False, True]
+        task.job_queue.ready_count.return_value = 0
+        concurrency = AdaptiveConcurrency(min_threads=1, max_threads=1)
+        with mock.patch.object(
+            task, "_get_adaptive_concurrency", return_value=concurrency
+        ), mock.patch.object(task, "handle_job_queue", side_effect=submit):
+            task.run_queue(mock.MagicMock())
+        return task, concurrency
+
+    def test_permit_is_returned_when_handling_the_result_fails(self, runtime_config):
+        def submit(pool, callback, error_callback):
+            result = mock.MagicMock(node=model_node(), execution_time=1.0)
+            with pytest.raises(RuntimeError):
+                callback(result)
+
+        with mock.patch.object(RunTask, "_handle_result", side_effect=RuntimeError("oops")):
+            task, concurrency = self.run_queue(runtime_config, submit)
+        assert concurrency.active == 0
+
+    def test_permit_is_returned_when_the_runner_raises(self, runtime_config):
+        def submit(pool, callback, error_callback):
+            error_callback(RuntimeError("oops"))
+
+        task, concurrency = self.run_queue(runtime_config, submit)
+        assert concurrency.active == 0
+        task.job_queue.mark_done.assert_not_called()
@@ -0,0 +1,125 @@
+import json
+from argparse import Namespace
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.base import BaseRelation
+from dbt.artifacts.schemas.results import RunStatus
+from dbt.artifacts.schemas.run import RunResult
+from dbt.config.runtime import RuntimeConfig
+from dbt.flags import get_flags, set_from_args
+from dbt.task.run import RunTask
+from dbt.task.schema_cache import SchemaCache
+from dbt.tests.util import safe_set_invocation_context
+from tests.unit.fixtures import model_node
+
+
+class TestSchemaCache:
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "schema_cache.json")
+        cache = SchemaCache(path, "profile.dev", ttl=60)
+        cache.set("DB", ["Analytics", "staging"])
+        cache.add("db", "Marts")
+        cache.add("other_db", "ignored")
+        cache.write()
+
+        cache = SchemaCache(path, "profile.dev", ttl=60)
+        assert cache.get("db") == {"analytics", "staging", "marts"}
+        assert cache.get("other_db") is None
+        # other targets don't share entries
+        assert SchemaCache(path, "profile.prod", ttl=60).get("db") is None
+
+    def test_expires(self, tmp_path):
+        cache = SchemaCache(str(tmp_path / "schema_cache.json"), "profile.dev", ttl=60)
+        cache.set(None, ["analytics"])
+        assert cache.get(None) == {"analytics"}
+        with mock.patch(
+            "dbt.task.schema_cache.time.time", return_value=cache.listed_at(None) + 61
+        ):
+            assert cache.get(None) is None
+
+    def test_invalidate(self, tmp_path):
+        cache = SchemaCache(str(tmp_path / "schema_cache.json"), "profile.dev", ttl=60)
+        cache.set("db", ["analytics"])
+        cache.invalidate("DB")
+        assert cache.get("db") is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "schema_cache.json"
+        path.write_text("{not json")
+        assert SchemaCache(str(path), "profile.dev", ttl=60).get("db") is None
+
+
+class TestCreateSchemas:
+    @pytest.fixture
+    def task(self, runtime_config: RuntimeConfig, tmp_path):
+        safe_set_invocation_context()
+        set_from_args(Namespace(schema_cache_ttl=60), None)
+        task = RunTask(get_flags(), runtime_config, None)
+        task._get_schema_cache = lambda: SchemaCache(
+            str(tmp_path / "schema_cache.json"), "profile.dev", ttl=60
+        )
+        return task
+
+    @pytest.fixture
+    def adapter(self):
+        adapter = mock.MagicMock()
+        adapter.list_schemas.return_value = ["analytics"]
+        adapter.Relation = BaseRelation
+        return adapter
+
+    @pytest.fixture
+    def required_schemas(self):
+        return {
+            BaseRelation.create(database="db", schema="analytics"),
+            BaseRelation.create(database="db", schema="staging"),
+        }
+
+    def test_lists_once_within_ttl(self, task, adapter, required_schemas, tmp_path):
+        task.create_schemas(adapter, required_schemas)
+        assert adapter.list_schemas.call_count == 1
+        adapter.create_schema.assert_called_once()
+        cached = json.loads((tmp_path / "schema_cache.json").read_text())
+        assert cached["profile.dev"]["db"]["schemas"] == ["analytics", "staging"]
+
+        adapter.reset_mock()
+        task.create_schemas(adapter, required_schemas)
+        adapter.list_schemas.assert_not_called()
+        adapter.create_schema.assert_not_called()
+        assert task._schemas_from_cache == {("db", "analytics"), ("db", "staging")}
+
+    def test_failed_node_in_dropped_schema_recreates_it(
+        self, task, adapter, required_schemas, tmp_path
+    ):
+        task.create_schemas(adapter, required_schemas)
+        task.create_schemas(adapter, required_schemas)
+        adapter.reset_mock()
+        adapter.check_schema_exists.return_value = False
+
+        node = model_node()
+        node.database = "db"
+        node.schema = "staging"
+        task.manifest = mock.MagicMock()
+        task.graph = mock.MagicMock()
+        task.graph.get_dependent_nodes.return_value = []
+        result = RunResult(
+            status=RunStatus.Error,
+            timing=[],
+            thread_id="",
+            execution_time=0.0,
+            adapter_response={},
+            message="schema does not exist",
+            failures=None,
+            batch_results=None,
+            node=node,
+        )
+        with mock.patch("dbt.task.runnable.get_adapter", return_value=adapter):
+            task._handle_result(result)
+            # only checked once per schema
+            task._handle_result(result)
+
+        adapter.check_schema_exists.assert_called_once_with("db", "staging")
+        adapter.create_schema.assert_called_once()
+        cached = json.loads((tmp_path / "schema_cache.json").read_text())
+        assert "db" not in cached["profile.dev"]
@@ -1,7 +1,7 @@
 import agate
 import pytest
 
-from dbt.task.test import list_rows_from_table
+from dbt.task.test import TestRunner, list_rows_from_table, unit_test_rows_match
 
 
 class TestListRowsFromTable:
@@ -69,3 +69,27 @@ class TestListRowsFromTable:
 
         list_rows = list_rows_from_table(table, sort=True)
         assert list_rows == expected_list_rows
+
+
+class TestUnitTestRowsMatch:
+    @pytest.mark.parametrize(
+        "expected_rows,actual_rows,match",
+        [
+            ([], [], True),
+            ([(1, "a"), (2, None)], [(2, None), (1, "a")], True),  # order doesn't matter
+            ([(1, "a"), (1, "a")], [(1, "a"), (2, "b")], False),
+            ([(1, "a"), (1, "a")], [(1, "a")], False),  # duplicates count
+            ([({"a": 1},)], [({"a": 1},)], False),  # unhashable, needs a diff to tell
+        ],
+    )
+    def test_unit_test_rows_match(self, expected_rows, actual_rows, match):
+        assert unit_test_rows_match(expected_rows, actual_rows) is match
+
+    def test_split_unit_test_rows(self):
+        table = agate.Table(
+            rows=[[1, "actual", "a"], [2, "expected", "b"], [1, "expected", "a"]],
+            column_names=["id", "actual_or_expected", "name"],
+        )
+        actual, expected = TestRunner._split_unit_test_rows(table)
+        assert actual == [(1, "a")]
+        assert expected == [(2, "b"), (1, "a")]
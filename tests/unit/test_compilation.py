@@ -1,14 +1,18 @@
 import os
 import tempfile
+from argparse import Namespace
 from queue import Empty
 from unittest import mock
 
 import pytest
 
-from dbt.compilation import Graph, Linker
+from dbt.compilation import Compiler, Graph, Linker, is_acyclic
+from dbt.contracts.graph.manifest import SelectorIndex
+from dbt.flags import set_from_args
 from dbt.graph.cli import parse_difference
 from dbt.graph.queue import GraphQueue
 from dbt.graph.selector import NodeSelector
+from dbt.node_types import NodeType
 
 
 def _mock_manifest(nodes):
@@ -25,9 +29,16 @@ def _mock_manifest(nodes):
                 is_versioned=False,
             )
             for n in nodes
-        }
+        },
+        sources={},
+        exposures={},
+        metrics={},
+        unit_tests={},
+        semantic_models={},
+        saved_queries={},
     )
     manifest.expect.side_effect = lambda n: mock.MagicMock(unique_id=n)
+    manifest.selector_index = SelectorIndex(manifest)
     return manifest
 
 
@@ -193,3 +204,79 @@ class TestLinker:
             linker.dependency(l, r)
 
         assert linker.find_cycles() is None
+
+    def test_linker_get_graph_summary(self, linker: Linker) -> None:
+        for l, r in [("B", "A"), ("C", "A"), ("C", "B")]:
+            linker.dependency(l, r)
+        manifest = _mock_manifest("ABC")
+        manifest.expect.side_effect = lambda n: mock.MagicMock(resource_type=NodeType.Model)
+
+        assert linker.get_graph_summary(manifest) == {
+            0: {"name": "B", "type": "model", "succ": [2]},
+            1: {"name": "A", "type": "model", "succ": [0, 2]},
+            2: {"name": "C", "type": "model"},
+        }
+
+    def test_linker_get_graph_checksum(self, linker: Linker) -> None:
+        linker.dependency("B", "A")
+        manifest = _mock_manifest("ABC")
+        with mock.patch("dbt.compilation.manifest_checksum", return_value="manifest"):
+            checksum = linker.get_graph_checksum(manifest)
+            assert checksum == linker.get_graph_checksum(manifest)
+
+            linker.dependency("C", "A")
+            assert linker.get_graph_checksum(manifest) != checksum
+            checksum = linker.get_graph_checksum(manifest)
+
+            linker.dependency("C", "B")
+            assert linker.get_graph_checksum(manifest) != checksum
+
+        with mock.patch("dbt.compilation.manifest_checksum", return_value=None):
+            assert linker.get_graph_checksum(manifest) is None
+
+    def test_linker_link_graph(self, linker: Linker) -> None:
+        manifest = _mock_manifest("ABC")
+        manifest.nodes["A"].depends_on_nodes = ["C"]
+        manifest.nodes["B"].depends_on_nodes = ["A", "C"]
+        manifest.nodes["C"].depends_on_nodes = []
+        linker.link_graph(manifest)
+
+        # nodes are in the order they were first linked, as parents or children
+        assert list(linker.nodes()) == ["A", "C", "B"]
+        assert list(linker.edges()) == [("A", "B"), ("C", "A"), ("C", "B")]
+
+        manifest.nodes["C"].depends_on_nodes = ["B"]
+        with pytest.raises(RuntimeError, match="Found a cycle"):
+            Linker().link_graph(manifest)
+
+
+@pytest.mark.parametrize(
+    "edges,expected",
+    [
+        ([], True),
+        ([(0, 1), (1, 2), (0, 2)], True),
+        ([(0, 1), (1, 2), (2, 0)], False),
+        ([(1, 1)], False),
+    ],
+)
+def test_is_acyclic(edges, expected) -> None:
+    assert is_acyclic(3, edges) is expected
+
+
+def test_write_graph_file_skips_unchanged_graph(tmp_path) -> None:
+    set_from_args(Namespace(WRITE_JSON=True), None)
+    compiler = Compiler(mock.MagicMock(project_target_path=str(tmp_path)))
+    linker = Linker()
+    linker.dependency("B", "A")
+    manifest = _mock_manifest("AB")
+
+    with mock.patch(
+        "dbt.compilation.manifest_checksum", return_value="manifest"
+    ), mock.patch.object(linker, "write_graph", wraps=linker.write_graph) as write_graph:
+        compiler.write_graph_file(linker, manifest)
+        compiler.write_graph_file(linker, manifest)
+        assert write_graph.call_count == 1
+
+        linker.dependency("C", "B")
+        compiler.write_graph_file(linker, manifest)
+        assert write_graph.call_count == 2
@@ -323,6 +323,8 @@ sample_values = [
     core_types.DepsAddPackage(package_name="", version="", packages_filepath=""),
     core_types.DepsFoundDuplicatePackage(removed_package={}),
     core_types.DepsScrubbedPackageName(package_name=""),
+    core_types.DepsPackageUnchanged(version_name=""),
+    core_types.DepsLinkFromPackageStore(path=""),
     core_types.DepsUnpinned(revision="", git=""),
     core_types.NoNodesForSelectionCriteria(spec_raw=""),
     # P - Artifacts ======================
@@ -440,6 +442,22 @@ sample_values = [
         total_batches=0,
         execution_time=0,
     ),
+    core_types.ProcessPoolUnsupported(reason=""),
+    core_types.ConcurrencyAdjusted(
+        previous_threads=0,
+        threads=0,
+        reason="",
+        active=0,
+        ready=0,
+        latency=0.0,
+        short_latency=0.0,
+        long_latency=0.0,
+    ),
+    core_types.SchemaCacheUsed(database="", num_schemas=0, age=0.0),
+    core_types.SchemaCacheStale(database="", schema=""),
+    core_types.AdapterCachePopulated(
+        num_schemas=0, num_relations=0, elapsed=0.0, selected_only=False
+    ),
     # W - Node testing ======================
     core_types.CatchableExceptionOnRun(exc=""),
     core_types.InternalErrorOnRun(build_path="", exc=""),
@@ -493,6 +511,7 @@ sample_values = [
     core_types.ArtifactUploadSuccess(),
     core_types.ArtifactUploadError(),
     core_types.ArtifactUploadSkipped(),
+    core_types.LogEventsDropped(count=1),
 ]
 
 
@@ -7,6 +7,7 @@ import pytest
 import dbt.graph.cli as graph_cli
 import dbt.graph.selector as graph_selector
 import dbt_common.exceptions
+from dbt.contracts.graph.manifest import SelectorIndex
 from dbt.node_types import NodeType
 
 
@@ -45,7 +46,17 @@ def _get_manifest(graph):
     nodes["m.X.e"].tags = ["efg", "bcef"]
     nodes["m.Y.f"].tags = ["efg", "bcef"]
     nodes["m.X.g"].tags = ["efg"]
-    return mock.MagicMock(nodes=nodes)
+    manifest = mock.MagicMock(
+        nodes=nodes,
+        sources={},
+        exposures={},
+        metrics={},
+        unit_tests={},
+        semantic_models={},
+        saved_queries={},
+    )
+    manifest.selector_index = SelectorIndex(manifest)
+    return manifest
 
 
 @pytest.fixture
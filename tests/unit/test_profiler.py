@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+
+from dbt import profiler
+from dbt.profiler import (
+    NodeSampler,
+    node_phase,
+    parse_file_timing,
+    parse_macro_timing,
+    parse_step_timing,
+    parse_timer,
+    record_static_parser_result,
+    sampling_profiler,
+)
+from dbt_common.clients.jinja import BaseMacroGenerator
+
+
+class SlowMaterialization(BaseMacroGenerator):
+    def get_name(self):
+        return "materialization_table_default"
+
+    def get_macro(self):
+        return lambda: time.sleep(0.2)
+
+
+def run_node():
+    with node_phase("model.test.slow", "compile"):
+        time.sleep(0.1)
+    with node_phase("model.test.slow", "execute"):
+        SlowMaterialization(context={}).call_macro()
+
+
+def test_node_phase_is_noop_without_sampler():
+    assert profiler._active_sampler is None
+    with node_phase("model.test.slow", "compile"):
+        pass
+
+
+def test_sampling_profiler(tmp_path):
+    outfile = tmp_path / "dbt.folded"
+    (tmp_path / "perf_info.json").write_text(json.dumps({"load_all_elapsed": 1.0}))
+
+    with sampling_profiler(str(outfile), lambda: str(tmp_path)) as sampler:
+        assert isinstance(sampler, NodeSampler)
+        worker = threading.Thread(target=run_node, name="Thread-1 (worker)")
+        worker.start()
+        worker.join()
+    assert profiler._active_sampler is None
+
+    stacks = [line.rsplit(" ", 1) for line in outfile.read_text().splitlines()]
+    assert all(count.isdigit() for _, count in stacks)
+    assert any(
+        stack.startswith("Thread-1 (worker);model.test.slow;compile;") for stack, _ in stacks
+    )
+    assert any(
+        stack.startswith("Thread-1 (worker);model.test.slow;materialization;")
+        for stack, _ in stacks
+    )
+
+    perf_info = json.loads((tmp_path / "perf_info.json").read_text())
+    # existing parse timings are kept
+    assert perf_info["load_all_elapsed"] == 1.0
+    summary = perf_info["node_timing_info"]
+    assert summary["samples"] > 0
+    (node,) = summary["slowest_nodes"]
+    assert node["unique_id"] == "model.test.slow"
+    assert set(node["phases"]) == {"compile", "materialization"}
+    assert node["phases"]["materialization"] > node["phases"]["compile"] > 0
+    assert summary["slowest_macros"][0]["name"] == "materialization_table_default"
+
+
+def test_parse_timer():
+    with parse_timer(enable=False) as timer:
+        assert timer is None
+        with parse_file_timing("model.sql", "ModelParser"), parse_macro_timing("macro.a"):
+            pass
+
+    with parse_timer(enable=True) as timer:
+        with parse_step_timing("yaml_load", "schema.yml"):
+            pass
+        with parse_file_timing("model.sql", "ModelParser"):
+            with parse_step_timing("static_parse"):
+                pass
+            record_static_parser_result("fallback")
+            with parse_step_timing("render"):
+                with parse_macro_timing("macro.outer"):
+                    with parse_macro_timing("macro.inner"):
+                        time.sleep(0.05)
+    assert profiler._active_parse_timer is None
+
+    report = timer.report()
+    assert report["file_count"] == 2
+    assert report["static_parser"] == {"fallback": 1}
+    model, schema = report["slowest_files"]
+    assert model["file_id"] == "model.sql"
+    assert model["parser"] == "ModelParser"
+    assert model["static_parser"] == "fallback"
+    assert set(model["steps"]) == {"static_parse", "render"}
+    assert model["elapsed"] >= model["steps"]["render"] >= 0.05
+    assert schema["file_id"] == "schema.yml"
+    assert set(schema["steps"]) == {"yaml_load"}
+    assert "parser" not in schema
+
+    inner, outer = report["slowest_macros"]
+    assert inner["unique_id"] == "macro.inner"
+    assert outer["unique_id"] == "macro.outer"
+    assert outer["calls"] == inner["calls"] == 1
+    # time in callees only counts towards the caller's inclusive time
+    assert outer["elapsed"] >= inner["elapsed"] >= 0.05
+    assert outer["self_elapsed"] < 0.05
@@ -617,6 +617,7 @@ def table_model(ephemeral_model) -> ModelNode:
                 "truthy_bool_property": True,
                 "falsy_bool_property": False,
                 "list_property": ["some_value", True, False],
+                "int_property": 1,
             },
         },
         refs=[ephemeral_model],